@@ -1,65 +1,63 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
-from PIL import ImageTk, Image
-
-def interpolate_color(c1, c2, t):
-    """Interpolate between two hex colors c1 and c2 by fraction t (0 to 1)."""
-    c1 = c1.lstrip("#")
-    c2 = c2.lstrip("#")
-    r1, g1, b1 = int(c1[0:2], 16), int(c1[2:4], 16), int(c1[4:6], 16)
-    r2, g2, b2 = int(c2[0:2], 16), int(c2[2:4], 16), int(c2[4:6], 16)
-    r = int(r1 + (r2 - r1) * t)
-    g = int(g1 + (g2 - g1) * t)
-    b = int(b1 + (b2 - b1) * t)
-    return f"#{r:02x}{g:02x}{b:02x}"
-
-class WelcomePage(tk.Frame):
+import os
+import queue
+import time
+
+from startup_profile import PROFILER
+
+PROFILER.configure()
+
+with PROFILER.span("import tkinter"):
+    import tkinter as tk
+    from tkinter import ttk, messagebox
+with PROFILER.span("import PIL"):
+    from PIL import ImageTk
+
+with PROFILER.span("import app modules"):
+    import scenery
+    from animation import AUTO_QUALITY, QUALITY_NAMES, QUALITY_SETTING, Animator, linear
+    from autocomplete import NameIndex, SuggestionBox
+    from assets import AssetLoader
+    from backend import open_storage
+    from broadcast import ScoreBroadcaster, configured_address, match_fields
+    from carousel import MemberCarousel
+    from event_log import ScoreEventLog
+    from hotkeys import keysym_table, load_hotkeys, normalize_keysym
+    from leaderboard import LeaderboardPage
+    from match import Match
+    from match_clock import DEFAULT_MATCH_DURATION, MATCH_DURATIONS, format_duration
+    from ratings import RatingEngine
+    from replay import ReplayPage
+    from themes import DEFAULT_THEME, PALETTES, ThemeRegistry
+    from tournament import TournamentPage
+
+# How often a pending save is checked, and how long its toast stays up.
+SAVE_POLL_SECONDS = 0.1
+TOAST_SECONDS = 2.5
+TOAST_ERROR_SECONDS = 6.0
+
+
+class WelcomePage(ttk.Frame):
     def __init__(self, master, controller):
         super().__init__(master)
         self.controller = controller
         self.width, self.height = 1280, 720
-
-        self.themes = {
-            "dark": {
-                "bg": "#0f1626",
-                "fg": "#00ffcc",
-                "btn_bg": "#00ffcc",
-                "btn_fg": "#0f1626",
-                "canvas_bg": "#0f1626",
-                "desc_fg": "#00ffcc",
-                "credit_fg": "#00ffcc",
-                "member_bg": "#004f4f",
-                "member_fg": "#40e0d0",
-                "member_desc_fg": "#a0f0f0",
-                "scrollbar_trough": "#00ffcc",
-                "scrollbar_active_bg": "#00cca3",
-            },
-            "light": {
-                "bg": "#ffffff",
-                "fg": "#2563eb",
-                "btn_bg": "#2563eb",
-                "btn_fg": "#ffffff",
-                "canvas_bg": "#ffffff",
-                "desc_fg": "#6b7280",
-                "credit_fg": "#2563eb",
-                "member_bg": "#e0e7ff",
-                "member_fg": "#1e3a8a",
-                "member_desc_fg": "#4b5563",
-                "scrollbar_trough": "#2563eb",
-                "scrollbar_active_bg": "#1e40af",
-            },
+        self.background_photos = {}
+        self.scene_drawn = False
+        self.scene_visible = False
+        scene_colors = {
+            name: scenery.scene_palette(name, self.width, self.height, palette["bg"])
+            for name, palette in PALETTES.items()
         }
-        self.current_theme = "dark"
-
-        self.config(bg=self.themes[self.current_theme]["bg"])
+        controller.theme.add_colors(scene_colors)
+        # (tag, outline key) per color group; the tags double as palette keys.
+        groups = scene_colors[DEFAULT_THEME]
+        self.scene_groups = [
+            (key, key + "_outline" if key + "_outline" in groups else None)
+            for key in groups
+            if not key.endswith("_outline")
+        ]
 
-        self.canvas = tk.Canvas(
-            self,
-            width=self.width,
-            height=self.height,
-            highlightthickness=0,
-            bg=self.themes[self.current_theme]["canvas_bg"],
-        )
+        self.canvas = tk.Canvas(self, width=self.width, height=self.height, highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
 
         self.draw_background()
@@ -71,173 +69,125 @@ class WelcomePage(tk.Frame):
         self.create_credit_info()
         self.create_settings_button()
         self.create_theme_toggle_button()
+        controller.theme.add_listener(self._on_theme_colors)
 
-    def apply_theme(self):
-        theme = self.themes[self.current_theme]
-        self.config(bg=theme["bg"])
-        self.canvas.config(bg=theme["canvas_bg"])
-        self.canvas.delete("all")
-        self.draw_background()
-        self.create_title()
-        self.create_description()
-
-        self.start_button.config(
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["scrollbar_active_bg"],
-            activeforeground="white",
-        )
-        self.feedback_label.config(fg=theme["fg"], bg=theme["bg"])
-        self.label_credit.config(fg=theme["credit_fg"], bg=theme["bg"])
-
-        self.info_button.config(
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["scrollbar_active_bg"],
-        )
-        self.settings_button.config(
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["scrollbar_active_bg"],
-        )
-        self.theme_toggle_button.config(
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["scrollbar_active_bg"],
-        )
-        self.label_desc.config(fg=theme["desc_fg"], bg=theme["bg"])
-        self.label_image.config(bg=theme["bg"])
-
-    def fade_colors(self, start_colors, end_colors, steps=10, delay=50, step=0):
-        """Animate color transitions for bg and fg of various widgets."""
-        if step > steps:
-            return
+    @property
+    def current_theme(self):
+        return self.controller.theme.name
 
-        t = step / steps
-        new_bg = interpolate_color(start_colors["bg"], end_colors["bg"], t)
-        new_fg = interpolate_color(start_colors["fg"], end_colors["fg"], t)
-        new_btn_bg = interpolate_color(start_colors["btn_bg"], end_colors["btn_bg"], t)
-        new_btn_fg = interpolate_color(start_colors["btn_fg"], end_colors["btn_fg"], t)
-
-        self.config(bg=new_bg)
-        self.canvas.config(bg=new_btn_bg)
-        self.start_button.config(bg=new_btn_bg, fg=new_btn_fg)
-        self.feedback_label.config(bg=new_bg, fg=new_fg)
-        self.label_credit.config(bg=new_bg, fg=new_fg)
-        self.info_button.config(bg=new_btn_bg, fg=new_btn_fg)
-        self.settings_button.config(bg=new_btn_bg, fg=new_btn_fg)
-        self.theme_toggle_button.config(bg=new_btn_bg, fg=new_btn_fg)
-        self.label_desc.config(bg=new_bg, fg=new_fg)
-        self.label_image.config(bg=new_bg)
-
-        self.after(delay, lambda: self.fade_colors(start_colors, end_colors, steps, delay, step + 1))
+    def apply_theme(self):
+        self.controller.theme.apply(self.current_theme)
+
+    def _on_theme_colors(self, palette, final):
+        """Recolor the canvas items ttk styles do not cover.
+
+        During a fade the vector scene is shown and recolored in place, one
+        itemconfigure per tag group, unless the animation quality has dropped
+        scenery detail; when it ends the pre-rendered image of the new theme
+        takes over again.
+        """
+        self.canvas.config(bg=palette["bg"])
+        self.canvas.itemconfigure("title_outline", fill=palette["title_outline"])
+        self.canvas.itemconfigure("title_fill", fill=palette["fg"])
+        if final:
+            self.draw_background()
+        elif self.controller.animator.detail:
+            self.recolor_scenery(palette)
 
     def toggle_theme(self):
-        start_colors = self.themes[self.current_theme]
-        self.current_theme = "light" if self.current_theme == "dark" else "dark"
-        end_colors = self.themes[self.current_theme]
-        self.fade_colors(start_colors, end_colors)
+        self.controller.theme.toggle()
 
     def draw_background(self):
-        if self.current_theme == "light":
-            self.canvas.create_rectangle(
-                0, 0, self.width, self.height, fill=self.themes["light"]["canvas_bg"], outline=""
-            )
+        """Show the static scene as a single pre-rendered image item."""
+        with PROFILER.span(f"draw_background:{self.current_theme}"):
+            self._draw_background()
+
+    def _draw_background(self):
+        photo = self.background_photos.get(self.current_theme)
+        if photo is None:
+            fill = PALETTES[self.current_theme]["bg"]
+            image = scenery.BACKGROUNDS.get(self.current_theme, self.width, self.height, fill)
+            photo = ImageTk.PhotoImage(image)
+            self.background_photos[self.current_theme] = photo
+        if self.canvas.find_withtag("background"):
+            self.canvas.itemconfigure("background", image=photo, state="normal")
         else:
-            self.draw_sky_gradient()
-            self.draw_sun(1150, 120, 70)
-            self.draw_clouds()
-            self.draw_grass(0, self.height - 60, self.width, 60)
-            self.draw_trees()
+            self.canvas.create_image(0, 0, image=photo, anchor="nw", tags="background")
+            self.canvas.tag_lower("background")
+        if self.scene_visible:
+            self.canvas.itemconfigure("scene", state="hidden")
+            self.scene_visible = False
+
+    def recolor_scenery(self, palette):
+        """Show the vector scene in the colors of palette, drawing it on first use."""
+        if not self.scene_drawn:
+            self.draw_scenery()
+        for tag, outline_key in self.scene_groups:
+            if outline_key is None:
+                self.canvas.itemconfigure(tag, fill=palette[tag])
+            else:
+                self.canvas.itemconfigure(tag, fill=palette[tag], outline=palette[outline_key])
+        if not self.scene_visible:
+            self.canvas.itemconfigure("scene", state="normal")
+            self.canvas.itemconfigure("background", state="hidden")
+            self.scene_visible = True
+
+    def draw_scenery(self):
+        """Create the scene as canvas items, once, tagged by color group and hidden."""
+        self.scene_drawn = True
+        sun = scenery.SCENE["sun"]
+        self.draw_sky_gradient()
+        self.draw_sun(sun["x"], sun["y"], sun["radius"])
+        self.draw_clouds()
+        self.draw_grass(0, self.height - scenery.SCENE["grass"]["height"], self.width, scenery.SCENE["grass"]["height"])
+        self.draw_trees()
+        self.canvas.itemconfigure("scene", state="hidden")
+        if self.canvas.find_withtag("background"):
+            self.canvas.tag_raise("scene", "background")
+        else:
+            self.canvas.tag_lower("scene")
 
-    def draw_sky_gradient(self):
-        if self.current_theme == "light":
-            return
+    def _scene_colors(self, key):
+        colors = self.controller.theme.palette
+        return {"fill": colors[key], "outline": colors.get(key + "_outline", ""), "tags": ("scene", key)}
 
-        from_colors = [(10, 25, 70), (25, 76, 146), (82, 137, 217), (176, 214, 235)]
-        steps = 150
-
-        for i in range(steps):
-            section_index = int(i / (steps / (len(from_colors) - 1)))
-            if section_index >= len(from_colors) - 1:
-                section_index = len(from_colors) - 2
-            color1 = from_colors[section_index]
-            color2 = from_colors[section_index + 1]
-            ratio = (i % (steps / (len(from_colors) - 1))) / (steps / (len(from_colors) - 1))
-            r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-            g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-            b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            y1 = int(i * self.height / steps)
-            y2 = int((i + 1) * self.height / steps)
-            self.canvas.create_rectangle(0, y1, self.width, y2, fill=color, outline="")
+    def draw_sky_gradient(self):
+        for i, (y1, y2, _) in enumerate(scenery.sky_gradient(self.width, self.height)):
+            self.canvas.create_rectangle(0, y1, self.width, y2, **self._scene_colors(f"scene_sky_{i}"))
 
     def draw_sun(self, x, y, radius):
-        if self.current_theme == "light":
-            self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius, fill="#FFEA00", outline="")
-            return
-
-        colors = ["#FFFACD", "#FFF68F", "#FFEF6E", "#FFD700"]
-        for i, color in enumerate(colors[::-1]):
-            r = radius + i * 12
-            self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=color, outline="")
-        self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius, fill="#FFEA00", outline="")
+        for i, (box, _) in enumerate(scenery.sun_rings(x, y, radius)):
+            self.canvas.create_oval(*box, **self._scene_colors(f"scene_sun_{i}"))
 
     def draw_clouds(self):
-        if self.current_theme == "light":
-            return
-
-        cloud_positions = [(200, 120, 120), (600, 90, 150), (900, 150, 100), (1100, 130, 130)]
-        for x, y, size in cloud_positions:
+        for x, y, size in scenery.SCENE["clouds"]["positions"]:
             self.draw_cloud(x, y, size)
 
     def draw_cloud(self, x, y, size):
-        if self.current_theme == "light":
-            return
-
-        radius = size // 4
-        circles = [
-            (x, y),
-            (x + radius * 1.2, y - radius // 2),
-            (x + radius * 2.5, y - radius // 4),
-            (x + radius * 3.7, y),
-            (x + radius * 4.5, y - radius // 3),
-        ]
-        for cx, cy in circles:
-            self.canvas.create_oval(cx - radius, cy - radius, cx + radius, cy + radius, fill="white", outline="")
+        for box in scenery.cloud_circles(x, y, size):
+            self.canvas.create_oval(*box, **self._scene_colors("scene_cloud"))
 
     def draw_grass(self, x_start, y_start, width_area, height_area):
-        if self.current_theme == "light":
-            return
-
-        for i in range(0, width_area, 15):
-            x = x_start + i
-            points = [x, y_start, x + 7, y_start - 30, x + 14, y_start]
-            self.canvas.create_polygon(points, fill="#228B22", outline="#176917")
+        for points in scenery.grass_blades(x_start, y_start, width_area):
+            self.canvas.create_polygon(points, **self._scene_colors("scene_grass"))
 
     def draw_trees(self):
-        if self.current_theme == "light":
-            return
-        self.draw_tree(80, self.height - 180)
-        self.draw_tree_right(self.width - 200, self.height - 180)
-
-    def draw_tree(self, x, y):
-        if self.current_theme == "light":
-            return
-
-        self.canvas.create_rectangle(x + 10, y, x + 30, y + 100, fill="#5D3A00", outline="#3E2700")
-        self.canvas.create_oval(x - 50, y - 120, x + 70, y + 20, fill="#065214", outline="#033d0a")
-        self.canvas.create_oval(x - 40, y - 150, x + 60, y - 40, fill="#0A7B1E", outline="#05460d")
-        self.canvas.create_oval(x - 20, y - 180, x + 40, y - 80, fill="#0B9D2D", outline="#057318")
+        for x, y, crowns in scenery.tree_positions(self.width, self.height):
+            self.draw_tree(x, y, crowns)
+
+    def draw_tree(self, x, y, crowns=None):
+        if crowns is None:
+            crowns = scenery.SCENE["trees"]["left_crowns"]
+        # Both trees share their colors level by level, so they share the tag groups too.
+        for level, (kind, box, _, _) in enumerate(scenery.tree_parts(x, y, crowns)):
+            colors = self._scene_colors("scene_trunk" if level == 0 else f"scene_crown_{level - 1}")
+            if kind == "rectangle":
+                self.canvas.create_rectangle(*box, **colors)
+            else:
+                self.canvas.create_oval(*box, **colors)
 
     def draw_tree_right(self, x, y):
-        if self.current_theme == "light":
-            return
-
-        self.canvas.create_rectangle(x + 10, y, x + 30, y + 100, fill="#5D3A00", outline="#3E2700")
-        self.canvas.create_oval(x - 30, y - 120, x + 90, y + 20, fill="#065214", outline="#033d0a")
-        self.canvas.create_oval(x - 20, y - 150, x + 80, y - 40, fill="#0A7B1E", outline="#05460d")
-        self.canvas.create_oval(x, y - 180, x + 60, y - 80, fill="#0B9D2D", outline="#057318")
+        self.draw_tree(x, y, scenery.SCENE["trees"]["right_crowns"])
 
     def create_title(self):
         self.canvas.delete("title_texts")
@@ -245,214 +195,136 @@ class WelcomePage(tk.Frame):
         y = 180
         text = "WELCOME TO THE TRAINING GROUNDS"
         size = 48
-        if self.current_theme == "light":
-            fg_color = "#2563eb"
-            outline_color = "#a3bffa"
-        else:
-            fg_color = "#00ffcc"
-            outline_color = "#003333"
+        theme = self.controller.theme
 
         offsets = [(-2, 0), (2, 0), (0, -2), (0, 2)]
         for ox, oy in offsets:
             self.canvas.create_text(
-                x + ox, y + oy, text=text, font=("Poppins", size, "bold"), fill=outline_color, tags="title_texts"
+                x + ox, y + oy, text=text, font=("Poppins", size, "bold"), fill=theme["title_outline"],
+                tags=("title_texts", "title_outline"),
             )
-        self.canvas.create_text(x, y, text=text, font=("Poppins", size, "bold"), fill=fg_color, tags="title_texts")
+        self.canvas.create_text(
+            x, y, text=text, font=("Poppins", size, "bold"), fill=theme["fg"], tags=("title_texts", "title_fill")
+        )
 
     def create_description(self):
         desc_text = "Get ready to embark on an epic journey!\nPress START to begin your adventure."
-        if hasattr(self, "label_desc"):
-            self.label_desc.destroy()
-        theme = self.themes[self.current_theme]
-        self.label_desc = tk.Label(
-            self,
-            text=desc_text,
-            font=("Segoe UI", 24, "bold italic"),
-            fg=theme["desc_fg"],
-            bg=theme["bg"],
-            justify="center",
-            wraplength=700,
-        )
+        self.label_desc = ttk.Label(self, text=desc_text, style="Desc.TLabel", justify="center", wraplength=700)
         self.label_desc.place(relx=0.5, rely=0.37, anchor="center")
 
     def create_start_button(self):
-        theme = self.themes[self.current_theme]
-        self.start_button = tk.Button(
+        self.start_button = ttk.Button(
             self,
             text="START YOUR JOURNEY",
-            font=("Poppins", 24, "bold"),
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["scrollbar_active_bg"],
-            activeforeground="white",
-            bd=0,
-            padx=70,
-            pady=18,
+            style="Start.TButton",
             cursor="hand2",
             command=self.bangkit_with_animation,
-            relief="ridge",
-            borderwidth=2,
         )
         self.start_button.place(relx=0.5, rely=0.5, anchor="center")
-        self._add_button_hover(self.start_button)
 
     def create_feedback_label(self):
-        theme = self.themes[self.current_theme]
-        self.feedback_label = tk.Label(
-            self, text="", font=("Poppins", 18, "italic"), fg=theme["fg"], bg=theme["bg"]
-        )
+        self.feedback_label = ttk.Label(self, text="", style="Feedback.TLabel")
         self.feedback_label.place(relx=0.5, rely=0.60, anchor="center")
 
     def create_image_label(self):
-        self.image1 = ImageTk.PhotoImage(Image.open("pendekar_diam.png").resize((320, 320)))
-        self.image2 = ImageTk.PhotoImage(Image.open("pendekar_bangkit.png").resize((320, 320)))
-        theme = self.themes[self.current_theme]
-        self.label_image = tk.Label(self, image=self.image1, bg=theme["bg"], bd=0)
+        # A blank image of the final size holds the layout until the sprites are decoded.
+        self.image_placeholder = tk.PhotoImage(width=320, height=320)
+        self.image1 = None
+        self.image2 = None
+        self.risen = False
+        self.label_image = ttk.Label(self, image=self.image_placeholder, style="Image.TLabel")
         self.label_image.place(relx=0.5, rely=0.77, anchor="center")
 
+        assets = self.controller.assets
+        assets.request("pendekar_diam.png", (320, 320), self._on_idle_image_loaded)
+        assets.request("pendekar_bangkit.png", (320, 320), self._on_risen_image_loaded)
+
+    def _on_idle_image_loaded(self, photo):
+        self.image1 = photo
+        if not self.risen:
+            self.label_image.config(image=photo)
+
+    def _on_risen_image_loaded(self, photo):
+        self.image2 = photo
+        if self.risen:
+            self.label_image.config(image=photo)
+
     def create_credit_info(self):
-        theme = self.themes[self.current_theme]
-        self.label_credit = tk.Label(
-            self,
-            text="© 2025 SDA Project - Universitas Lampung",
-            font=("Poppins", 12, "bold"),
-            fg=theme["credit_fg"],
-            bg=theme["bg"],
-        )
+        self.label_credit = ttk.Label(self, text="© 2025 SDA Project - Universitas Lampung", style="Credit.TLabel")
         self.label_credit.place(relx=0.0, rely=0.0, anchor="nw", x=10, y=10)
 
-        self.info_button = tk.Button(
-            self,
-            text="Info",
-            font=("Poppins", 12, "bold"),
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["scrollbar_active_bg"],
-            bd=0,
-            padx=25,
-            pady=6,
-            cursor="hand2",
-            command=self.show_info,
-            relief="ridge",
-            borderwidth=1,
-        )
+        self.info_button = ttk.Button(self, text="Info", cursor="hand2", command=self.show_info)
         self.info_button.place(relx=0.0, rely=0.0, anchor="nw", x=10, y=40)
-        self._add_button_hover(self.info_button)
 
     def create_settings_button(self):
-        theme = self.themes[self.current_theme]
-        self.settings_button = tk.Button(
-            self,
-            text="Settings",
-            font=("Poppins", 12, "bold"),
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["scrollbar_active_bg"],
-            bd=0,
-            padx=25,
-            pady=6,
-            cursor="hand2",
-            command=self.open_settings,
-            relief="ridge",
-            borderwidth=1,
-        )
+        self.settings_button = ttk.Button(self, text="Settings", cursor="hand2", command=self.open_settings)
         self.settings_button.place(relx=0.0, rely=0.0, anchor="nw", x=10, y=75)
-        self._add_button_hover(self.settings_button)
 
     def create_theme_toggle_button(self):
-        theme = self.themes[self.current_theme]
-        self.theme_toggle_button = tk.Button(
-            self,
-            text="Toggle Theme",
-            font=("Poppins", 12, "bold"),
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["scrollbar_active_bg"],
-            bd=0,
-            padx=25,
-            pady=6,
-            cursor="hand2",
-            command=self.toggle_theme,
-            relief="ridge",
-            borderwidth=1,
-        )
+        self.theme_toggle_button = ttk.Button(self, text="Toggle Theme", cursor="hand2", command=self.toggle_theme)
         self.theme_toggle_button.place(relx=0.0, rely=0.0, anchor="nw", x=10, y=110)
-        self._add_button_hover(self.theme_toggle_button)
-
-    def _add_button_hover(self, button):
-        def on_enter(e):
-            button.config(bg=button.cget("activebackground"))
-
-        def on_leave(e):
-            button.config(bg=self.themes[self.current_theme]["btn_bg"])
-
-        button.bind("<Enter>", on_enter)
-        button.bind("<Leave>", on_leave)
 
     def open_settings(self):
+        # The window background comes from the option database the theme registry fills.
         settings_window = tk.Toplevel(self)
         settings_window.title("Settings")
-        settings_window.geometry("400x300")
+        settings_window.geometry("400x380")
         settings_window.resizable(False, False)
 
-        theme = self.themes[self.current_theme]
-        settings_window.configure(bg=theme["bg"])
-
-        label = tk.Label(settings_window, text="Settings", font=("Poppins", 24, "bold"), fg=theme["fg"], bg=theme["bg"])
+        label = ttk.Label(settings_window, text="Settings", style="Heading.TLabel")
         label.pack(pady=20)
 
         self.data_privacy_var = tk.BooleanVar()
-        privacy_checkbox = tk.Checkbutton(
-            settings_window,
-            text="I agree to the data privacy policy",
-            variable=self.data_privacy_var,
-            font=("Poppins", 12),
-            fg=theme["fg"],
-            bg=theme["bg"],
-            selectcolor=theme["bg"],
-            activebackground=theme["bg"],
-            activeforeground=theme["fg"],
+        privacy_checkbox = ttk.Checkbutton(
+            settings_window, text="I agree to the data privacy policy", variable=self.data_privacy_var
         )
         privacy_checkbox.pack(pady=15)
 
-        save_button = tk.Button(
+        animator = self.controller.animator
+        quality_frame = ttk.Frame(settings_window)
+        quality_frame.pack(pady=5)
+        ttk.Label(quality_frame, text="Animation quality:").pack(side="left", padx=5)
+        self.quality_var = tk.StringVar(value=animator.quality_mode)
+        quality_box = ttk.Combobox(
+            quality_frame, textvariable=self.quality_var, values=(AUTO_QUALITY, *QUALITY_NAMES),
+            state="readonly", width=8,
+        )
+        quality_box.pack(side="left", padx=5)
+        quality_box.bind("<<ComboboxSelected>>", lambda e: animator.set_quality(self.quality_var.get()))
+        quality_label = ttk.Label(settings_window)
+        quality_label.pack()
+
+        def show_quality(level):
+            quality_label.config(text=f"Running at: {level}, {round(1 / animator.frame_interval)} fps")
+
+        show_quality(animator.quality)
+        animator.quality_listeners.append(show_quality)
+        quality_label.bind("<Destroy>", lambda e: animator.quality_listeners.remove(show_quality))
+
+        save_button = ttk.Button(
             settings_window,
             text="Save Settings",
-            font=("Poppins", 14, "bold"),
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["scrollbar_active_bg"],
-            bd=0,
-            padx=30,
-            pady=10,
+            style="Settings.TButton",
             cursor="hand2",
             command=lambda: self.save_settings(settings_window),
-            relief="ridge",
-            borderwidth=2,
         )
         save_button.pack(pady=20)
-        self._add_button_hover(save_button)
 
-        close_button = tk.Button(
-            settings_window,
-            text="Close",
-            font=("Poppins", 12),
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["scrollbar_active_bg"],
-            bd=0,
-            padx=20,
-            pady=6,
-            cursor="hand2",
-            command=settings_window.destroy,
-            relief="ridge",
-            borderwidth=1,
+        close_button = ttk.Button(
+            settings_window, text="Close", style="Close.TButton", cursor="hand2", command=settings_window.destroy
         )
         close_button.pack(pady=10)
-        self._add_button_hover(close_button)
 
     def save_settings(self, window):
         if self.data_privacy_var.get():
+            storage = self.controller.storage
+            try:
+                settings = storage.load_settings()
+                settings[QUALITY_SETTING] = self.quality_var.get()
+                storage.save_settings(settings)
+            except OSError as exc:
+                messagebox.showerror("Save Error", f"Settings could not be written:\n{exc}")
+                return
             messagebox.showinfo("Settings Saved", "Your settings have been saved successfully!")
             window.destroy()
         else:
@@ -470,450 +342,586 @@ class WelcomePage(tk.Frame):
         )
 
     def bangkit_with_animation(self):
+        animator = self.controller.animator
+        bounces = animator.steps(4)
+
         def bounce(count=0):
-            size = 26 if count % 2 == 0 else 24
-            self.start_button.config(font=("Poppins", size, "bold"))
-            if count < 4:
-                self.after(120, lambda: bounce(count + 1))
+            style = "Bounce.Start.TButton" if count % 2 == 0 else "Start.TButton"
+            animator.set(self.start_button, style=style)
+            if count < bounces:
+                animator.call_later(0.12, lambda: bounce(count + 1), key=(self, "bounce"))
             else:
                 self.show_feedback()
 
+        # A second click restarts the sequence instead of running two at once.
+        animator.cancel_widget(self.feedback_label, "foreground")
+        animator.cancel((self, "bounce"))
+        animator.cancel((self, "bangkit"))
         bounce()
 
     def show_feedback(self):
-        self.feedback_label.config(text="Starting...")
-        alpha = 1.0
-
-        def fade_out():
-            nonlocal alpha
-            alpha -= 0.1
-            if alpha <= 0:
-                self.feedback_label.config(text="")
-                self.bangkit()
-            else:
-                fg_color = f"#{int(0 * alpha):02x}{int(255 * alpha):02x}{int(204 * alpha):02x}"
-                self.feedback_label.config(fg=fg_color)
-                self.after(100, fade_out)
+        animator = self.controller.animator
+        animator.set(self.feedback_label, text="Starting...", foreground="#00ffcc")
 
-        fade_out()
+        def done():
+            # An empty color hands the label back to its style.
+            animator.set(self.feedback_label, text="", foreground="")
+            self.bangkit()
+
+        animator.tween(self.feedback_label, "foreground", "#000000", 1.0, start="#00ffcc", easing=linear, on_done=done)
 
     def bangkit(self):
-        self.label_image.config(image=self.image2)
-        self.after(1500, lambda: self.controller.show_frame("TeamIntroductionPage"))
+        self.risen = True
+        if self.image2 is not None:
+            self.label_image.config(image=self.image2)
+        self.controller.animator.call_later(
+            1.5, lambda: self.controller.show_frame("TeamIntroductionPage"), key=(self, "bangkit")
+        )
 
 
-class TeamIntroductionPage(tk.Frame):
+class TeamIntroductionPage(ttk.Frame):
     def __init__(self, master, controller):
         super().__init__(master)
         self.controller = controller
 
-        self.themes = {
-            "dark": {
-                "bg": "#0f1626",
-                "fg": "#00ffcc",
-                "member_bg": "#004f4f",
-                "member_fg": "#40e0d0",
-                "member_desc_fg": "#a0f0f0",
-                "btn_fg": "#00ffcc",
-                "btn_bg": "#004f4f", 
-                "scrollbar_active_bg": "#00cca3", 
-            },
-            "light": {
-                "bg": "#ffffff",
-                "fg": "#2563eb",
-                "member_bg": "#e0e7ff",
-                "member_fg": "#1e3a8a",
-                "member_desc_fg": "#4b5563",
-                "btn_fg": "#2563eb", 
-                "btn_bg": "#e0e7ff", 
-                "scrollbar_active_bg": "#1e40af", 
-            },
-        }
-        self.current_theme = "dark"
-        theme = self.themes[self.current_theme]
-        self.config(bg=theme["bg"])
-
-        self.label_title = tk.Label(
-            self,
-            text="Meet Our Team",
-            font=("Poppins", 38, "bold underline"),
-            fg=theme["fg"],
-            bg=theme["bg"],
-            pady=20,
-        )
+        self.label_title = ttk.Label(self, text="Meet Our Team", style="Title.TLabel")
         self.label_title.pack(pady=30)
 
-        team_members = [
-            ("Elsy Aliffia Sirony Putri", "2417051025"),
-            ("Kharisma Jaka Harum", "2417051068"),
-            ("Rheal Iftiqar Rozak", "2417051029"),
-            ("Yulia Nuritnasari", "2457051008"),
-        ]
-
-       
-        self.scroll_canvas = tk.Canvas(self, bg=theme["bg"], highlightthickness=0, height=310)
-        self.scroll_frame = tk.Frame(self.scroll_canvas, bg=theme["bg"])
-        self.h_scrollbar = tk.Scrollbar(
-            self, orient="horizontal", command=self.scroll_canvas.xview, troughcolor=theme["member_fg"],
-            bd=0, highlightthickness=0, activebackground=theme["member_fg"],
-        )
-
-        self.scroll_canvas.configure(xscrollcommand=self.h_scrollbar.set)
-        self.scroll_canvas.pack(fill="x", padx=60)
-        self.h_scrollbar.pack(fill="x", padx=60, pady=(0,20))
-        self.scroll_window = self.scroll_canvas.create_window((0, 0), window=self.scroll_frame, anchor="nw")
-
-        self.member_frames = [] 
-
-        for name, description in team_members:
-            member_frame = tk.Frame(self.scroll_frame, bg=theme["member_bg"], bd=4, relief="ridge", padx=25, pady=18)
-            member_frame.pack(side="left", padx=25, pady=0)
-            self.member_frames.append(member_frame)
-
-            member_label = tk.Label(
-                member_frame,
-                text=name,
-                font=("Poppins", 16, "bold"),
-                fg=theme["member_fg"],
-                bg=theme["member_bg"],
-                wraplength=260,
-                justify="center",
-            )
-            member_label.pack(pady=(0, 10))
-
-            desc_label = tk.Label(
-                member_frame,
-                text=description,
-                font=("Poppins", 13, "italic"),
-                fg=theme["member_desc_fg"],
-                bg=theme["member_bg"],
-                wraplength=260,
-                justify="center",
-            )
-            desc_label.pack()
+        try:
+            team_members = controller.storage.load_team_members()
+        except OSError:
+            team_members = []
 
-        self.scroll_frame.update_idletasks()
-        self.scroll_canvas.config(scrollregion=self.scroll_canvas.bbox("all"))
-        self.scroll_canvas.bind("<Configure>", self._on_canvas_configure)
+        self.carousel = MemberCarousel(self, team_members, controller.theme)
+        self.carousel.pack(fill="x", padx=60)
 
-        self.back_button = tk.Button(
+        self.back_button = ttk.Button(
             self,
             text="Back to Welcome",
-            font=("Poppins", 22, "bold"),
-            fg=theme["bg"],
-            bg=theme["member_fg"],
-            activebackground=theme["member_fg"],
-            activeforeground=theme["bg"],
-            bd=0,
-            padx=40,
-            pady=14,
+            style="Back.TButton",
             cursor="hand2",
             command=lambda: controller.show_frame("WelcomePage"),
-            relief="ridge",
-            borderwidth=3,
         )
         self.back_button.pack(pady=25)
-        self._add_button_hover(self.back_button)
 
-        
         self.create_scoreboard_button()
 
     def create_scoreboard_button(self):
-        theme = self.themes[self.current_theme]
-        self.scoreboard_button = tk.Button(
+        self.scoreboard_button = ttk.Button(
             self,
             text="Go to Scoreboard",
-            font=("Poppins", 12, "bold"),
-            fg=theme["btn_fg"], 
-            bg=theme["btn_bg"], 
-            activebackground=theme["scrollbar_active_bg"], 
-            bd=0,
-            padx=25,
-            pady=6,
+            style="Member.TButton",
             cursor="hand2",
             command=lambda: self.controller.show_frame("ScoreboardApp"),
-            relief="ridge",
-            borderwidth=1,
         )
         self.scoreboard_button.pack(pady=10)
-        self._add_button_hover(self.scoreboard_button)
 
-    def _on_canvas_configure(self, event):
-        
-        self.scroll_canvas.config(scrollregion=self.scroll_canvas.bbox("all"))
-
-    def _add_button_hover(self, button):
-        def on_enter(e):
-            button.config(bg=button.cget("activebackground"))
-
-        def on_leave(e):
-            button.config(bg=self.themes[self.current_theme]["member_fg"])
-
-        button.bind("<Enter>", on_enter)
-        button.bind("<Leave>", on_leave)
-
-class ScoreboardApp(tk.Frame):
+class ScoreboardApp(ttk.Frame):
     def __init__(self, master, controller):
-        super().__init__(master)
+        super().__init__(master, style="Panel.TFrame")
         self.controller = controller
-        self.time_left = 10
-        self.timer_running = False
-        self.ao_score = 0
-        self.aka_score = 0
-
-        self.themes = {
-            "dark": {
-                "bg": "#121212",
-                "fg": "#00ffcc",
-                "ao_bg": "#004080",
-                "aka_bg": "#800000",
-                "timer_bg": "#000000",
-                "timer_fg": "#32cd32",
-                "btn_bg": "#00ffcc",
-                "btn_fg": "#121212",
-                "btn_active_bg": "#00cca3",
-                "font": ("Poppins", 14, "bold"),
-            },
-            "light": {
-                "bg": "#f9f9f9",
-                "fg": "#2563eb",
-                "ao_bg": "#93c5fd",
-                "aka_bg": "#fecaca",
-                "timer_bg": "#ffffff",
-                "timer_fg": "#166534",
-                "btn_bg": "#2563eb",
-                "btn_fg": "#ffffff",
-                "btn_active_bg": "#1e40af",
-                "font": ("Poppins", 14, "bold"),
-            },
-        }
-        self.current_theme = "dark"
-        theme = self.themes[self.current_theme]
-
-        self.config(bg=theme["bg"])
 
-        
-        self.outer_frame = tk.Frame(self, bg=theme["bg"], padx=20, pady=20)
+        self.outer_frame = ttk.Frame(self, style="Panel.TFrame", padding=20)
         self.outer_frame.pack(expand=True, fill="both")
 
-        
-        self.title_label = tk.Label(
-            self.outer_frame, text="Scoreboard", font=("Poppins", 28, "bold"), fg=theme["fg"], bg=theme["bg"]
-        )
+        self.title_label = ttk.Label(self.outer_frame, text="Scoreboard", style="Title.Panel.TLabel")
         self.title_label.grid(row=0, column=0, columnspan=5, pady=(0, 20))
 
-        
-        tk.Label(
-            self.outer_frame, text="Team AO:", font=("Poppins", 16, "bold"), fg=theme["fg"], bg=theme["bg"]
-        ).grid(row=1, column=0, sticky="e", padx=10)
+        ttk.Label(self.outer_frame, text="Team AO:", style="Field.Panel.TLabel").grid(row=1, column=0, sticky="e", padx=10)
         self.ao_name = ttk.Entry(self.outer_frame, font=("Poppins", 14))
         self.ao_name.grid(row=1, column=1, padx=10, sticky="ew")
 
-        tk.Label(
-            self.outer_frame, text="Team AKA:", font=("Poppins", 16, "bold"), fg=theme["fg"], bg=theme["bg"]
-        ).grid(row=1, column=3, sticky="e", padx=10)
+        ttk.Label(self.outer_frame, text="Team AKA:", style="Field.Panel.TLabel").grid(row=1, column=3, sticky="e", padx=10)
         self.aka_name = ttk.Entry(self.outer_frame, font=("Poppins", 14))
         self.aka_name.grid(row=1, column=4, padx=10, sticky="ew")
 
         self.ao_name.insert(0, "Naruto")
         self.aka_name.insert(0, "Sasuke")
+        self.match = Match(self.controller.event_log, self.ao_name.get(), self.aka_name.get())
+        self.clock = self.match.clock
+        self._last_saved = None
 
-        
-        self.ao_frame = tk.Frame(self.outer_frame, bg=theme["ao_bg"], padx=20, pady=15, bd=2, relief="ridge")
+        self.ao_frame = ttk.Frame(self.outer_frame, style="AO.TFrame", padding=(20, 15), borderwidth=2, relief="ridge")
         self.ao_frame.grid(row=2, column=0, columnspan=2, pady=10, sticky="nsew")
 
-        self.aka_frame = tk.Frame(self.outer_frame, bg=theme["aka_bg"], padx=20, pady=15, bd=2, relief="ridge")
+        self.aka_frame = ttk.Frame(self.outer_frame, style="AKA.TFrame", padding=(20, 15), borderwidth=2, relief="ridge")
         self.aka_frame.grid(row=2, column=3, columnspan=2, pady=10, sticky="nsew")
 
-        
         self.outer_frame.grid_columnconfigure(1, weight=1)
         self.outer_frame.grid_columnconfigure(4, weight=1)
         self.outer_frame.grid_rowconfigure(2, weight=1)
 
-        
-        self.ao_score_label = tk.Label(
-            self.ao_frame, text="0", font=("Poppins", 48, "bold"), fg="white", bg=theme["ao_bg"]
-        )
+        self.ao_score_label = ttk.Label(self.ao_frame, text="0", style="Score.AO.TLabel")
         self.ao_score_label.pack(pady=(0, 15), fill="x")
 
-        btn_ao_frame = tk.Frame(self.ao_frame, bg=theme["ao_bg"])
+        btn_ao_frame = ttk.Frame(self.ao_frame, style="AO.TFrame")
         btn_ao_frame.pack()
 
-        self._create_score_button(btn_ao_frame, "+1", self.add_ao, theme).pack(side="left", padx=8)
-        self._create_score_button(btn_ao_frame, "-1", self.sub_ao, theme).pack(side="left", padx=8)
+        self._create_score_button(btn_ao_frame, "+1", self.add_ao).pack(side="left", padx=8)
+        self._create_score_button(btn_ao_frame, "-1", self.sub_ao).pack(side="left", padx=8)
 
-       
-        self.aka_score_label = tk.Label(
-            self.aka_frame, text="0", font=("Poppins", 48, "bold"), fg="white", bg=theme["aka_bg"]
-        )
+        self.aka_score_label = ttk.Label(self.aka_frame, text="0", style="Score.AKA.TLabel")
         self.aka_score_label.pack(pady=(0, 15), fill="x")
 
-        btn_aka_frame = tk.Frame(self.aka_frame, bg=theme["aka_bg"])
+        btn_aka_frame = ttk.Frame(self.aka_frame, style="AKA.TFrame")
         btn_aka_frame.pack()
 
-        self._create_score_button(btn_aka_frame, "+1", self.add_aka, theme).pack(side="left", padx=8)
-        self._create_score_button(btn_aka_frame, "-1", self.sub_aka, theme).pack(side="left", padx=8)
-
-       
-        self.timer_label = tk.Label(
-            self.outer_frame,
-            text="0:10",
-            font=("Poppins", 36, "bold"),
-            bg=theme["timer_bg"],
-            fg=theme["timer_fg"],
-            relief="sunken",
-            bd=4,
-            padx=20,
-            pady=10,
-        )
+        self._create_score_button(btn_aka_frame, "+1", self.add_aka).pack(side="left", padx=8)
+        self._create_score_button(btn_aka_frame, "-1", self.sub_aka).pack(side="left", padx=8)
+
+        self.timer_label = ttk.Label(self.outer_frame, text=self.match.clock.display(), style="Timer.TLabel")
         self.timer_label.grid(row=3, column=0, columnspan=5, pady=20, sticky="ew")
 
-        
-        btn_frame = tk.Frame(self.outer_frame, bg=theme["bg"])
+        btn_frame = ttk.Frame(self.outer_frame, style="Panel.TFrame")
         btn_frame.grid(row=4, column=0, columnspan=5, pady=(0, 10))
 
-        self._create_action_button(btn_frame, "Start", self.start_timer, theme).pack(side="left", padx=10)
-        self._create_action_button(btn_frame, "Stop", self.stop_timer, theme).pack(side="left", padx=10)
-        self._create_action_button(btn_frame, "Reset", self.reset_timer, theme).pack(side="left", padx=10)
-        self._create_action_button(btn_frame, "Save Score", self.save_score_to_csv, theme).pack(side="left", padx=10)
+        self.duration_var = tk.StringVar(value=format_duration(DEFAULT_MATCH_DURATION))
+        self.duration_box = ttk.Combobox(
+            btn_frame,
+            textvariable=self.duration_var,
+            values=[format_duration(seconds) for seconds in MATCH_DURATIONS],
+            state="readonly",
+            width=6,
+            font=("Poppins", 14, "bold"),
+        )
+        self.duration_box.pack(side="left", padx=10)
+        self.duration_box.bind("<<ComboboxSelected>>", self._on_duration_selected)
 
+        self._create_action_button(btn_frame, "Start", self.start_timer).pack(side="left", padx=10)
+        self._create_action_button(btn_frame, "Stop", self.stop_timer).pack(side="left", padx=10)
+        self._create_action_button(btn_frame, "Reset", self.reset_timer).pack(side="left", padx=10)
+        self._create_action_button(btn_frame, "Save Score", self.save_score_to_csv).pack(side="left", padx=10)
+        self._create_action_button(btn_frame, "Finish", self.finish_match).pack(side="left", padx=10)
+        self.bind("<<MatchEnded>>", lambda e: self.finish_match())
 
-        
-        nav_frame = tk.Frame(self.outer_frame, bg=theme["bg"])
+        nav_frame = ttk.Frame(self.outer_frame, style="Panel.TFrame")
         nav_frame.grid(row=5, column=0, columnspan=5, pady=10)
 
-        self._create_action_button(nav_frame, "Back", lambda: self.controller.show_frame("WelcomePage"), theme).pack(
+        self._create_action_button(nav_frame, "Back", lambda: self.controller.show_frame("WelcomePage")).pack(
             side="left", padx=10
         )
-        self._create_action_button(nav_frame, "Quit", self.controller.quit, theme).pack(side="left", padx=10)
-
-    def _create_score_button(self, parent, text, command, theme):
-        btn = tk.Button(
-            parent,
-            text=text,
-            font=theme["font"],
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["btn_active_bg"],
-            activeforeground=theme["btn_fg"],
-            padx=30,
-            pady=10,
-            bd=0,
-            cursor="hand2",
-            command=command,
-            relief="raised",
-            borderwidth=2,
+        self._create_action_button(
+            nav_frame, "Multi-Mat", lambda: self.controller.show_frame("TournamentPage")
+        ).pack(side="left", padx=10)
+        self._create_action_button(
+            nav_frame, "Standings", lambda: self.controller.show_frame("LeaderboardPage")
+        ).pack(side="left", padx=10)
+        self._create_action_button(nav_frame, "Replay", self.show_replay).pack(side="left", padx=10)
+        self._create_action_button(nav_frame, "Quit", self.controller.close).pack(side="left", padx=10)
+
+        self.live_label = ttk.Label(self.outer_frame, text="", style="Status.Panel.TLabel")
+        self.live_label.grid(row=6, column=0, columnspan=5)
+        if self.controller.broadcaster is not None:
+            self.show_display_clients(self.controller.display_clients)
+
+        self.ao_name.bind("<KeyRelease>", lambda e: self.publish())
+        self.aka_name.bind("<KeyRelease>", lambda e: self.publish())
+        names = controller.get_name_index()
+        self.suggestions = [
+            SuggestionBox(entry, names, controller.animator, on_pick=self.publish)
+            for entry in (self.ao_name, self.aka_name)
+        ]
+        self.publish()
+
+    def show_replay(self):
+        self._sync_names()
+        self.controller.show_replay(self.match.timeline, f"{self.match.ao_name} vs {self.match.aka_name}")
+
+    def show_display_clients(self, count):
+        self.live_label.config(text=f"Live: {count} display{'s' if count != 1 else ''} connected")
+
+    def publish(self):
+        """Push the current names, scores and clock to live display clients."""
+        self._sync_names()
+        self.controller.publish(**match_fields(self.match))
+
+    def _create_score_button(self, parent, text, command):
+        return ttk.Button(
+            parent, text=text, style="Score.Panel.TButton", cursor="hand2", command=command, takefocus=False
         )
-        self._add_button_hover(btn)
-        return btn
-
-    def _create_action_button(self, parent, text, command, theme):
-        btn = tk.Button(
-            parent,
-            text=text,
-            font=theme["font"],
-            fg=theme["btn_fg"],
-            bg=theme["btn_bg"],
-            activebackground=theme["btn_active_bg"],
-            activeforeground=theme["btn_fg"],
-            padx=35,
-            pady=12,
-            bd=0,
-            cursor="hand2",
-            command=command,
-            relief="ridge",
-            borderwidth=2,
+
+    def _create_action_button(self, parent, text, command):
+        return ttk.Button(
+            parent, text=text, style="Action.Panel.TButton", cursor="hand2", command=command, takefocus=False
         )
-        self._add_button_hover(btn)
-        return btn
 
-    def _add_button_hover(self, button):
-        def on_enter(e):
-            button.config(bg=button.cget("activebackground"))
+    @property
+    def ao_score(self):
+        return self.match.ao_score
 
-        def on_leave(e):
-            current_bg = self.themes[self.current_theme]["btn_bg"]
-            button.config(bg=current_bg)
+    @property
+    def aka_score(self):
+        return self.match.aka_score
 
-        button.bind("<Enter>", on_enter)
-        button.bind("<Leave>", on_leave)
+    @property
+    def match_id(self):
+        return self.match.match_id
+
+    @property
+    def timer_running(self):
+        return self.clock.running
 
     def update_timer(self):
-        if self.timer_running and self.time_left > 0:
-            self.time_left -= 1
-            minutes = self.time_left // 60
-            seconds = self.time_left % 60
-            self.timer_label.config(text=f"{minutes}:{seconds:02d}")
-            self.after(1000, self.update_timer)
-        elif self.time_left == 0:
-            self.timer_running = False
-            messagebox.showinfo("Timer", "Time's up!")
+        """Redraw the clock and schedule the next redraw for when its text changes."""
+        animator = self.controller.animator
+        animator.set(self.timer_label, text=self.clock.display())
+        self.publish()
+        if self.clock.running:
+            animator.call_later(self.clock.until_next_change(), self.update_timer, key=(self, "timer"))
+        elif self.clock.expired():
+            self.on_time_up()
+
+    def on_time_up(self):
+        """Signal the end of the match without blocking the event loop."""
+        animator = self.controller.animator
+        animator.tween(
+            self.timer_label, "background", self.controller.theme["timer_bg"], 1.5, start="#b91c1c",
+            on_done=lambda: animator.set(self.timer_label, background=""),
+        )
+        self.event_generate("<<MatchEnded>>", when="tail")
 
     def start_timer(self):
-        if not self.timer_running:
-            self.timer_running = True
+        if not self.clock.running and self.clock.start():
             self.update_timer()
 
     def stop_timer(self):
-        self.timer_running = False
+        self.clock.pause()
+        self.controller.animator.cancel((self, "timer"))
+        self.controller.animator.set(self.timer_label, text=self.clock.display())
+        self.publish()
 
-    def reset_timer(self):
-        self.stop_timer()
-        self.time_left = 10
-        self.timer_label.config(text="0:10")
+    def reset_timer(self, duration=None):
+        self.controller.animator.cancel((self, "timer"))
+        self._sync_names()
+        self.match.reset(duration)
+        self.update_timer()
+
+    def _sync_names(self):
+        self.match.ao_name = self.ao_name.get()
+        self.match.aka_name = self.aka_name.get()
+
+    def _on_duration_selected(self, event):
+        minutes, seconds = self.duration_var.get().split(":")
+        self.reset_timer(int(minutes) * 60 + int(seconds))
 
     def add_ao(self):
-        self.ao_score += 1
-        self.ao_score_label.config(text=str(self.ao_score))
+        self.match.score("ao", 1)
+        self._scores_changed()
 
     def sub_ao(self):
-        self.ao_score = max(0, self.ao_score - 1)
-        self.ao_score_label.config(text=str(self.ao_score))
+        self.match.score("ao", -1)
+        self._scores_changed()
 
     def add_aka(self):
-        self.aka_score += 1
-        self.aka_score_label.config(text=str(self.aka_score))
+        self.match.score("aka", 1)
+        self._scores_changed()
 
     def sub_aka(self):
-        self.aka_score = max(0, self.aka_score - 1)
-        self.aka_score_label.config(text=str(self.aka_score))
+        self.match.score("aka", -1)
+        self._scores_changed()
+
+    def _scores_changed(self):
+        """Every event updates the match at once; the labels repaint once per frame."""
+        self.controller.animator.request_frame(self._render_scores, key=(self, "scores"))
+
+    def _render_scores(self):
+        animator = self.controller.animator
+        animator.set(self.ao_score_label, text=str(self.ao_score))
+        animator.set(self.aka_score_label, text=str(self.aka_score))
+        self.publish()
+
+    def toggle_timer(self):
+        if self.clock.running:
+            self.stop_timer()
+        else:
+            self.start_timer()
+
+    def handle_hotkey(self, action):
+        getattr(self, action)()
 
     def save_score_to_csv(self):
-        import csv
-        ao_name = self.ao_name.get()
-        aka_name = self.aka_name.get()
-        ao_score = self.ao_score
-        aka_score = self.aka_score
+        """Queue the scoreboard for the storage writer thread and return the write's Future.
+
+        A toast reports when it is on disk. Saving an unchanged scoreboard
+        again does nothing and returns None.
+        """
+        self._sync_names()
+        match = self.match
+        saved = (match.match_id, match.ao_name, match.ao_score, match.aka_name, match.aka_score)
+        if saved == self._last_saved:
+            self.controller.toast("Score ini sudah disimpan")
+            return
+        self._last_saved = saved
+        future = self.controller.storage.save_score(match.ao_name, match.ao_score, match.aka_name, match.aka_score)
+        self.controller.watch_writes(
+            [future], "Score berhasil disimpan!", "Gagal menyimpan score", on_error=self._save_failed
+        )
+        return future
 
-        with open("score.csv", "a", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow([ao_name, ao_score, aka_name, aka_score])
+    def _save_failed(self, error):
+        self._last_saved = None
 
-        messagebox.showinfo("Score Saved", "Score berhasil disimpan ke score.csv!")
+    def finish_match(self):
+        """Log the result to the game history, once per match; Reset starts the next one."""
+        self.stop_timer()
+        match = self.match
+        if not match.finish():
+            self.controller.toast("Match ini sudah selesai")
+            return
+        future = self.controller.storage.log_game_result(
+            *match.times(), match.winner, match.ao_score, match.aka_score, match.ao_name, match.aka_name
+        )
+        self.controller.watch_writes(
+            [future], "Hasil match disimpan ke riwayat", "Gagal menyimpan hasil match",
+            on_error=lambda error: setattr(match, "finished", False),
+        )
 
 
 class App(tk.Tk):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, prebuild=True):
+        self.startup_began = time.perf_counter()
+        PROFILER.mark("app_init")
+        with PROFILER.span("tk_root"):
+            super().__init__()
         self.title("Pendekar Training Grounds")
         self.geometry("1280x720")
         self.resizable(False, False)
         self.frames = {}
-
-        container = tk.Frame(self)
-        container.pack(fill="both", expand=True)
-
-       
-        for Page in (WelcomePage, TeamIntroductionPage, ScoreboardApp):
-            frame = Page(container, self)
-            self.frames[Page.__name__] = frame
-            frame.place(relwidth=1, relheight=1)
+        self.current_page = None
+        self.startup_metrics = {"page_build": {}, "prebuilt": []}
+        self.animator = Animator(self)
+        self.theme = ThemeRegistry(self, self.animator)
+        self.assets = AssetLoader(self)
+        self.event_log = ScoreEventLog()
+        self.storage = open_storage(buffered=True)
+        self.name_index = None
+        self.ratings = None
+        # Results reach the listeners on the Tk thread, once their history row is written.
+        self.result_listeners = []
+        self._written_results = queue.Queue()
+        self.storage.add_result_listener(self._written_results.put)
+        self.after(250, self._poll_results)
+        self.toast_label = None
+        self.broadcaster = None
+        self.display_clients = 0
+        self._start_broadcast()
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        try:
+            settings = self.storage.load_settings()
+        except OSError:
+            settings = {}
+        self.animator.set_quality(settings.get(QUALITY_SETTING, AUTO_QUALITY))
+        self.hotkeys = load_hotkeys(settings)
+        self._hotkey_actions = keysym_table(self.hotkeys)
+        self.bind_all("<KeyPress>", self._on_key)
+
+        self.container = tk.Frame(self)
+        self.container.pack(fill="both", expand=True)
+
+        # Pages are built on first show_frame; the rest are built while idle.
+        self.page_factories = {
+            Page.__name__: Page for Page in (
+                WelcomePage, TeamIntroductionPage, ScoreboardApp, TournamentPage, LeaderboardPage, ReplayPage,
+            )
+        }
 
         self.show_frame("WelcomePage")
+        self.after_idle(lambda: self._on_first_paint(prebuild))
+
+    def get_page(self, page_name):
+        """Return the page, building it on first use."""
+        frame = self.frames.get(page_name)
+        if frame is None:
+            began = time.perf_counter()
+            with PROFILER.span(f"page:{page_name}"):
+                frame = self.page_factories[page_name](self.container, self)
+            frame.place(relwidth=1, relheight=1)
+            self.frames[page_name] = frame
+            self.startup_metrics["page_build"][page_name] = time.perf_counter() - began
+        return frame
 
     def show_frame(self, page_name):
-        frame = self.frames[page_name]
+        frame = self.get_page(page_name)
         frame.tkraise()
+        self.current_page = page_name
+        if hasattr(frame, "on_show"):
+            frame.on_show()
+
+    def show_replay(self, timeline, title):
+        """Open the replay view on timeline; its Back button returns to the current page."""
+        return_page = self.current_page
+        self.get_page("ReplayPage").load(timeline, title, return_page)
+        self.show_frame("ReplayPage")
+
+    def _on_key(self, event):
+        """Route hotkeys to the visible page unless the user is typing into a field.
+
+        Scoring buttons are created with takefocus=False, because a focused
+        button is also invoked by Space through its class binding. A button
+        that still has focus makes the hotkeys stand down.
+        """
+        action = self._hotkey_actions.get(normalize_keysym(event.keysym))
+        if action is None:
+            return
+        try:
+            focus = self.focus_get()
+        except KeyError:
+            focus = None
+        if isinstance(focus, (tk.Entry, ttk.Entry, tk.Text, tk.Button, ttk.Button)):
+            return
+        page = self.frames.get(self.current_page)
+        if hasattr(page, "handle_hotkey"):
+            page.handle_hotkey(action)
+
+    def _start_broadcast(self):
+        address = configured_address()
+        if address is None:
+            return
+        try:
+            self.broadcaster = ScoreBroadcaster(*address).start()
+        except OSError as exc:
+            print(f"Live score broadcast disabled: {exc}")
+            return
+        print(f"Live scores at http://{address[0]}:{address[1]}/")
+        self.after(250, self._drain_broadcast)
+
+    def toast(self, text, error=False):
+        """Show a short non-modal notice at the bottom of the window."""
+        if self.toast_label is None:
+            self.toast_label = tk.Label(self, font=("Poppins", 12, "bold"), fg="#ffffff", padx=18, pady=8)
+        self.toast_label.config(text=text, bg="#b91c1c" if error else "#1f2937")
+        self.toast_label.place(relx=0.5, rely=0.97, anchor="s")
+        self.toast_label.lift()
+        self.animator.call_later(
+            TOAST_ERROR_SECONDS if error else TOAST_SECONDS, self.toast_label.place_forget, key=(self, "toast")
+        )
+
+    def watch_writes(self, futures, success, failure, on_error=None):
+        """Toast when queued storage writes are on disk, or show the error.
+
+        Futures resolve on the writer thread, so they are polled from the Tk
+        thread. on_error(error) runs first when a write failed.
+        """
+        futures = [future for future in futures if future is not None]
+
+        def check():
+            if not all(future.done() for future in futures):
+                self.animator.call_later(SAVE_POLL_SECONDS, check)
+                return
+            errors = [future.exception() for future in futures if future.exception() is not None]
+            if errors:
+                if on_error is not None:
+                    on_error(errors[0])
+                self.toast(f"{failure}: {errors[0]}", error=True)
+            else:
+                self.toast(success)
+
+        check()
+
+    def get_name_index(self):
+        """Athlete name index for autocomplete, built on first use and kept current."""
+        if self.name_index is None:
+            with PROFILER.span("name_index"):
+                try:
+                    names = [name for name, _ in self.storage.load_team_members()]
+                    names.extend(self.storage.team_names())
+                except OSError:
+                    names = []
+                self.name_index = NameIndex(names)
+            self.result_listeners.append(self._index_result_names)
+        return self.name_index
+
+    def get_ratings(self):
+        """Rating engine, loaded from its snapshot on first use and updated with every result."""
+        if self.ratings is None:
+            with PROFILER.span("ratings"):
+                # Deliver what is already written first, so no result is applied twice.
+                self.storage.flush()
+                self._deliver_results()
+                self.ratings = RatingEngine(self.storage).load()
+            self.result_listeners.append(self.ratings.apply)
+        return self.ratings
+
+    def _deliver_results(self):
+        while True:
+            try:
+                record = self._written_results.get_nowait()
+            except queue.Empty:
+                return
+            for listener in self.result_listeners:
+                listener(record)
+
+    def _poll_results(self):
+        self._deliver_results()
+        self.after(250, self._poll_results)
+
+    def _index_result_names(self, record):
+        self.name_index.add(record["ao_name"])
+        self.name_index.add(record["aka_name"])
+
+    def publish(self, **fields):
+        """Queue scoreboard fields for display clients; sent once per frame."""
+        if self.broadcaster is not None:
+            self.broadcaster.publish(**fields)
+            self.animator.request_frame(self.broadcaster.flush, key=self.broadcaster)
+
+    def _drain_broadcast(self):
+        for kind, value in self.broadcaster.poll():
+            if kind == "clients":
+                self.display_clients = value
+                scoreboard = self.frames.get("ScoreboardApp")
+                if scoreboard is not None:
+                    scoreboard.show_display_clients(value)
+        self.after(250, self._drain_broadcast)
+
+    def _on_first_paint(self, prebuild):
+        self.startup_metrics["time_to_first_paint"] = time.perf_counter() - self.startup_began
+        PROFILER.mark("first_mainloop_idle")
+        if os.environ.get("PENDEKAR_STARTUP_METRICS"):
+            print(f"startup: first paint after {self.startup_metrics['time_to_first_paint'] * 1000:.0f} ms")
+        if prebuild:
+            self.after(200, self._prebuild_next_page)
+        else:
+            self.write_startup_report()
+
+    def _prebuild_next_page(self):
+        """Build one page that has not been shown yet, then yield to the event loop."""
+        for page_name in self.page_factories:
+            if page_name not in self.frames:
+                self.get_page(page_name).lower()
+                self.startup_metrics["prebuilt"].append(page_name)
+                self.after_idle(lambda: self.after(1, self._prebuild_next_page))
+                return
+        if os.environ.get("PENDEKAR_STARTUP_METRICS"):
+            builds = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.startup_metrics["page_build"].items())
+            print(f"startup: pages built: {builds}")
+        self.write_startup_report()
+
+    def write_startup_report(self):
+        """Write the --profile-startup JSON report, if profiling is on."""
+        path = PROFILER.write_report({"startup_metrics": self.startup_metrics})
+        if path:
+            print(f"startup profile written to {path}")
+
+    def close(self):
+        """Flush pending writes before the window goes away."""
+        self.write_startup_report()
+        self.assets.shutdown()
+        if self.broadcaster is not None:
+            self.broadcaster.stop()
+        try:
+            self.event_log.close()
+        except OSError as exc:
+            messagebox.showerror("Save Error", f"Some score events could not be written:\n{exc}")
+        try:
+            self.storage.flush()
+            self._deliver_results()
+            if self.ratings is not None:
+                self.ratings.save()
+            self.storage.close()
+        except OSError as exc:
+            messagebox.showerror("Save Error", f"Some data could not be written:\n{exc}")
+        self.destroy()
 
 
 
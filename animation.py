@@ -0,0 +1,309 @@
+import time
+import tkinter as tk
+
+# Quality levels, best first: (name, frame rate divisor, scenery detail, step scale).
+# A step scale of 0 turns animations off; tweens jump straight to their end.
+QUALITY_LEVELS = (
+    ("high", 1, True, 1.0),
+    ("medium", 2, True, 1.0),
+    ("low", 4, False, 0.5),
+    ("off", 4, False, 0.0),
+)
+QUALITY_NAMES = tuple(level[0] for level in QUALITY_LEVELS)
+AUTO_QUALITY = "auto"
+QUALITY_SETTING = "animation_quality"
+
+# In auto mode the level is judged every QUALITY_WINDOW ticks on the median
+# load: tick cost plus how late the tick started, as a share of the frame
+# interval. One slow tick (a page build, a GC pause) does not count.
+QUALITY_WINDOW = 30
+DOWNGRADE_LOAD = 0.75
+UPGRADE_LOAD = 0.3
+# Windows in a row below UPGRADE_LOAD before smoothness goes back up.
+UPGRADE_WINDOWS = 4
+
+
+def interpolate_color(c1, c2, t):
+    """Interpolate between two hex colors c1 and c2 by fraction t (0 to 1)."""
+    c1 = c1.lstrip("#")
+    c2 = c2.lstrip("#")
+    r1, g1, b1 = int(c1[0:2], 16), int(c1[2:4], 16), int(c1[4:6], 16)
+    r2, g2, b2 = int(c2[0:2], 16), int(c2[2:4], 16), int(c2[4:6], 16)
+    r = int(r1 + (r2 - r1) * t)
+    g = int(g1 + (g2 - g1) * t)
+    b = int(b1 + (b2 - b1) * t)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def linear(t):
+    return t
+
+
+def ease_in_out(t):
+    if t < 0.5:
+        return 4 * t * t * t
+    return 1 - (-2 * t + 2) ** 3 / 2
+
+
+def ease_out(t):
+    return 1 - (1 - t) ** 3
+
+
+class Tween:
+    """A single widget option animated from start to end over duration seconds."""
+
+    def __init__(self, widget, option, start, end, duration, easing, on_done, began):
+        self.widget = widget
+        self.option = option
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.easing = easing
+        self.on_done = on_done
+        self.began = began
+
+    def value_at(self, now):
+        """Return (value, finished) for the given clock time."""
+        if self.duration <= 0:
+            return self.end, True
+        t = min(1.0, (now - self.began) / self.duration)
+        eased = self.easing(t)
+        if isinstance(self.end, str):
+            value = interpolate_color(self.start, self.end, eased)
+        elif isinstance(self.end, int) and isinstance(self.start, int):
+            value = round(self.start + (self.end - self.start) * eased)
+        else:
+            value = self.start + (self.end - self.start) * eased
+        return value, t >= 1.0
+
+
+class Animator:
+    """Single-tick animation scheduler shared by every page of the app.
+
+    Tweens, one-shot timers and per-frame callbacks all run from one ``after``
+    loop. Widget option changes are collected during a frame and applied with
+    one ``config`` call per widget. Tweens are time based, so when a tick runs
+    late the missed frames are skipped instead of replayed.
+
+    Every tick is timed. In auto quality mode the frame rate, the number of
+    steps in stepped effects and the scenery detail are lowered when ticks
+    use up their frame interval, and raised again when they have time to
+    spare.
+    """
+
+    def __init__(self, root, fps=60, quality=AUTO_QUALITY):
+        self.root = root
+        self.fps = fps
+        self.frames = 0
+        self.dropped_frames = 0
+        self.frame_cost = 0.0
+        self.latency = 0.0
+        self.load = 0.0
+        self.quality_listeners = []
+        self._loads = []
+        self._calm_windows = 0
+        self._due = None
+        self._tweens = {}
+        self._timers = {}
+        self._frame_callbacks = {}
+        self._pending = {}
+        self._after_id = None
+        self._next_frame = None
+        self._in_tick = False
+        self.set_quality(quality)
+
+    def now(self):
+        return time.monotonic()
+
+    def set_quality(self, mode):
+        """Fix the quality level by name, or let it follow the measured load with "auto"."""
+        if mode != AUTO_QUALITY and mode not in QUALITY_NAMES:
+            mode = AUTO_QUALITY
+        self.quality_mode = mode
+        self._loads = []
+        self._calm_windows = 0
+        self._set_level(QUALITY_NAMES[0] if mode == AUTO_QUALITY else mode)
+
+    def _set_level(self, name):
+        _, divisor, detail, step_scale = QUALITY_LEVELS[QUALITY_NAMES.index(name)]
+        self.quality = name
+        self.frame_interval = divisor / self.fps
+        self.detail = detail
+        self.step_scale = step_scale
+        for listener in self.quality_listeners:
+            listener(name)
+
+    @property
+    def animations_enabled(self):
+        return self.step_scale > 0
+
+    def steps(self, full):
+        """How many of full steps a stepped effect should run at the current quality."""
+        return round(full * self.step_scale)
+
+    def tween(self, widget, option, end, duration, start=None, easing=ease_in_out, on_done=None):
+        """Animate one widget option, superseding any tween on the same option."""
+        key = (str(widget), option)
+        if not self.animations_enabled:
+            duration = 0
+        if start is None:
+            start = self._current_value(widget, option)
+        self._tweens[key] = Tween(widget, option, start, end, duration, easing, on_done, self.now())
+        self._wake()
+        return key
+
+    def set(self, widget, **options):
+        """Queue option changes to be applied on the next frame."""
+        for option in options:
+            self._tweens.pop((str(widget), option), None)
+        self._pending.setdefault(widget, {}).update(options)
+        self._wake()
+
+    def call_later(self, delay, callback, key=None):
+        """Run callback after delay seconds; a timer with the same key is replaced."""
+        if key is None:
+            key = object()
+        self._timers[key] = (self.now() + delay, callback)
+        self._wake(self._timers[key][0])
+        return key
+
+    def request_frame(self, callback, key=None):
+        """Run callback once on the next frame; repeated requests coalesce by key."""
+        if key is None:
+            key = callback
+        self._frame_callbacks[key] = callback
+        self._wake()
+        return key
+
+    def cancel(self, key):
+        """Cancel a timer, frame callback or tween by the key it was started with."""
+        self._timers.pop(key, None)
+        self._frame_callbacks.pop(key, None)
+        self._tweens.pop(key, None)
+
+    def cancel_widget(self, widget, option=None):
+        """Cancel running tweens on widget, or only on one of its options."""
+        name = str(widget)
+        for key in list(self._tweens):
+            if key[0] == name and (option is None or key[1] == option):
+                del self._tweens[key]
+
+    def is_active(self, key):
+        return key in self._timers or key in self._tweens or key in self._frame_callbacks
+
+    def _current_value(self, widget, option):
+        pending = self._pending.get(widget)
+        if pending and option in pending:
+            return pending[option]
+        value = widget.cget(option)
+        if isinstance(value, str) and value.startswith("#") and len(value) == 7:
+            return value
+        if isinstance(value, str) and not value.startswith("#"):
+            # Named colors such as "white" are resolved to hex for interpolation.
+            try:
+                r, g, b = widget.winfo_rgb(value)
+                return f"#{r >> 8:02x}{g >> 8:02x}{b >> 8:02x}"
+            except tk.TclError:
+                pass
+        return value
+
+    def _wake(self, at=None):
+        """Make sure a tick runs by at (default: the next frame), moving a later scheduled tick earlier."""
+        if self._in_tick:
+            return
+        now = self.now()
+        if self._next_frame is None or self._next_frame < now:
+            self._next_frame = now
+        wake_at = self._next_frame if at is None else max(self._next_frame, at)
+        if self._after_id is not None:
+            if self._due is not None and self._due <= wake_at:
+                return
+            self.root.after_cancel(self._after_id)
+        self._due = wake_at
+        self._after_id = self.root.after(max(0, int((wake_at - now) * 1000)), self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        began = self.now()
+        self._in_tick = True
+        try:
+            self._run_frame()
+        finally:
+            self._in_tick = False
+        self._measure(self.now() - began, max(0.0, began - self._due) if self._due is not None else 0.0)
+        self._schedule_next()
+
+    def _measure(self, cost, latency):
+        """Record one tick and, in auto mode, move one quality level when a window is complete."""
+        self.frame_cost = cost
+        self.latency = latency
+        self._loads.append((cost + latency) / self.frame_interval)
+        if len(self._loads) < QUALITY_WINDOW:
+            return
+        self._loads.sort()
+        self.load = self._loads[len(self._loads) // 2]
+        self._loads = []
+        if self.quality_mode != AUTO_QUALITY:
+            return
+        level = QUALITY_NAMES.index(self.quality)
+        if self.load > DOWNGRADE_LOAD and level < len(QUALITY_NAMES) - 1:
+            self._calm_windows = 0
+            self._set_level(QUALITY_NAMES[level + 1])
+        elif self.load < UPGRADE_LOAD and level > 0:
+            self._calm_windows += 1
+            if self._calm_windows >= UPGRADE_WINDOWS:
+                self._calm_windows = 0
+                self._set_level(QUALITY_NAMES[level - 1])
+        else:
+            self._calm_windows = 0
+
+    def _run_frame(self):
+        now = self.now()
+        self.frames += 1
+
+        if self._next_frame is not None and now - self._next_frame > self.frame_interval:
+            self.dropped_frames += int((now - self._next_frame) / self.frame_interval)
+
+        finished = []
+        for key, tween in list(self._tweens.items()):
+            value, done = tween.value_at(now)
+            self._pending.setdefault(tween.widget, {})[tween.option] = value
+            if done:
+                del self._tweens[key]
+                if tween.on_done is not None:
+                    finished.append(tween.on_done)
+
+        due = [key for key, (when, _) in self._timers.items() if when <= now]
+        for key in due:
+            finished.append(self._timers.pop(key)[1])
+
+        frame_callbacks = list(self._frame_callbacks.values())
+        self._frame_callbacks.clear()
+        for callback in frame_callbacks:
+            callback()
+
+        for callback in finished:
+            callback()
+
+        self._flush()
+        self._next_frame = now + self.frame_interval
+
+    def _schedule_next(self):
+        if self._pending or self._tweens or self._timers or self._frame_callbacks:
+            if self._pending or self._tweens or self._frame_callbacks:
+                wake_at = self._next_frame
+            else:
+                wake_at = max(self._next_frame, min(when for when, _ in self._timers.values()))
+            self._due = wake_at
+            self._after_id = self.root.after(max(1, int((wake_at - self.now()) * 1000)), self._tick)
+        else:
+            self._next_frame = None
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        for widget, options in pending.items():
+            try:
+                widget.config(**options)
+            except tk.TclError:
+                # The widget was destroyed while an animation was queued for it.
+                pass
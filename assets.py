@@ -0,0 +1,123 @@
+import hashlib
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageTk
+
+from startup_profile import PROFILER
+
+CACHE_DIR = os.path.join("data", "cache", "sprites")
+
+RESAMPLING = getattr(Image, "Resampling", Image)
+DEFAULT_RESAMPLE = RESAMPLING.BICUBIC
+
+# How often the Tk side checks for finished decodes while any are pending.
+POLL_INTERVAL_MS = 15
+
+
+def cache_path(path, size, resample, cache_dir=CACHE_DIR):
+    """Cache file for path resized to size, keyed by source mtime and filter."""
+    stat = os.stat(path)
+    width, height = size
+    digest = hashlib.sha1(
+        f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|{width}x{height}|{int(resample)}".encode("utf-8")
+    ).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{stem}_{width}x{height}_{int(resample)}_{digest}.png")
+
+
+def load_resized(path, size, resample=DEFAULT_RESAMPLE, cache_dir=CACHE_DIR):
+    """Return path resized to size as a Pillow image, using the on-disk cache."""
+    cached = cache_path(path, size, resample, cache_dir)
+    try:
+        with Image.open(cached) as image:
+            image.load()
+            return image
+    except (OSError, ValueError):
+        pass
+
+    with Image.open(path) as source:
+        image = source.resize(size, resample)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = cached + ".tmp"
+        image.save(tmp_path, format="PNG")
+        os.replace(tmp_path, cached)
+        prefix = cached.rsplit("_", 1)[0] + "_"
+        for name in os.listdir(cache_dir):
+            full = os.path.join(cache_dir, name)
+            if full.startswith(prefix) and full != cached:
+                os.remove(full)
+    except OSError:
+        # A read-only or full disk only costs us the cache, not the image.
+        pass
+    return image
+
+
+class AssetLoader:
+    """Decodes and resizes images on worker threads and hands them to Tk when ready.
+
+    ``request`` returns immediately; the callback receives an
+    ``ImageTk.PhotoImage`` on the Tk thread once the image is loaded. Loaded
+    images are kept in memory, so repeated requests are answered at once.
+    """
+
+    def __init__(self, root, cache_dir=CACHE_DIR, max_workers=2):
+        self.root = root
+        self.cache_dir = cache_dir
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="asset-loader")
+        self._done = queue.Queue()
+        self._photos = {}
+        self._waiting = {}
+        self._polling = False
+
+    def request(self, path, size, callback, resample=DEFAULT_RESAMPLE):
+        """Load path at size and call callback(photo) on the Tk thread."""
+        key = (path, tuple(size), int(resample))
+        photo = self._photos.get(key)
+        if photo is not None:
+            callback(photo)
+            return
+        if key in self._waiting:
+            self._waiting[key].append(callback)
+            return
+        self._waiting[key] = [callback]
+        future = self._executor.submit(self._load, path, tuple(size), resample)
+        future.add_done_callback(lambda f: self._done.put((key, f)))
+        self._start_polling()
+
+    def _load(self, path, size, resample):
+        with PROFILER.span(f"image:{path}"):
+            return load_resized(path, size, resample, self.cache_dir)
+
+    def _start_polling(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        while True:
+            try:
+                key, future = self._done.get_nowait()
+            except queue.Empty:
+                break
+            callbacks = self._waiting.pop(key, [])
+            try:
+                photo = ImageTk.PhotoImage(future.result())
+            except (OSError, ValueError) as exc:
+                print(f"Could not load image {key[0]}: {exc}")
+                continue
+            self._photos[key] = photo
+            PROFILER.mark(f"image_ready:{key[0]}")
+            for callback in callbacks:
+                callback(photo)
+
+        if self._waiting:
+            self.root.after(POLL_INTERVAL_MS, self._poll)
+        else:
+            self._polling = False
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,154 @@
+import bisect
+import tkinter as tk
+
+MAX_SUGGESTIONS = 8
+
+# Hide the dropdown this long after the entry loses focus, so a click on a
+# suggestion still lands.
+HIDE_DELAY = 0.15
+
+_NAVIGATION_KEYS = {"Up", "Down", "Return", "Tab", "Escape"}
+
+
+class NameIndex:
+    """Case-insensitive prefix index over athlete names.
+
+    Every word start of a name is a key in one sorted list, so "har" finds
+    "Kharisma Jaka Harum" as well as "Harun". A lookup is a bisect plus a
+    short forward scan, and adding a name is one insort, so the index can be
+    kept current as results come in. Entries are "<key>\0<folded name>"
+    strings, which sort and compare faster than tuples.
+    """
+
+    def __init__(self, names=()):
+        self._names = {}
+        entries = []
+        for name in names:
+            entries.extend(self._new_entries(name))
+        entries.sort()
+        self._entries = entries
+
+    def __len__(self):
+        return len(self._names)
+
+    def _new_entries(self, name):
+        name = " ".join(name.split())
+        folded = name.casefold()
+        if not folded or folded in self._names:
+            return []
+        self._names[folded] = name
+        words = folded.split(" ")
+        return [" ".join(words[i:]) + "\0" + folded for i in range(len(words))]
+
+    def add(self, name):
+        """Index name unless an equal spelling is already known; returns True if added."""
+        entries = self._new_entries(name)
+        for entry in entries:
+            bisect.insort(self._entries, entry)
+        return bool(entries)
+
+    def suggest(self, prefix, limit=MAX_SUGGESTIONS):
+        """Up to limit names with a word starting with prefix."""
+        key = " ".join(prefix.split()).casefold()
+        if not key:
+            return []
+        entries = self._entries
+        position = bisect.bisect_left(entries, key)
+        seen = []
+        while position < len(entries) and len(seen) < limit:
+            entry_key, _, folded = entries[position].partition("\0")
+            if not entry_key.startswith(key):
+                break
+            if folded not in seen:
+                seen.append(folded)
+            position += 1
+        return [self._names[folded] for folded in seen]
+
+
+class SuggestionBox:
+    """Dropdown of NameIndex suggestions under an Entry.
+
+    Focus stays in the entry: Up/Down move through the list, Return or Tab
+    takes the highlighted name and Escape closes it. Lookups run at most once
+    per animator frame however fast the user types.
+    """
+
+    def __init__(self, entry, index, animator, on_pick=None):
+        self.entry = entry
+        self.index = index
+        self.animator = animator
+        self.on_pick = on_pick
+
+        self.popup = tk.Toplevel(entry)
+        self.popup.withdraw()
+        self.popup.overrideredirect(True)
+        self.listbox = tk.Listbox(
+            self.popup, height=MAX_SUGGESTIONS, font=("Poppins", 12), activestyle="none",
+            exportselection=False, highlightthickness=1,
+        )
+        self.listbox.pack(fill="both", expand=True)
+        self.listbox.bind("<ButtonRelease-1>", lambda e: self.pick())
+
+        entry.bind("<KeyRelease>", self._on_key_release, add="+")
+        entry.bind("<Down>", lambda e: self._move(1))
+        entry.bind("<Up>", lambda e: self._move(-1))
+        entry.bind("<Return>", lambda e: self.pick(), add="+")
+        entry.bind("<Tab>", lambda e: self.pick(), add="+")
+        entry.bind("<Escape>", lambda e: self.hide(), add="+")
+        entry.bind("<FocusOut>", lambda e: animator.call_later(HIDE_DELAY, self.hide, key=(self, "hide")), add="+")
+
+    @property
+    def visible(self):
+        return self.popup.winfo_ismapped()
+
+    def _on_key_release(self, event):
+        if event.keysym not in _NAVIGATION_KEYS:
+            self.animator.request_frame(self._refresh, key=(self, "refresh"))
+
+    def _refresh(self):
+        text = self.entry.get()
+        names = self.index.suggest(text)
+        if not names or names == [text]:
+            self.hide()
+            return
+        self.listbox.delete(0, "end")
+        self.listbox.insert("end", *names)
+        self.listbox.config(height=len(names))
+        self.listbox.selection_set(0)
+        self.popup.geometry(
+            f"{self.entry.winfo_width()}x{self.listbox.winfo_reqheight()}"
+            f"+{self.entry.winfo_rootx()}+{self.entry.winfo_rooty() + self.entry.winfo_height()}"
+        )
+        self.popup.deiconify()
+        self.popup.lift()
+
+    def _move(self, step):
+        if not self.visible:
+            return None
+        current = self.listbox.curselection()
+        position = (current[0] if current else -1) + step
+        position = max(0, min(self.listbox.size() - 1, position))
+        self.listbox.selection_clear(0, "end")
+        self.listbox.selection_set(position)
+        self.listbox.see(position)
+        return "break"
+
+    def pick(self):
+        """Put the highlighted suggestion into the entry."""
+        if not self.visible:
+            return None
+        self.animator.cancel((self, "hide"))
+        current = self.listbox.curselection()
+        if current:
+            self.entry.delete(0, "end")
+            self.entry.insert(0, self.listbox.get(current[0]))
+        self.hide()
+        self.entry.focus_set()
+        self.entry.icursor("end")
+        if self.on_pick is not None:
+            self.on_pick()
+        return "break"
+
+    def hide(self):
+        self.animator.cancel((self, "refresh"))
+        self.popup.withdraw()
@@ -1,9 +1,150 @@
+import atexit
 import csv
+from concurrent.futures import Future
 from datetime import datetime
 import os
+import queue
+import threading
+import time
+
+from history_index import HistoryIndex, encode_row, record_matches, scan_records, time_key
+from segments import DEFAULT_MAX_BYTES, PERIOD_FORMATS, SegmentedLog
+
+LEGACY_SCORE_FILE = "score.csv"
+HISTORY_COLUMNS = ['start_time', 'end_time', 'winner', 'ao_score', 'aka_score', 'ao_name', 'aka_name']
+
+
+class WriteFuture(Future):
+    """Future for one queued row; asking it for the outcome counts as reporting a write error"""
+
+    reported = False
+
+    def result(self, timeout=None):
+        self.reported = True
+        return super().result(timeout)
+
+    def exception(self, timeout=None):
+        self.reported = True
+        return super().exception(timeout)
+
+
+class BackgroundWriter:
+    """Write-behind queue that appends CSV rows from a single worker thread.
+
+    Rows are grouped per file and written when ``batch_size`` rows are waiting
+    or ``flush_interval`` seconds have passed since the first of them was
+    queued. Every submitted row gets a Future that resolves once its batch is
+    on disk, or carries the exception that made the write fail. flush()
+    raises only the errors no caller has read from those Futures.
+    """
+
+    _FLUSH = object()
+    _STOP = object()
+
+    def __init__(self, write_rows, batch_size=100, flush_interval=0.5, on_error=None):
+        self._write_rows = write_rows
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_error = on_error
+        self.errors = []
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="csv-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path, row):
+        """Queue one row for path and return a Future for its write."""
+        if self._closed:
+            raise ValueError("writer is closed")
+        future = WriteFuture()
+        self._queue.put((path, row, future))
+        return future
+
+    def flush(self, timeout=None):
+        """Block until every queued row is written; raise the first write error not yet reported."""
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put((self._FLUSH, done, None))
+            done.wait(timeout)
+        errors, self.errors = self.errors, []
+        unreported = [error for error, futures in errors if not any(future.reported for future in futures)]
+        if unreported:
+            raise unreported[0]
+
+    def close(self):
+        """Write everything still queued and stop the worker thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put((self._STOP, None, None))
+        self._thread.join()
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                path, row, future = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write_batch(batch)
+                batch, deadline = [], None
+                continue
+
+            if path is self._FLUSH or path is self._STOP:
+                self._write_batch(batch)
+                batch, deadline = [], None
+                if path is self._STOP:
+                    return
+                row.set()
+                continue
+
+            batch.append((path, row, future))
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+            if len(batch) >= self.batch_size:
+                self._write_batch(batch)
+                batch, deadline = [], None
+
+    def _write_batch(self, batch):
+        by_path = {}
+        for path, row, future in batch:
+            by_path.setdefault(path, []).append((row, future))
+        for path, items in by_path.items():
+            try:
+                self._write_rows(path, [row for row, _ in items])
+            except Exception as exc:
+                self.errors.append((exc, [future for _, future in items]))
+                for _, future in items:
+                    future.set_exception(exc)
+                if self.on_error is not None:
+                    self.on_error(exc, path, [row for row, _ in items])
+            else:
+                for _, future in items:
+                    future.set_result(None)
+
+
+def notify_when_written(listeners, future, record):
+    """Call every listener with record once its row is written; a failed write notifies none
+
+    With a Future from a BackgroundWriter the listeners run on its thread.
+    """
+    def notify(future=None):
+        # Future.exception directly: checking here must not mark the error as reported.
+        if future is not None and Future.exception(future) is not None:
+            return
+        for callback in listeners:
+            callback(record)
+
+    if future is None:
+        notify()
+    else:
+        future.add_done_callback(notify)
+
 
 class CSVHandler:
-    def __init__(self):
+    def __init__(self, buffered=False, batch_size=100, flush_interval=0.5, on_error=None, rotate=True,
+                 rotate_bytes=DEFAULT_MAX_BYTES, rotate_period=None):
         self.data_dir = "data"
         os.makedirs(self.data_dir, exist_ok=True)
         
@@ -13,13 +154,38 @@ class CSVHandler:
         self.settings_file = os.path.join(self.data_dir, "settings.csv")
         self.feedback_file = os.path.join(self.data_dir, "feedback_log.csv")
         self.history_file = os.path.join(self.data_dir, "game_history.csv")
+        self.score_file = os.path.join(self.data_dir, "score.csv")
         
         
         self._initialize_files()
+        self.history_log = SegmentedLog(
+            self.history_file, 'start_time', ('ao_name', 'aka_name'), max_bytes=rotate_bytes, period=rotate_period
+        )
+        self.feedback_log = SegmentedLog(
+            self.feedback_file, 'timestamp', max_bytes=rotate_bytes, period=rotate_period
+        )
+        self.score_log = SegmentedLog(self.score_file, header=False, max_bytes=rotate_bytes, period=rotate_period)
+        self.logs = [self.history_log, self.feedback_log, self.score_log]
+        self._logs_by_path = {log.path: log for log in self.logs}
+        self.auto_rotate = rotate
+        self.history_index = HistoryIndex(self.history_file)
+        if rotate:
+            # Nothing has read or appended to the hot files yet, so there is nothing to flush.
+            self._rotate()
+        self._result_listeners = []
+
+        self._writer = None
+        if buffered:
+            self._writer = BackgroundWriter(self._append_rows, batch_size, flush_interval, on_error)
+            atexit.register(self.close)
 
     def _initialize_files(self):
         """Create CSV files with headers if they don't exist"""
         
+        # Older versions wrote saved scores to score.csv in the working directory.
+        if os.path.exists(LEGACY_SCORE_FILE) and not os.path.exists(self.score_file):
+            os.replace(LEGACY_SCORE_FILE, self.score_file)
+        
         if not os.path.exists(self.team_members_file):
             with open(self.team_members_file, 'w', newline='') as f:
                 writer = csv.writer(f)
@@ -57,7 +223,47 @@ class CSVHandler:
         if not os.path.exists(self.history_file):
             with open(self.history_file, 'w', newline='') as f:
                 writer = csv.writer(f)
-                writer.writerow(['start_time', 'end_time', 'winner', 'ao_score', 'aka_score'])
+                writer.writerow(HISTORY_COLUMNS)
+        else:
+            self._upgrade_history_file()
+
+    def _upgrade_history_file(self):
+        """Add the team name columns to a history file written by older versions"""
+        with open(self.history_file, mode='r', newline='') as file:
+            reader = csv.reader(file)
+            header = next(reader, [])
+            if header == HISTORY_COLUMNS:
+                return
+            rows = list(reader)
+        positions = {name: i for i, name in enumerate(header)}
+        tmp_file = self.history_file + '.tmp'
+        with open(tmp_file, mode='w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(HISTORY_COLUMNS)
+            for row in rows:
+                writer.writerow([
+                    row[positions[name]] if name in positions and positions[name] < len(row) else ''
+                    for name in HISTORY_COLUMNS
+                ])
+        os.replace(tmp_file, self.history_file)
+        index_file = os.path.splitext(self.history_file)[0] + '.idx'
+        if os.path.exists(index_file):
+            os.remove(index_file)
+
+    def rotate_logs(self, force=False):
+        """Archive the hot log files that are due; returns the names of the rotated logs
+
+        The handler also rotates when it opens, and while the app runs each
+        append checks its own log.
+        """
+        self.flush()
+        return self._rotate(force)
+
+    def _rotate(self, force=False):
+        rotated = [log.name for log in self.logs if log.rotate(force)]
+        if self.history_log.name in rotated:
+            self.history_index.invalidate()
+        return rotated
 
     def load_team_members(self):
         """Load team members from CSV"""
@@ -109,35 +315,245 @@ class CSVHandler:
             for key, value in settings.items():
                 writer.writerow([key, str(value)])
 
+    def _append_rows(self, path, rows):
+        """Append rows to a CSV file in one open/write, then rotate its log if that is due"""
+        if path == self.history_file:
+            with open(path, mode='ab') as file:
+                file.write(b''.join(encode_row(row) for row in rows))
+            self.history_index.refresh()
+        else:
+            with open(path, mode='a', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerows(rows)
+        if self.auto_rotate:
+            self._rotate_if_due(path)
+
+    def _rotate_if_due(self, path):
+        # In buffered mode this runs on the writer thread. Readers flush the
+        # queue before they touch the hot files, so no read is in progress.
+        log = self._logs_by_path.get(path)
+        if log is None:
+            return
+        try:
+            rotated = log.rotate()
+        except OSError as exc:
+            # The rows are written; a half-done rotation is finished when the log is next opened.
+            self.auto_rotate = False
+            print(f"Log rotation stopped: {exc}")
+            return
+        if rotated and log is self.history_log:
+            self.history_index.invalidate()
+
+    def _append(self, path, row):
+        """Append a row now, or queue it when running in buffered mode"""
+        if self._writer is None:
+            self._append_rows(path, [row])
+            return None
+        return self._writer.submit(path, row)
+
+    def flush(self):
+        """Wait for queued rows to reach disk; raises the first write error"""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        """Flush queued rows and stop the background writer"""
+        if self._writer is not None:
+            self._writer.close()
+            self.flush()
+
+    def save_score(self, ao_name, ao_score, aka_name, aka_score):
+        """Append a saved scoreboard result to score.csv"""
+        return self._append(self.score_file, [ao_name, ao_score, aka_name, aka_score])
+
     def log_feedback(self, message):
         """Log feedback message to CSV"""
-        with open(self.feedback_file, mode='a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow([datetime.now().strftime('%Y-%m-%d %H:%M:%S'), message])
+        return self._append(self.feedback_file, [datetime.now().strftime('%Y-%m-%d %H:%M:%S'), message])
+
+    def add_result_listener(self, callback):
+        """Call callback(record) with every game result written from now on; see notify_when_written"""
+        self._result_listeners.append(callback)
 
-    def log_game_result(self, start_time, end_time, winner, ao_score, aka_score):
+    def log_game_result(self, start_time, end_time, winner, ao_score, aka_score, ao_name='', aka_name=''):
         """Log game result to history CSV"""
-        with open(self.history_file, mode='a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow([
-                start_time.strftime('%Y-%m-%d %H:%M:%S'),
-                end_time.strftime('%Y-%m-%d %H:%M:%S'),
-                winner,
-                ao_score,
-                aka_score
-            ])
+        row = [
+            start_time.strftime('%Y-%m-%d %H:%M:%S'),
+            end_time.strftime('%Y-%m-%d %H:%M:%S'),
+            winner,
+            ao_score,
+            aka_score,
+            ao_name,
+            aka_name
+        ]
+        future = self._append(self.history_file, row)
+        notify_when_written(self._result_listeners, future, dict(zip(HISTORY_COLUMNS, map(str, row))))
+        return future
 
     def get_game_history(self):
         """Get all game history records"""
+        if self._writer is not None:
+            self._writer.flush()
         history = []
-        with open(self.history_file, mode='r') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                history.append({
-                    'start_time': row['start_time'],
-                    'end_time': row['end_time'],
-                    'winner': row['winner'],
-                    'ao_score': row['ao_score'],
-                    'aka_score': row['aka_score']
-                })
+        for row in self.history_log.iter_records():
+            history.append({
+                'start_time': row['start_time'],
+                'end_time': row['end_time'],
+                'winner': row['winner'],
+                'ao_score': row['ao_score'],
+                'aka_score': row['aka_score'],
+                'ao_name': row.get('ao_name') or '',
+                'aka_name': row.get('aka_name') or ''
+            })
         return history
+
+    def query_game_history(self, start=None, end=None, winner=None, team=None, limit=None, offset=0,
+                           newest_first=False):
+        """Stream game history records matching the filters, one page at a time
+
+        start/end bound start_time (inclusive) and accept datetimes, dates or
+        'YYYY-MM-DD[ HH:MM:SS]' strings; team matches either side's name.
+        """
+        self.flush()
+        if not self.history_log.segments:
+            return self.history_index.query(start, end, winner, team, limit, offset, newest_first)
+        return self._history_page(start, end, winner, team, limit, offset, newest_first)
+
+    def _history_page(self, start, end, winner, team, limit, offset, newest_first):
+        # Segments are older than the hot file and in time order, so a page is
+        # a slice of archive-then-hot (hot-then-archive when newest first).
+        # Reading stops as soon as the page is full.
+        if newest_first:
+            hot_count = self.history_index.count(start, end, winner, team)
+            rows = max(0, hot_count - offset)
+            if limit is not None:
+                rows = min(rows, limit)
+                limit -= rows
+            if rows:
+                yield from self.history_index.query(start, end, winner, team, rows, offset, True)
+            offset = max(0, offset - hot_count)
+        for segment in self._history_segments(start, end, team, newest_first):
+            if limit == 0:
+                return
+            if offset >= segment['rows'] and self._segment_matches(segment, start, end, winner, team):
+                offset -= segment['rows']
+                continue
+            for record in self.history_log.segment_records(segment, newest_first):
+                if not record_matches(record, start, end, winner, team):
+                    continue
+                if offset:
+                    offset -= 1
+                    continue
+                yield record
+                if limit is not None:
+                    limit -= 1
+                    if not limit:
+                        return
+        if not newest_first and limit != 0:
+            yield from self.history_index.query(start, end, winner, team, limit, offset)
+
+    def _history_segments(self, start, end, team, newest_first=False):
+        """Archived history segments that can hold matches; the manifest lists each segment's team names."""
+        segments = self.history_log.segments_in(time_key(start), time_key(end, end=True), newest_first)
+        if team is None:
+            return segments
+        team = team.lower()
+        return [segment for segment in segments if team in {name.lower() for name in segment.get('names', ())}]
+
+    def _segment_matches(self, segment, start, end, winner, team):
+        """True when every row of segment matches, so its manifest row count can stand in for reading it."""
+        return winner is None and team is None and self.history_log.covers(
+            segment, time_key(start), time_key(end, end=True)
+        )
+
+    def count_game_history(self, start=None, end=None, winner=None, team=None):
+        """Count game history records matching the filters"""
+        self.flush()
+        if start is None and end is None and winner is None and team is None:
+            return self.history_log.archived_rows + len(self.history_index)
+        archived = 0
+        for segment in self._history_segments(start, end, team):
+            if self._segment_matches(segment, start, end, winner, team):
+                archived += segment['rows']
+            else:
+                archived += sum(
+                    1 for record in self.history_log.segment_records(segment)
+                    if record_matches(record, start, end, winner, team)
+                )
+        return archived + self.history_index.count(start, end, winner, team)
+
+    def team_names(self):
+        """Distinct team names from game history"""
+        self.flush()
+        return list(self.history_log.archived_names().union(self.history_index.team_names()))
+
+    def history_cursor(self):
+        """Number of game history rows, archived ones included; a position for history_since"""
+        self.flush()
+        return self.history_log.archived_rows + len(self.history_index)
+
+    def history_since(self, cursor):
+        """Yield game history records written after a history_cursor() position"""
+        self.flush()
+        archived = self.history_log.archived_rows
+        if cursor < archived:
+            yield from self.history_log.iter_records(skip=cursor, include_hot=False)
+        self.history_index.refresh()
+        columns = list(self.history_index.columns)
+        start = self.history_index.offset_of(max(0, cursor - archived))
+        for _, _, row in scan_records(self.history_file, start):
+            record = {name: '' for name in columns}
+            record.update(zip(columns, row))
+            yield record
+
+
+STORAGE_ENV = "PENDEKAR_STORAGE"
+
+
+def _read_setting(name, data_dir="data"):
+    settings_file = os.path.join(data_dir, "settings.csv")
+    if os.path.exists(settings_file):
+        with open(settings_file, mode='r') as file:
+            for row in csv.DictReader(file):
+                if row.get('setting_name') == name:
+                    return row.get('value')
+    return None
+
+
+def configured_backend(data_dir="data"):
+    """Storage backend name from $PENDEKAR_STORAGE or the storage_backend setting"""
+    backend = os.environ.get(STORAGE_ENV) or _read_setting('storage_backend', data_dir)
+    return backend.lower() if backend else "csv"
+
+
+def configured_rotation(data_dir="data"):
+    """(max_bytes, period) for log rotation from the log_rotate_bytes and log_rotate_period settings
+
+    Missing or malformed values fall back to the defaults, so a bad setting
+    cannot stop the app from starting.
+    """
+    max_bytes = _read_setting('log_rotate_bytes', data_dir)
+    period = (_read_setting('log_rotate_period', data_dir) or '').strip().lower()
+    try:
+        max_bytes = int(max_bytes)
+    except (TypeError, ValueError):
+        max_bytes = DEFAULT_MAX_BYTES
+    if max_bytes <= 0:
+        max_bytes = DEFAULT_MAX_BYTES
+    return max_bytes, period if period in PERIOD_FORMATS else None
+
+
+def open_storage(buffered=False):
+    """Open the configured storage backend ("csv" or "sqlite")"""
+    backend = configured_backend()
+    rotate_bytes, rotate_period = configured_rotation()
+    if backend == "sqlite":
+        from sqlite_backend import SQLiteHandler
+
+        handler = SQLiteHandler(buffered=buffered)
+        if not handler.csv_migrated():
+            # Only read the CSV files; rotating them now would be wasted work.
+            handler.migrate_from_csv(CSVHandler(rotate=False, rotate_bytes=rotate_bytes, rotate_period=rotate_period))
+        return handler
+    if backend != "csv":
+        raise ValueError(f"Unknown storage backend: {backend}")
+    return CSVHandler(buffered=buffered, rotate_bytes=rotate_bytes, rotate_period=rotate_period)
@@ -0,0 +1,245 @@
+"""Benchmarks for CSVHandler and the scoring/persistence paths.
+
+    python bench_storage.py run --sizes 10000,100000,1000000 --output bench_baseline.json
+    python bench_storage.py compare bench_baseline.json bench_current.json --threshold 0.2
+
+``run`` builds a synthetic data/ directory per size in a temporary folder and
+times every CSVHandler method against it. ``compare`` diffs two result files
+and exits with status 1 when any benchmark got slower than the threshold.
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend import CSVHandler  # noqa: E402
+
+NAMES = [
+    "Naruto", "Sasuke", "Sakura", "Kakashi", "Hinata", "Shikamaru", "Rock Lee", "Neji",
+    "Gaara", "Temari", "Kankuro", "Ino", "Choji", "Kiba", "Shino", "Tenten",
+]
+
+
+def build_data_dir(root, rows, seed=0):
+    """Write team, history and feedback CSVs with rows entries each under root/data."""
+    rng = random.Random(seed)
+    data_dir = os.path.join(root, "data")
+    os.makedirs(data_dir, exist_ok=True)
+
+    with open(os.path.join(data_dir, "team_members.csv"), "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["name", "nim"])
+        writer.writerows([f"Athlete {i}", f"{2400000000 + i}"] for i in range(rows))
+
+    base = datetime(2024, 1, 1, 8, 0, 0)
+    with open(os.path.join(data_dir, "game_history.csv"), "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["start_time", "end_time", "winner", "ao_score", "aka_score", "ao_name", "aka_name"])
+        for i in range(rows):
+            start = base + timedelta(minutes=3 * i)
+            ao, aka = rng.sample(NAMES, 2)
+            ao_score, aka_score = rng.randint(0, 12), rng.randint(0, 12)
+            winner = ao if ao_score >= aka_score else aka
+            writer.writerow([
+                start.strftime("%Y-%m-%d %H:%M:%S"),
+                (start + timedelta(seconds=rng.randint(60, 180))).strftime("%Y-%m-%d %H:%M:%S"),
+                winner, ao_score, aka_score, ao, aka,
+            ])
+
+    with open(os.path.join(data_dir, "feedback_log.csv"), "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["timestamp", "feedback_message"])
+        writer.writerows(
+            [(base + timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S"), f"feedback message {i}"]
+            for i in range(rows)
+        )
+
+
+def measure(func, iterations):
+    """Call func iterations times and return latency statistics in milliseconds."""
+    latencies = []
+    began = time.perf_counter()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1000)
+    total = time.perf_counter() - began
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / total, 3) if total else None,
+        "mean_ms": round(statistics.fmean(latencies), 4),
+        "p50_ms": round(latencies[len(latencies) // 2], 4),
+        "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 4),
+        "max_ms": round(latencies[-1], 4),
+    }
+
+
+def bench_handler(rows, reads, writes):
+    """Benchmark every CSVHandler method against the current data/ directory.
+
+    Rotation is off so the generated history stays in the hot file at every size.
+    """
+    handler = CSVHandler(rotate=False)
+    now = datetime.now()
+    results = {}
+
+    results["load_team_members"] = measure(handler.load_team_members, reads)
+    results["load_scoreboard_data"] = measure(handler.load_scoreboard_data, writes)
+    results["save_scoreboard_data"] = measure(lambda: handler.save_scoreboard_data("Naruto", 3, "Sasuke", 5), writes)
+    results["load_settings"] = measure(handler.load_settings, writes)
+    results["save_settings"] = measure(lambda: handler.save_settings({"theme": "dark", "data_privacy": True}), writes)
+    results["log_feedback"] = measure(lambda: handler.log_feedback("benchmark"), writes)
+    results["log_game_result"] = measure(
+        lambda: handler.log_game_result(now, now, "Naruto", 3, 5, "Naruto", "Sasuke"), writes
+    )
+    results["get_game_history"] = measure(handler.get_game_history, reads)
+    results["count_game_history"] = measure(handler.count_game_history, reads)
+    results["query_game_history:page"] = measure(
+        lambda: list(handler.query_game_history(limit=50, offset=rows // 2, newest_first=True)), writes
+    )
+    results["query_game_history:team"] = measure(
+        lambda: list(handler.query_game_history(team="Gaara", limit=50)), writes
+    )
+    results["query_game_history:range"] = measure(
+        lambda: list(handler.query_game_history(start="2024-01-02", end="2024-01-02")), writes
+    )
+
+    buffered = CSVHandler(buffered=True, rotate=False)
+    results["log_feedback:buffered"] = measure(lambda: buffered.log_feedback("benchmark"), writes)
+    results["log_game_result:buffered"] = measure(
+        lambda: buffered.log_game_result(now, now, "Naruto", 3, 5, "Naruto", "Sasuke"), writes
+    )
+    results["buffered_flush"] = measure(buffered.flush, 1)
+    buffered.close()
+    return results
+
+
+def bench_save_score(writes):
+    """Time ScoreboardApp.save_score_to_csv; needs a display for Tk."""
+    try:
+        import Tkinter as app_module
+        app = app_module.App(prebuild=False)
+    except Exception as exc:
+        return {"skipped": f"Tk unavailable: {exc}"}
+
+    app.withdraw()
+    page = app.get_page("ScoreboardApp")
+    try:
+        def save():
+            # A new score each time, or the save would be skipped as a repeat.
+            page.add_ao()
+            future = page.save_score_to_csv()
+            # Write the batch now instead of waiting out the writer's flush interval.
+            app.storage.flush()
+            future.result()
+            app.update()
+        result = measure(save, writes)
+    finally:
+        app.close()
+    return result
+
+
+def run(args):
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": {},
+    }
+    cwd = os.getcwd()
+    for rows in sizes:
+        root = tempfile.mkdtemp(prefix=f"pendekar-bench-{rows}-")
+        try:
+            print(f"building {rows} rows in {root}")
+            build_data_dir(root, rows, seed=rows)
+            os.chdir(root)
+            results = bench_handler(rows, args.reads, args.writes)
+            if not args.skip_ui:
+                results["save_score_to_csv"] = bench_save_score(args.writes)
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(root, ignore_errors=True)
+        report["results"][str(rows)] = results
+        for name, stats in results.items():
+            if "p50_ms" in stats:
+                print(f"  {rows:>8} {name:<28} p50 {stats['p50_ms']:>10.3f} ms  {stats['ops_per_sec']:>12.1f} ops/s")
+            else:
+                print(f"  {rows:>8} {name:<28} {stats.get('skipped', '')}")
+
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"results written to {args.output}")
+    return 0
+
+
+def compare_reports(baseline, current, threshold, metric="p50_ms"):
+    """Return (rows, regressions) comparing metric between two result dicts."""
+    rows = []
+    regressions = []
+    for group, benches in current.get("results", {}).items():
+        for name, stats in benches.items():
+            old = baseline.get("results", {}).get(group, {}).get(name, {})
+            if metric not in stats or metric not in old or not old[metric]:
+                continue
+            change = (stats[metric] - old[metric]) / old[metric]
+            rows.append((group, name, old[metric], stats[metric], change))
+            if change > threshold:
+                regressions.append((group, name, change))
+    return rows, regressions
+
+
+def compare(args):
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+    rows, regressions = compare_reports(baseline, current, args.threshold, args.metric)
+    for group, name, old, new, change in rows:
+        flag = "  REGRESSION" if change > args.threshold else ""
+        print(f"{group:>8} {name:<28} {old:>10.3f} -> {new:>10.3f} {args.metric} ({change:+.1%}){flag}")
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    print("no regressions")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks and write a result file")
+    run_parser.add_argument("--sizes", default="10000,100000", help="comma-separated row counts (up to 1000000)")
+    run_parser.add_argument("--reads", type=int, default=5, help="iterations for full-file reads")
+    run_parser.add_argument("--writes", type=int, default=500, help="iterations for appends and small reads")
+    run_parser.add_argument("--skip-ui", action="store_true", help="skip save_score_to_csv, which needs Tk")
+    run_parser.add_argument("--output", default="bench_baseline.json")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="diff two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = 20%%")
+    compare_parser.add_argument("--metric", default="p50_ms")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
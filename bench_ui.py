@@ -0,0 +1,235 @@
+"""Headless render benchmarks for the Tk UI.
+
+    python bench_ui.py --output bench_ui.json
+    python bench_ui.py --baseline bench_ui.json --threshold 0.25
+
+Starts App on a private Xvfb display (unless --display is given), drives
+the theme toggle, apply_theme, page transitions, the START sequence and
+rapid scoring, and records frame times, event-loop lag and canvas item
+counts for each. With --baseline the run fails when a scenario got slower
+than the threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_storage import compare_reports  # noqa: E402
+
+# Interval of the probe timer used to measure event-loop lag.
+PROBE_MS = 10
+
+
+def start_xvfb(width=1280, height=800):
+    """Start Xvfb on the first free display number and return (process, display)."""
+    if shutil.which("Xvfb") is None:
+        raise RuntimeError("Xvfb is not installed; pass --display to use an existing X server")
+    for number in range(90, 130):
+        if os.path.exists(f"/tmp/.X11-unix/X{number}") or os.path.exists(f"/tmp/.X{number}-lock"):
+            continue
+        display = f":{number}"
+        process = subprocess.Popen(
+            ["Xvfb", display, "-screen", "0", f"{width}x{height}x24", "-nolisten", "tcp"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+                return process, display
+            if process.poll() is not None:
+                break
+            time.sleep(0.05)
+        process.kill()
+    raise RuntimeError("could not start Xvfb")
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class Recorder:
+    """Records animator frame costs and event-loop lag while a scenario runs."""
+
+    def __init__(self, app):
+        self.app = app
+        self.frames = []
+        self.lags = []
+        self._probe_due = None
+        self._probing = False
+
+        animator = app.animator
+        run_frame = animator._run_frame
+
+        def timed_frame():
+            began = time.perf_counter()
+            run_frame()
+            if self._probing:
+                self.frames.append((time.perf_counter() - began) * 1000)
+
+        animator._run_frame = timed_frame
+
+    def _probe(self):
+        if not self._probing:
+            return
+        now = time.perf_counter()
+        if self._probe_due is not None:
+            self.lags.append(max(0.0, (now - self._probe_due) * 1000))
+        self._probe_due = now + PROBE_MS / 1000
+        self.app.after(PROBE_MS, self._probe)
+
+    def run(self, name, action, settle=0.0):
+        """Run action, pump the loop for settle seconds, and return its stats."""
+        self.frames, self.lags = [], []
+        self._probing = True
+        self._probe_due = None
+        dropped_before = self.app.animator.dropped_frames
+        self._probe()
+
+        began = time.perf_counter()
+        action()
+        self.app.update_idletasks()
+        action_ms = (time.perf_counter() - began) * 1000
+
+        deadline = time.perf_counter() + settle
+        while time.perf_counter() < deadline:
+            self.app.update()
+            time.sleep(0.001)
+        self.app.update()
+        self._probing = False
+
+        welcome = self.app.frames.get("WelcomePage")
+        stats = {
+            "action_ms": round(action_ms, 3),
+            "frames": len(self.frames),
+            "p50_frame_ms": round(percentile(self.frames, 0.5), 3),
+            "p95_frame_ms": round(percentile(self.frames, 0.95), 3),
+            "max_frame_ms": round(max(self.frames, default=0.0), 3),
+            "p95_lag_ms": round(percentile(self.lags, 0.95), 3),
+            "max_lag_ms": round(max(self.lags, default=0.0), 3),
+            "canvas_items": len(welcome.canvas.find_all()) if welcome is not None else None,
+            "dropped_frames": self.app.animator.dropped_frames - dropped_before,
+        }
+        print(f"  {name:<22} action {stats['action_ms']:>8.2f} ms  p95 frame {stats['p95_frame_ms']:>7.2f} ms  "
+              f"p95 lag {stats['p95_lag_ms']:>7.2f} ms  items {stats['canvas_items']}")
+        return stats
+
+
+def run_scenarios(repeat):
+    import Tkinter as app_module
+
+    app = app_module.App(prebuild=False)
+    app.update()
+    recorder = Recorder(app)
+    welcome = app.get_page("WelcomePage")
+    results = {}
+
+    results["startup"] = {
+        "time_to_first_paint_ms": round(app.startup_metrics.get("time_to_first_paint", 0.0) * 1000, 3),
+        "page_build_ms": {name: round(sec * 1000, 3) for name, sec in app.startup_metrics["page_build"].items()},
+    }
+
+    results["toggle_theme"] = recorder.run("toggle_theme", welcome.toggle_theme, settle=0.8)
+    results["toggle_theme:double"] = recorder.run(
+        "toggle_theme:double", lambda: (welcome.toggle_theme(), welcome.toggle_theme()), settle=0.8
+    )
+    results["apply_theme"] = recorder.run("apply_theme", welcome.apply_theme, settle=0.1)
+
+    def transitions():
+        for _ in range(repeat):
+            for page_name in ("TeamIntroductionPage", "ScoreboardApp", "WelcomePage"):
+                app.show_frame(page_name)
+                app.update_idletasks()
+
+    results["show_frame"] = recorder.run("show_frame", transitions, settle=0.1)
+    results["start_sequence"] = recorder.run("start_sequence", welcome.bangkit_with_animation, settle=3.0)
+
+    scoreboard = app.get_page("ScoreboardApp")
+    app.show_frame("ScoreboardApp")
+
+    def scoring_burst():
+        for _ in range(repeat * 50):
+            scoreboard.add_ao()
+            scoreboard.add_aka()
+            scoreboard.sub_ao()
+
+    results["scoring_burst"] = recorder.run("scoring_burst", scoring_burst, settle=0.2)
+    app.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="bench_ui.json")
+    parser.add_argument("--display", help="use this X display instead of starting Xvfb")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--baseline", help="result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--metric", default="p95_frame_ms")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    xvfb = None
+    if args.display:
+        os.environ["DISPLAY"] = args.display
+    else:
+        xvfb, display = start_xvfb()
+        os.environ["DISPLAY"] = display
+
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    work_dir = tempfile.mkdtemp(prefix="pendekar-ui-bench-")
+    cwd = os.getcwd()
+    try:
+        # The app loads its sprites relative to the working directory.
+        for name in ("pendekar_diam.png", "pendekar_bangkit.png"):
+            shutil.copy(os.path.join(app_dir, name), work_dir)
+        os.chdir(work_dir)
+        results = run_scenarios(args.repeat)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": {"ui": {name: stats for name, stats in results.items() if name != "startup"}},
+        "startup": results["startup"],
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"results written to {args.output}")
+
+    if baseline is not None:
+        rows, regressions = compare_reports(baseline, report, args.threshold, args.metric)
+        for _, name, old, new, change in rows:
+            flag = "  REGRESSION" if change > args.threshold else ""
+            print(f"{name:<22} {old:>8.3f} -> {new:>8.3f} {args.metric} ({change:+.1%}){flag}")
+        if regressions:
+            print(f"{len(regressions)} scenario(s) regressed by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+
+BROADCAST_ENV = "PENDEKAR_BROADCAST"
+BROADCAST_FLAG = "--broadcast"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Messages a slow client may fall behind before it is resynced with a snapshot.
+CLIENT_BACKLOG = 64
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+DISPLAY_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Pendekar Live Score</title>
+<style>
+body{margin:0;background:#121212;color:#00ffcc;font-family:Poppins,sans-serif;text-align:center}
+.row{display:flex;height:70vh}.side{flex:1;display:flex;flex-direction:column;justify-content:center}
+.ao{background:#004080}.aka{background:#800000}.name{font-size:6vh;color:#fff}.score{font-size:30vh;color:#fff}
+#clock{font-size:18vh;color:#32cd32;background:#000}
+</style></head><body>
+<div class="row"><div class="side ao"><div class="name" id="ao_name"></div><div class="score" id="ao_score"></div></div>
+<div class="side aka"><div class="name" id="aka_name"></div><div class="score" id="aka_score"></div></div></div>
+<div id="clock"></div>
+<script>
+const state = {};
+function render(){for(const k of ["ao_name","aka_name","ao_score","aka_score"]){document.getElementById(k).textContent=state[k]??""}
+document.getElementById("clock").textContent=state.clock??"";}
+const source = new EventSource("/events");
+source.addEventListener("snapshot", e => {for (const k in state) delete state[k]; Object.assign(state, JSON.parse(e.data)); render();});
+source.addEventListener("delta", e => {Object.assign(state, JSON.parse(e.data)); render();});
+</script></body></html>
+"""
+
+
+def parse_address(value):
+    """Parse "host:port", ":port" or "port" into (host, port)."""
+    host, port = DEFAULT_HOST, DEFAULT_PORT
+    if not value or value in ("1", "true", "yes"):
+        return host, port
+    if ":" in value:
+        host_part, port_part = value.rsplit(":", 1)
+        host = host_part or host
+        port = int(port_part)
+    else:
+        port = int(value)
+    return host, port
+
+
+def configured_address(argv=None, environ=None):
+    """Address from --broadcast[=HOST:PORT] or $PENDEKAR_BROADCAST, or None when disabled."""
+    argv = sys.argv[1:] if argv is None else argv
+    environ = os.environ if environ is None else environ
+    for arg in argv:
+        if arg == BROADCAST_FLAG:
+            return parse_address(None)
+        if arg.startswith(BROADCAST_FLAG + "="):
+            return parse_address(arg.split("=", 1)[1])
+    value = environ.get(BROADCAST_ENV)
+    if value and value.lower() not in ("0", "false", "no"):
+        return parse_address(value)
+    return None
+
+
+def match_fields(match, prefix=""):
+    """Broadcast fields describing a Match."""
+    return {
+        prefix + "ao_name": match.ao_name,
+        prefix + "aka_name": match.aka_name,
+        prefix + "ao_score": match.ao_score,
+        prefix + "aka_score": match.aka_score,
+        prefix + "clock": match.clock.display(),
+        prefix + "running": match.clock.running,
+    }
+
+
+class _Client:
+    def __init__(self, kind):
+        self.kind = kind
+        self.queue = asyncio.Queue(CLIENT_BACKLOG)
+        self.needs_snapshot = False
+
+
+class ScoreBroadcaster:
+    """Pushes scoreboard changes to display clients over SSE and WebSocket.
+
+    The server runs an asyncio loop on its own thread. The Tk side calls
+    ``publish`` as often as it likes and ``flush`` once per frame; only
+    fields whose value changed since the last flush are sent, as one delta.
+    New clients receive a full snapshot first. Nothing on the server thread
+    touches Tk: connection changes are reported through ``inbox``, a
+    thread-safe queue that the Tk side drains with ``poll``.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.inbox = queue.Queue()
+        self._published = {}
+        self._pending = {}
+        self._snapshot = {}
+        self._clients = set()
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+
+    # Tk thread -------------------------------------------------------------
+
+    def start(self):
+        """Start the server thread; raises OSError if the port cannot be bound."""
+        self._thread = threading.Thread(target=self._run, name="score-broadcast", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        return self
+
+    def publish(self, **fields):
+        """Record field values; unchanged values are ignored."""
+        for key, value in fields.items():
+            if self._published.get(key, self) != value:
+                self._published[key] = value
+                self._pending[key] = value
+
+    def flush(self):
+        """Send everything published since the last flush as one delta."""
+        if not self._pending or self._loop is None:
+            return
+        delta, self._pending = self._pending, {}
+        self._loop.call_soon_threadsafe(self._broadcast, delta)
+
+    def poll(self):
+        """Drain messages from the server thread, e.g. ("clients", 3)."""
+        messages = []
+        while True:
+            try:
+                messages.append(self.inbox.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def stop(self):
+        if self._loop is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+            self._thread.join(timeout=2)
+
+    # Server thread ---------------------------------------------------------
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port)
+            )
+        except OSError as exc:
+            self._error = exc
+            self._loop = None
+            self._ready.set()
+            return
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.close()
+
+    async def _shutdown(self):
+        self._server.close()
+        for client in list(self._clients):
+            self._end_stream(client)
+        # Let the streams write their last bytes before the loop stops.
+        await asyncio.sleep(0.05)
+        asyncio.get_running_loop().stop()
+
+    def _broadcast(self, delta):
+        self._snapshot.update(delta)
+        message = json.dumps(delta)
+        for client in self._clients:
+            if client.needs_snapshot:
+                continue
+            try:
+                client.queue.put_nowait(("delta", message))
+            except asyncio.QueueFull:
+                # Drop the backlog; the client catches up with one snapshot.
+                while not client.queue.empty():
+                    client.queue.get_nowait()
+                client.needs_snapshot = True
+                client.queue.put_nowait(("snapshot", None))
+
+    def _client_count_changed(self):
+        self.inbox.put(("clients", len(self._clients)))
+
+    async def _handle(self, reader, writer):
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if len(request_line) < 2 or request_line[0] != "GET":
+                await self._respond(writer, "405 Method Not Allowed", "text/plain", b"GET only\n")
+                return
+            path = request_line[1].split("?", 1)[0]
+            if path == "/":
+                await self._respond(writer, "200 OK", "text/html; charset=utf-8", DISPLAY_PAGE.encode("utf-8"))
+            elif path == "/snapshot":
+                await self._respond(writer, "200 OK", "application/json", json.dumps(self._snapshot).encode("utf-8"))
+            elif path == "/events":
+                await self._serve_stream(reader, writer, "sse", headers)
+            elif path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self._serve_stream(reader, writer, "ws", headers)
+            else:
+                await self._respond(writer, "404 Not Found", "text/plain", b"not found\n")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, content_type, body):
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+            "Access-Control-Allow-Origin: *\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+
+    async def _serve_stream(self, reader, writer, kind, headers):
+        if kind == "sse":
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                b"Access-Control-Allow-Origin: *\r\nConnection: keep-alive\r\n\r\n"
+            )
+        else:
+            accept = base64.b64encode(
+                hashlib.sha1((headers.get("sec-websocket-key", "") + WEBSOCKET_GUID).encode("latin-1")).digest()
+            ).decode("latin-1")
+            writer.write(
+                "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n\r\n".encode("latin-1")
+            )
+
+        client = _Client(kind)
+        client.queue.put_nowait(("snapshot", None))
+        self._clients.add(client)
+        self._client_count_changed()
+        watcher = asyncio.ensure_future(self._watch_client(reader, writer, client))
+        try:
+            while True:
+                item = await client.queue.get()
+                if item is None:
+                    return
+                event, data = item
+                if event == "snapshot":
+                    client.needs_snapshot = False
+                    data = json.dumps(self._snapshot)
+                writer.write(self._encode(kind, event, data))
+                await writer.drain()
+        finally:
+            watcher.cancel()
+            self._clients.discard(client)
+            self._client_count_changed()
+
+    @staticmethod
+    def _encode(kind, event, data):
+        if kind == "sse":
+            return f"event: {event}\ndata: {data}\n\n".encode("utf-8")
+        payload = json.dumps({"type": event, "data": json.loads(data)}).encode("utf-8")
+        return ScoreBroadcaster._ws_frame(0x1, payload)
+
+    @staticmethod
+    def _ws_frame(opcode, payload):
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 65536:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        return header + payload
+
+    async def _watch_client(self, reader, writer, client):
+        """Notice disconnects; answer WebSocket pings and close frames."""
+        try:
+            if client.kind == "sse":
+                await reader.read()
+            else:
+                while True:
+                    first, second = await reader.readexactly(2)
+                    opcode = first & 0x0F
+                    length = second & 0x7F
+                    if length == 126:
+                        length = struct.unpack("!H", await reader.readexactly(2))[0]
+                    elif length == 127:
+                        length = struct.unpack("!Q", await reader.readexactly(8))[0]
+                    mask = await reader.readexactly(4) if second & 0x80 else b"\0\0\0\0"
+                    payload = bytes(b ^ mask[i % 4] for i, b in enumerate(await reader.readexactly(length)))
+                    if opcode == 0x8:
+                        writer.write(self._ws_frame(0x8, payload[:2]))
+                        break
+                    if opcode == 0x9:
+                        writer.write(self._ws_frame(0xA, payload))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        self._end_stream(client)
+
+    @staticmethod
+    def _end_stream(client):
+        while client.queue.full():
+            client.queue.get_nowait()
+        client.queue.put_nowait(None)
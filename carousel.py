@@ -0,0 +1,110 @@
+import math
+import tkinter as tk
+from tkinter import ttk
+
+# Every card has the same size, so positions and the scroll region are
+# plain arithmetic on the index instead of measuring packed widgets.
+CARD_WIDTH = 320
+CARD_HEIGHT = 190
+CARD_GAP = 50
+CARD_STRIDE = CARD_WIDTH + CARD_GAP
+
+# Cards kept alive past each edge of the viewport so scrolling never shows a gap.
+BUFFER_CARDS = 1
+
+
+class MemberCard(ttk.Frame):
+    """One reusable roster card; ``show`` rebinds it to another athlete."""
+
+    def __init__(self, master):
+        super().__init__(
+            master, width=CARD_WIDTH, height=CARD_HEIGHT, style="Member.TFrame",
+            borderwidth=4, relief="ridge", padding=(25, 18),
+        )
+        self.pack_propagate(False)
+        self.index = None
+        self.name_label = ttk.Label(self, style="Name.Member.TLabel", wraplength=260, justify="center")
+        self.name_label.pack(pady=(0, 10))
+        self.desc_label = ttk.Label(self, style="Desc.Member.TLabel", wraplength=260, justify="center")
+        self.desc_label.pack()
+
+    def show(self, index, member):
+        if index == self.index:
+            return
+        self.index = index
+        name, description = member
+        self.name_label.config(text=name)
+        self.desc_label.config(text=description)
+
+
+class MemberCarousel(ttk.Frame):
+    """Horizontal roster view that only builds the cards in view.
+
+    A pool of MemberCard widgets sized to the viewport is moved along the
+    canvas as it scrolls, so build time and widget count stay the same for
+    four athletes or four thousand. Card colors come from the shared ttk
+    styles; only the canvas background follows the theme registry directly.
+    """
+
+    def __init__(self, master, members, theme, height=310):
+        super().__init__(master)
+        self.members = members
+        self.cards = []
+        self.windows = []
+        self._first = None
+
+        self.canvas = tk.Canvas(self, bg=theme["bg"], highlightthickness=0, height=height)
+        self.scrollbar = ttk.Scrollbar(
+            self, orient="horizontal", command=self._xview, style="Member.Horizontal.TScrollbar"
+        )
+        self.canvas.configure(xscrollcommand=self.scrollbar.set)
+        self.canvas.pack(fill="x")
+        self.scrollbar.pack(fill="x", pady=(0, 20))
+        self._top = max(0, (height - CARD_HEIGHT) // 2)
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<MouseWheel>", lambda e: self._scroll(-1 if e.delta > 0 else 1))
+        self.canvas.bind("<Button-4>", lambda e: self._scroll(-1))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll(1))
+        self.set_members(members)
+        theme.add_listener(lambda palette, final: self.canvas.config(bg=palette["bg"]))
+
+    def set_members(self, members):
+        self.members = members
+        self.canvas.config(scrollregion=(0, 0, max(0, len(members) * CARD_STRIDE - CARD_GAP), self._top + CARD_HEIGHT))
+        for card in self.cards:
+            card.index = None
+        self._first = None
+        self._layout()
+
+    def _xview(self, *args):
+        self.canvas.xview(*args)
+        self._layout()
+
+    def _scroll(self, units):
+        self.canvas.xview_scroll(units, "units")
+        self._layout()
+
+    def _on_configure(self, event):
+        needed = math.ceil(event.width / CARD_STRIDE) + 1 + 2 * BUFFER_CARDS
+        while len(self.cards) < needed:
+            card = MemberCard(self.canvas)
+            self.cards.append(card)
+            self.windows.append(self.canvas.create_window(0, self._top, window=card, anchor="nw", state="hidden"))
+        self._first = None
+        self._layout()
+
+    def _layout(self):
+        """Move the pooled cards onto the slots around the current scroll position."""
+        first = max(0, int(self.canvas.canvasx(0)) // CARD_STRIDE - BUFFER_CARDS)
+        if first == self._first:
+            return
+        self._first = first
+        for offset, (card, window) in enumerate(zip(self.cards, self.windows)):
+            index = first + offset
+            if index >= len(self.members):
+                self.canvas.itemconfigure(window, state="hidden")
+                continue
+            card.show(index, self.members[index])
+            self.canvas.coords(window, index * CARD_STRIDE, self._top)
+            self.canvas.itemconfigure(window, state="normal")
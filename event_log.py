@@ -0,0 +1,189 @@
+import atexit
+import os
+import threading
+import time
+import uuid
+
+EVENT_LOG_FILE = os.path.join("data", "score_events.log")
+
+# Seconds between group commits; every event in a window shares one fsync.
+COMMIT_INTERVAL = 0.2
+
+BEGIN = "B"
+SCORE = "S"
+END = "E"
+
+
+def _clean(text):
+    """Keep free-text fields on a single tab-separated line."""
+    return str(text).replace("\t", " ").replace("\r", " ").replace("\n", " ")
+
+
+class ScoreEventLog:
+    """Append-only log of scoring events with batched durability.
+
+    Each line is ``timestamp_ms<TAB>match_id<TAB>kind<TAB>fields...``. Appends
+    only touch an in-memory buffer; a background thread writes the buffer and
+    fsyncs it every ``commit_interval`` seconds, so a button press never waits
+    on the disk and at most one interval of events is at risk in a crash.
+    """
+
+    def __init__(self, path=EVENT_LOG_FILE, commit_interval=COMMIT_INTERVAL):
+        self.path = path
+        self.commit_interval = commit_interval
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._file = open(path, "a", encoding="utf-8", newline="\n")
+        self._buffer = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._commits = 0
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="score-event-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def begin(self, ao_name, aka_name, ao_score=0, aka_score=0):
+        """Start a new match and return its id."""
+        match_id = uuid.uuid4().hex[:12]
+        self._append(match_id, BEGIN, _clean(ao_name), ao_score, _clean(aka_name), aka_score)
+        return match_id
+
+    def score(self, match_id, side, delta, elapsed=None):
+        """Record a score change of delta points for side ("ao" or "aka").
+
+        elapsed is the match clock in seconds, stored as milliseconds after
+        the delta; lines written without it end at the delta.
+        """
+        if elapsed is None:
+            self._append(match_id, SCORE, side, delta)
+        else:
+            self._append(match_id, SCORE, side, delta, int(elapsed * 1000))
+
+    def end(self, match_id, ao_name, ao_score, aka_name, aka_score):
+        """Record the final names and scores of a match."""
+        self._append(match_id, END, _clean(ao_name), ao_score, _clean(aka_name), aka_score)
+
+    def _append(self, match_id, kind, *fields):
+        line = "\t".join([str(int(time.time() * 1000)), match_id, kind] + [str(f) for f in fields]) + "\n"
+        with self._cond:
+            if self._closed:
+                raise ValueError("event log is closed")
+            self._buffer.append(line)
+
+    def _check_writer(self):
+        # Called with the lock held; a dead writer would otherwise leave flush waiting forever.
+        if self._error is not None:
+            raise self._error
+        if not self._thread.is_alive():
+            raise RuntimeError("event log writer thread stopped")
+
+    def flush(self):
+        """Commit buffered events now and wait until they are on disk.
+
+        Raises the writer's error if a commit failed.
+        """
+        with self._cond:
+            while self._buffer and not self._closed:
+                self._check_writer()
+                self._cond.notify_all()
+                self._cond.wait(self.commit_interval)
+            target = self._commits + 1
+            while self._commits < target and not self._closed:
+                self._check_writer()
+                self._cond.notify_all()
+                self._cond.wait(self.commit_interval)
+            if self._error is not None:
+                raise self._error
+
+    def close(self):
+        """Commit anything still buffered and stop the writer thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._closed:
+                    self._cond.wait(self.commit_interval)
+                lines, self._buffer = self._buffer, []
+                closed = self._closed
+            try:
+                if lines:
+                    self._file.write("".join(lines))
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+            except OSError as exc:
+                with self._cond:
+                    self._error = exc
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self._commits += 1
+                self._cond.notify_all()
+            if closed:
+                return
+
+
+def iter_events(path=EVENT_LOG_FILE):
+    """Yield (timestamp_ms, match_id, kind, fields) for every complete event."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            if not line.endswith("\n"):
+                # A crash can leave a torn final line; it was never committed.
+                break
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) < 3:
+                continue
+            yield int(parts[0]), parts[1], parts[2], parts[3:]
+
+
+def list_matches(path=EVENT_LOG_FILE):
+    """Return the ids of every match in the log, oldest first."""
+    seen = {}
+    for _, match_id, kind, _ in iter_events(path):
+        if kind == BEGIN:
+            seen.setdefault(match_id, None)
+    return list(seen)
+
+
+def replay(match_id, path=EVENT_LOG_FILE):
+    """Rebuild a match's state from the log."""
+    state = None
+    for timestamp, event_match, kind, fields in iter_events(path):
+        if event_match != match_id:
+            continue
+        if kind == BEGIN:
+            state = {
+                "match_id": match_id,
+                "ao_name": fields[0],
+                "ao_score": int(fields[1]),
+                "aka_name": fields[2],
+                "aka_score": int(fields[3]),
+                "started": timestamp,
+                "updated": timestamp,
+                "ended": None,
+                "events": 0,
+            }
+        elif state is None:
+            continue
+        elif kind == SCORE:
+            state[fields[0] + "_score"] += int(fields[1])
+            state["updated"] = timestamp
+            state["events"] += 1
+        elif kind == END:
+            state["ao_name"] = fields[0]
+            state["aka_name"] = fields[2]
+            state["ended"] = timestamp
+    return state
@@ -0,0 +1,224 @@
+"""Columnar game history for season reports.
+
+    python history_columns.py [--start 2024-01-01] [--end 2024-12-31]
+
+Parses game history in chunks into NumPy arrays: datetime64 start/end
+times, integer scores and category codes for the team and winner names.
+Aggregations over those arrays are vectorized, so a season report does not
+build a dict per match. NumPy is optional for the rest of the app; only
+this module needs it.
+"""
+import argparse
+import csv
+from itertools import chain, islice
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from backend import HISTORY_COLUMNS as COLUMNS, open_storage
+from history_index import time_key
+
+CHUNK_ROWS = 50000
+
+# Code used for an empty name (no winner means a draw).
+NO_NAME = -1
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("history analytics need NumPy: pip install numpy")
+
+
+def _times(values):
+    try:
+        return np.array(values, dtype='datetime64[s]')
+    except ValueError:
+        parsed = np.empty(len(values), dtype='datetime64[s]')
+        for i, value in enumerate(values):
+            try:
+                parsed[i] = np.datetime64(value, 's')
+            except ValueError:
+                parsed[i] = np.datetime64('NaT')
+        return parsed
+
+
+def _ints(values):
+    try:
+        return np.fromiter(map(int, values), dtype=np.int32, count=len(values))
+    except ValueError:
+        return np.array([int(value) if value.strip().lstrip('-').isdigit() else 0 for value in values], dtype=np.int32)
+
+
+class Categories:
+    """Grows one name -> code table across chunks."""
+
+    def __init__(self):
+        self.names = []
+        self.codes = {'': NO_NAME}
+
+    def _add(self, name):
+        code = self.codes[name] = len(self.names)
+        self.names.append(name)
+        return code
+
+    def encode(self, values):
+        codes, add = self.codes, self._add
+        return np.fromiter(
+            (codes[name] if name in codes else add(name) for name in values), dtype=np.int32, count=len(values)
+        )
+
+
+class HistoryColumns:
+    """Game history as parallel arrays; team and winner columns share one name table."""
+
+    def __init__(self, start, end, ao_score, aka_score, ao_team, aka_team, winner, names):
+        self.start = start
+        self.end = end
+        self.ao_score = ao_score
+        self.aka_score = aka_score
+        self.ao_team = ao_team
+        self.aka_team = aka_team
+        self.winner = winner
+        self.names = names
+
+    def __len__(self):
+        return len(self.start)
+
+    @classmethod
+    def from_rows(cls, rows, chunk_rows=CHUNK_ROWS):
+        """Build from an iterable of rows in COLUMNS order, chunk_rows at a time."""
+        _require_numpy()
+        categories = Categories()
+        parts = {name: [] for name in ('start', 'end', 'ao_score', 'aka_score', 'ao_team', 'aka_team', 'winner')}
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_rows))
+            if not chunk:
+                break
+            start, end, winner, ao_score, aka_score, ao_name, aka_name = zip(*chunk)
+            parts['start'].append(_times(start))
+            parts['end'].append(_times(end))
+            parts['ao_score'].append(_ints(ao_score))
+            parts['aka_score'].append(_ints(aka_score))
+            parts['ao_team'].append(categories.encode(ao_name))
+            parts['aka_team'].append(categories.encode(aka_name))
+            parts['winner'].append(categories.encode(winner))
+        empty = {'start': 'datetime64[s]', 'end': 'datetime64[s]'}
+        arrays = {
+            name: np.concatenate(chunks) if chunks else np.empty(0, dtype=empty.get(name, np.int32))
+            for name, chunks in parts.items()
+        }
+        return cls(names=categories.names, **arrays)
+
+    def _take(self, mask):
+        return HistoryColumns(
+            self.start[mask], self.end[mask], self.ao_score[mask], self.aka_score[mask],
+            self.ao_team[mask], self.aka_team[mask], self.winner[mask], self.names,
+        )
+
+    def between(self, start=None, end=None):
+        """Matches whose start time lies in [start, end]; bounds as accepted by query_game_history."""
+        mask = np.ones(len(self), dtype=bool)
+        start, end = time_key(start), time_key(end, end=True)
+        if start is not None:
+            mask &= self.start >= np.datetime64(start, 's')
+        if end is not None:
+            mask &= self.start <= np.datetime64(end, 's')
+        return self._take(mask)
+
+    def scores_by_date(self):
+        """Return (dates, matches, ao_points, aka_points) per calendar day of start_time."""
+        valid = ~np.isnat(self.start)
+        days = self.start[valid].astype('datetime64[D]')
+        dates, inverse = np.unique(days, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        return (
+            dates,
+            np.bincount(inverse, minlength=len(dates)),
+            np.bincount(inverse, weights=self.ao_score[valid], minlength=len(dates)).astype(np.int64),
+            np.bincount(inverse, weights=self.aka_score[valid], minlength=len(dates)).astype(np.int64),
+        )
+
+    def winner_distribution(self):
+        """Return ({winner name: wins}, draws), most wins first."""
+        decided = self.winner[self.winner != NO_NAME]
+        counts = np.bincount(decided, minlength=len(self.names))
+        order = np.argsort(-counts, kind='stable')
+        wins = {self.names[code]: int(counts[code]) for code in order if counts[code]}
+        return wins, int(len(self) - len(decided))
+
+    def durations(self):
+        """Match lengths in seconds; NaN where a time is missing or end precedes start."""
+        seconds = (self.end - self.start).astype('timedelta64[s]').astype(np.float64)
+        seconds[np.isnat(self.start) | np.isnat(self.end)] = np.nan
+        seconds[seconds < 0] = np.nan
+        return seconds
+
+    def average_duration(self):
+        """Mean match length in seconds, or None without usable times."""
+        seconds = self.durations()
+        if not np.any(~np.isnan(seconds)):
+            return None
+        return float(np.nanmean(seconds))
+
+
+def read_csv_file(file):
+    """Yield game history CSV rows reordered to COLUMNS; older files lack the name columns."""
+    reader = csv.reader(file)
+    header = next(reader, [])
+    positions = [header.index(name) if name in header else None for name in COLUMNS]
+    width = len(header)
+    for row in reader:
+        if len(row) < width:
+            row = row + [''] * (width - len(row))
+        yield [row[i] if i is not None else '' for i in positions]
+
+
+def read_csv_rows(path):
+    with open(path, newline='') as file:
+        yield from read_csv_file(file)
+
+
+def load_history_columns(source, chunk_rows=CHUNK_ROWS):
+    """Load a CSV path, or any storage backend with history_since(), into HistoryColumns."""
+    if isinstance(source, str):
+        rows = read_csv_rows(source)
+    elif hasattr(source, 'history_log'):
+        # The CSV backend's files are read directly; csv.reader is much faster than history_since.
+        source.flush()
+        rows = chain.from_iterable(read_csv_file(file) for file in source.history_log.iter_files())
+    else:
+        rows = ([record.get(name) or '' for name in COLUMNS] for record in source.history_since(0))
+    return HistoryColumns.from_rows(rows, chunk_rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Season report from game history")
+    parser.add_argument("--start", help="first day, YYYY-MM-DD")
+    parser.add_argument("--end", help="last day, YYYY-MM-DD")
+    args = parser.parse_args(argv)
+
+    storage = open_storage()
+    try:
+        history = load_history_columns(storage).between(args.start, args.end)
+    finally:
+        storage.close()
+
+    print(f"{len(history)} matches")
+    average = history.average_duration()
+    if average is not None:
+        print(f"average duration: {average:.1f} s")
+    wins, draws = history.winner_distribution()
+    print(f"draws: {draws}")
+    for name, count in list(wins.items())[:10]:
+        print(f"  {name:<30} {count:>6} wins")
+    for day, matches, ao_points, aka_points in zip(*history.scores_by_date()):
+        print(f"{day}  {matches:>5} matches  AO {ao_points:>6}  AKA {aka_points:>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
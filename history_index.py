@@ -0,0 +1,299 @@
+import bisect
+import csv
+import io
+import os
+import threading
+from datetime import date, datetime
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+INDEX_VERSION = '#v1'
+
+
+def time_key(value, end=False):
+    """Turn a datetime, date or string bound into a comparable timestamp string."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.strftime(TIME_FORMAT)
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d') + (' 23:59:59' if end else ' 00:00:00')
+    value = str(value)
+    if end and len(value) == 10:
+        return value + ' 23:59:59'
+    return value
+
+
+def record_matches(record, start=None, end=None, winner=None, team=None):
+    """Apply the query_game_history filters to one record dict."""
+    start_time = record.get('start_time') or ''
+    start = time_key(start)
+    end = time_key(end, end=True)
+    if start is not None and start_time < start or end is not None and start_time > end:
+        return False
+    if winner is not None and (record.get('winner') or '').lower() != winner.lower():
+        return False
+    if team is not None and team.lower() not in (
+        (record.get('ao_name') or '').lower(), (record.get('aka_name') or '').lower()
+    ):
+        return False
+    return True
+
+
+def _clean(text):
+    return str(text).replace('\t', ' ').replace('\r', ' ').replace('\n', ' ')
+
+
+def scan_records(path, start=0):
+    """Yield (offset, length, row) for each complete CSV record from byte start."""
+    with open(path, 'rb') as file:
+        file.seek(start)
+        offset = start
+        pending = b''
+        pending_start = start
+        for line in file:
+            if not pending:
+                pending_start = offset
+            pending += line
+            offset += len(line)
+            if pending.count(b'"') % 2:
+                continue
+            if not line.endswith(b'\n'):
+                # The last record is still being written.
+                break
+            rows = list(csv.reader(io.StringIO(pending.decode('utf-8', errors='replace'), newline='')))
+            yield pending_start, len(pending), rows[0] if rows else []
+            pending = b''
+
+
+def encode_row(row):
+    """Return the bytes csv.writer would append for row."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(row)
+    return buffer.getvalue().encode('utf-8')
+
+
+class HistoryIndex:
+    """Persistent sidecar index for game_history.csv.
+
+    The ``.idx`` file holds one line per history row with its byte offset and
+    length, start time, winner and team names. It is loaded on first use,
+    caught up with any rows appended since it was written, and kept in
+    memory as a start-time ordering plus winner and team posting lists, so
+    queries only read the history rows they return.
+    """
+
+    def __init__(self, history_file, index_file=None):
+        self.history_file = history_file
+        self.index_file = index_file or os.path.splitext(history_file)[0] + '.idx'
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._reset()
+
+    def _reset(self):
+        self.columns = []
+        self.header_end = 0
+        self.entries = []
+        self._times = []
+        self._by_winner = {}
+        self._by_team = {}
+
+    @property
+    def covered(self):
+        """Byte offset in the history file up to which rows are indexed."""
+        if self.entries:
+            offset, length = self.entries[-1][:2]
+            return offset + length
+        return self.header_end
+
+    def invalidate(self):
+        """Drop the index; it is rebuilt from the history file on next use."""
+        with self._lock:
+            self._loaded = False
+            self._reset()
+            self._remove_index_file()
+
+    def _remove_index_file(self):
+        # The sidecar may already be gone: deleted by hand or by an earlier invalidate().
+        try:
+            os.remove(self.index_file)
+        except FileNotFoundError:
+            pass
+
+    def refresh(self):
+        """Index rows appended to the history file since the last refresh."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            else:
+                self._catch_up()
+
+    def _read_header(self):
+        for offset, length, row in scan_records(self.history_file):
+            self.columns = row
+            self.header_end = offset + length
+            return
+        self.columns = []
+        self.header_end = 0
+
+    def _load(self):
+        self._reset()
+        self._read_header()
+        if os.path.exists(self.index_file):
+            good_end = self._read_index_file()
+            if good_end is None:
+                self._remove_index_file()
+                self._reset()
+                self._read_header()
+            elif good_end < os.path.getsize(self.index_file):
+                with open(self.index_file, 'r+b') as file:
+                    file.truncate(good_end)
+        if not os.path.exists(self.index_file):
+            with open(self.index_file, 'w', encoding='utf-8', newline='\n') as file:
+                file.write(f'{INDEX_VERSION}\t{self.header_end}\n')
+        self._loaded = True
+        self._catch_up()
+
+    def _read_index_file(self):
+        """Load entries from the sidecar; returns the end of its last good line or None."""
+        with open(self.index_file, 'rb') as file:
+            first = file.readline()
+            parts = first.decode('utf-8', errors='replace').rstrip('\n').split('\t')
+            if parts[0] != INDEX_VERSION or len(parts) < 2 or int(parts[1]) != self.header_end:
+                return None
+            good_end = len(first)
+            for line in file:
+                if not line.endswith(b'\n'):
+                    break
+                fields = line.decode('utf-8').rstrip('\n').split('\t')
+                if len(fields) != 6:
+                    break
+                self._add((int(fields[0]), int(fields[1]), fields[2], fields[3], fields[4], fields[5]))
+                good_end += len(line)
+        if self.covered > os.path.getsize(self.history_file):
+            # The history file was truncated or replaced underneath the index.
+            return None
+        return good_end
+
+    def _catch_up(self):
+        if not os.path.exists(self.history_file):
+            return
+        size = os.path.getsize(self.history_file)
+        if size < self.covered:
+            self._reset()
+            self._remove_index_file()
+            self._load()
+            return
+        if size == self.covered:
+            return
+
+        position = {name: i for i, name in enumerate(self.columns)}
+        new_lines = []
+        for offset, length, row in scan_records(self.history_file, self.covered):
+            if not row:
+                continue
+            entry = (
+                offset,
+                length,
+                self._field(row, position, 'start_time'),
+                self._field(row, position, 'winner'),
+                self._field(row, position, 'ao_name'),
+                self._field(row, position, 'aka_name'),
+            )
+            self._add(entry)
+            new_lines.append('\t'.join(str(value) for value in entry) + '\n')
+        if new_lines:
+            with open(self.index_file, 'a', encoding='utf-8', newline='\n') as file:
+                file.write(''.join(new_lines))
+
+    @staticmethod
+    def _field(row, position, name):
+        index = position.get(name)
+        if index is None or index >= len(row):
+            return ''
+        return _clean(row[index])
+
+    def _add(self, entry):
+        seq = len(self.entries)
+        self.entries.append(entry)
+        item = (entry[2], seq)
+        if not self._times or self._times[-1] <= item:
+            self._times.append(item)
+        else:
+            bisect.insort(self._times, item)
+        if entry[3]:
+            self._by_winner.setdefault(entry[3].lower(), []).append(seq)
+        for name in {entry[4].lower(), entry[5].lower()}:
+            if name:
+                self._by_team.setdefault(name, []).append(seq)
+
+    def _select(self, start, end, winner, team, newest_first):
+        start = time_key(start)
+        end = time_key(end, end=True)
+        if winner is None and team is None:
+            lo = 0 if start is None else bisect.bisect_left(self._times, (start, -1))
+            hi = len(self._times) if end is None else bisect.bisect_right(self._times, (end, len(self.entries)))
+            seqs = [seq for _, seq in self._times[lo:hi]]
+        else:
+            candidates = None
+            if winner is not None:
+                candidates = self._by_winner.get(winner.lower(), [])
+            if team is not None:
+                team_seqs = self._by_team.get(team.lower(), [])
+                if candidates is None:
+                    candidates = team_seqs
+                else:
+                    members = set(team_seqs)
+                    candidates = [seq for seq in candidates if seq in members]
+            seqs = [
+                seq for seq in candidates
+                if (start is None or self.entries[seq][2] >= start) and (end is None or self.entries[seq][2] <= end)
+            ]
+            seqs.sort(key=lambda seq: (self.entries[seq][2], seq))
+        if newest_first:
+            seqs.reverse()
+        return seqs
+
+    def __len__(self):
+        with self._lock:
+            self.refresh()
+            return len(self.entries)
+
+    def offset_of(self, seq):
+        """Byte offset of row number seq, or the end of the indexed rows past the last one."""
+        with self._lock:
+            self.refresh()
+            return self.entries[seq][0] if seq < len(self.entries) else self.covered
+
+    def team_names(self):
+        """Distinct team names seen on either side, without reading the history file."""
+        with self._lock:
+            self.refresh()
+            return list({name for entry in self.entries for name in entry[4:6] if name})
+
+    def count(self, start=None, end=None, winner=None, team=None):
+        """Number of history rows matching the filters."""
+        with self._lock:
+            self.refresh()
+            return len(self._select(start, end, winner, team, False))
+
+    def query(self, start=None, end=None, winner=None, team=None, limit=None, offset=0, newest_first=False):
+        """Yield matching history rows as dicts, reading only the rows returned."""
+        with self._lock:
+            self.refresh()
+            seqs = self._select(start, end, winner, team, newest_first)
+            stop = None if limit is None else offset + limit
+            locations = [self.entries[seq][:2] for seq in seqs[offset:stop]]
+            columns = list(self.columns)
+        return self._read_rows(locations, columns)
+
+    def _read_rows(self, locations, columns):
+        if not locations:
+            return
+        with open(self.history_file, 'rb') as file:
+            for offset, length in locations:
+                file.seek(offset)
+                text = file.read(length).decode('utf-8', errors='replace')
+                row = next(csv.reader(io.StringIO(text, newline='')), [])
+                record = {name: '' for name in columns}
+                record.update(zip(columns, row))
+                yield record
@@ -0,0 +1,31 @@
+DEFAULT_HOTKEYS = {
+    "add_ao": "q",
+    "sub_ao": "a",
+    "add_aka": "p",
+    "sub_aka": "l",
+    "toggle_timer": "space",
+    "reset_timer": "r",
+}
+
+# Settings keys look like "hotkey_add_ao" with a Tk keysym as the value.
+SETTING_PREFIX = "hotkey_"
+
+
+def normalize_keysym(keysym):
+    """Single letters match regardless of Shift/Caps Lock."""
+    return keysym.lower() if len(keysym) == 1 else keysym
+
+
+def load_hotkeys(settings):
+    """Return {action: keysym}, applying any hotkey_<action> overrides from settings."""
+    hotkeys = dict(DEFAULT_HOTKEYS)
+    for action in DEFAULT_HOTKEYS:
+        value = settings.get(SETTING_PREFIX + action)
+        if isinstance(value, str) and value:
+            hotkeys[action] = value
+    return hotkeys
+
+
+def keysym_table(hotkeys):
+    """Return the {keysym: action} lookup used by the key handler."""
+    return {normalize_keysym(keysym): action for action, keysym in hotkeys.items()}
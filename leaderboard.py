@@ -0,0 +1,58 @@
+from tkinter import ttk
+
+from ratings import LEADERBOARD_SIZE
+
+COLUMNS = (
+    ("rank", "#", 50),
+    ("name", "Athlete", 260),
+    ("rating", "Rating", 90),
+    ("wins", "W", 60),
+    ("losses", "L", 60),
+    ("draws", "D", 60),
+    ("diff", "+/-", 80),
+)
+
+
+class LeaderboardPage(ttk.Frame):
+    """Standings read straight from the rating engine's aggregates."""
+
+    def __init__(self, master, controller):
+        super().__init__(master, style="Panel.TFrame")
+        self.controller = controller
+
+        header = ttk.Frame(self, style="Panel.TFrame")
+        header.pack(fill="x", padx=20, pady=(15, 5))
+        ttk.Label(header, text="Leaderboard", style="Heading.Panel.TLabel").pack(side="left")
+        ttk.Button(
+            header,
+            text="Back",
+            style="Panel.TButton",
+            cursor="hand2",
+            command=lambda: controller.show_frame("ScoreboardApp"),
+        ).pack(side="right")
+
+        body = ttk.Frame(self, style="Panel.TFrame")
+        body.pack(expand=True, fill="both", padx=20, pady=10)
+        self.table = ttk.Treeview(body, columns=[name for name, _, _ in COLUMNS], show="headings")
+        for name, heading, width in COLUMNS:
+            self.table.heading(name, text=heading)
+            self.table.column(name, width=width, anchor="w" if name == "name" else "center")
+        scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.table.yview)
+        self.table.configure(yscrollcommand=scrollbar.set)
+        self.table.pack(side="left", expand=True, fill="both")
+        scrollbar.pack(side="right", fill="y")
+
+        self.summary_label = ttk.Label(self, style="Status.Panel.TLabel")
+        self.summary_label.pack(pady=(0, 10))
+
+    def on_show(self):
+        self.refresh()
+
+    def refresh(self):
+        ratings = self.controller.get_ratings()
+        self.table.delete(*self.table.get_children())
+        for rank, team in enumerate(ratings.standings(LEADERBOARD_SIZE), start=1):
+            self.table.insert("", "end", values=(
+                rank, team.name, round(team.rating), team.wins, team.losses, team.draws, f"{team.point_diff:+d}",
+            ))
+        self.summary_label.config(text=f"{len(ratings.teams)} athletes rated")
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+from match_clock import DEFAULT_MATCH_DURATION, MatchClock
+from timeline import Timeline
+
+SIDES = ("ao", "aka")
+
+
+class Match:
+    """Scores, clock, score timeline and event-log identity of one bout on one mat."""
+
+    __slots__ = ("event_log", "label", "ao_name", "aka_name", "ao_score", "aka_score", "clock", "match_id", "timeline",
+                 "finished")
+
+    def __init__(self, event_log, ao_name="AO", aka_name="AKA", duration=DEFAULT_MATCH_DURATION, label=""):
+        self.event_log = event_log
+        self.label = label
+        self.ao_name = ao_name
+        self.aka_name = aka_name
+        self.ao_score = 0
+        self.aka_score = 0
+        self.clock = MatchClock(duration)
+        self.match_id = event_log.begin(ao_name, aka_name)
+        self.timeline = Timeline()
+        self.finished = False
+
+    def score(self, side, delta):
+        """Change side's score by delta (never below zero); returns the applied change."""
+        attribute = side + "_score"
+        current = getattr(self, attribute)
+        applied = max(0, current + delta) - current
+        if applied:
+            setattr(self, attribute, current + applied)
+            # Stamped with the match clock, so idle time and pauses stay out of replays.
+            elapsed = self.clock.elapsed()
+            self.event_log.score(self.match_id, side, applied, elapsed)
+            self.timeline.record(side, applied, elapsed)
+        return applied
+
+    def new_match(self):
+        """Start a new match in the event log, carrying over the current names and scores."""
+        self.match_id = self.event_log.begin(self.ao_name, self.aka_name, self.ao_score, self.aka_score)
+        self.timeline = Timeline(self.ao_score, self.aka_score)
+        self.finished = False
+
+    def reset(self, duration=None):
+        self.clock.reset(duration)
+        self.new_match()
+
+    def finish(self):
+        """Record the final names and scores in the event log; returns False if this match already finished."""
+        if self.finished:
+            return False
+        self.finished = True
+        self.event_log.end(self.match_id, self.ao_name, self.ao_score, self.aka_name, self.aka_score)
+        return True
+
+    def times(self):
+        """(start, end) datetimes for the history log: now, minus the time the clock has run."""
+        end_time = datetime.now()
+        return end_time - timedelta(seconds=self.clock.elapsed()), end_time
+
+    @property
+    def winner(self):
+        if self.ao_score > self.aka_score:
+            return self.ao_name
+        if self.aka_score > self.ao_score:
+            return self.aka_name
+        return ""
@@ -0,0 +1,83 @@
+import math
+import time
+
+DEFAULT_MATCH_DURATION = 10
+MATCH_DURATIONS = [10, 60, 90, 120, 180]
+
+# Below this many seconds the clock shows tenths.
+TENTHS_THRESHOLD = 10
+
+
+def format_duration(seconds):
+    """Format whole seconds as M:SS."""
+    seconds = int(seconds)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+class MatchClock:
+    """Countdown clock computed from time.monotonic() instead of tick counting.
+
+    Elapsed time is accumulated only across start/pause boundaries, so the
+    remaining time is exact no matter how late the display callbacks run.
+    """
+
+    def __init__(self, duration=DEFAULT_MATCH_DURATION, clock=time.monotonic):
+        self.duration = float(duration)
+        self._clock = clock
+        self._elapsed = 0.0
+        self._started_at = None
+
+    @property
+    def running(self):
+        if self._started_at is not None and self._clock() - self._started_at + self._elapsed >= self.duration:
+            self._elapsed = self.duration
+            self._started_at = None
+        return self._started_at is not None
+
+    def start(self):
+        """Start or resume the countdown; returns False when already expired."""
+        if self.expired():
+            return False
+        if self._started_at is None:
+            self._started_at = self._clock()
+        return True
+
+    def pause(self):
+        if self._started_at is not None:
+            self._elapsed = min(self.duration, self._elapsed + self._clock() - self._started_at)
+            self._started_at = None
+
+    def reset(self, duration=None):
+        if duration is not None:
+            self.duration = float(duration)
+        self._elapsed = 0.0
+        self._started_at = None
+
+    def elapsed(self):
+        elapsed = self._elapsed
+        if self._started_at is not None:
+            elapsed += self._clock() - self._started_at
+        return min(self.duration, elapsed)
+
+    def remaining(self):
+        return self.duration - self.elapsed()
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def display(self):
+        """Return the clock text, with tenths during the last seconds."""
+        remaining = self.remaining()
+        if remaining < TENTHS_THRESHOLD:
+            tenths = math.ceil(round(remaining * 10, 6))
+            return f"0:{tenths // 10:02d}.{tenths % 10}"
+        return format_duration(math.ceil(round(remaining, 6)))
+
+    def until_next_change(self):
+        """Seconds until display() will return a different text."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            return 0.0
+        step = 0.1 if remaining <= TENTHS_THRESHOLD else 1.0
+        delay = remaining - (math.ceil(round(remaining / step, 6)) - 1) * step
+        return max(0.001, delay)
@@ -0,0 +1,185 @@
+"""Win/loss records, point differential and Elo ratings from game history.
+
+    python ratings.py rebuild
+
+The engine keeps its aggregates in data/ratings.json together with the
+history position they cover. Opening it applies only the results logged
+since that position, and every new result is applied once its history row
+is written.
+"""
+import heapq
+import json
+import os
+import sys
+
+RATINGS_FILE = os.path.join("data", "ratings.json")
+SNAPSHOT_VERSION = 2
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+
+LEADERBOARD_SIZE = 100
+
+
+class TeamRecord:
+    """Running totals for one athlete or team."""
+
+    __slots__ = ("name", "wins", "losses", "draws", "points_for", "points_against", "rating")
+
+    def __init__(self, name, wins=0, losses=0, draws=0, points_for=0, points_against=0, rating=INITIAL_RATING):
+        self.name = name
+        self.wins = wins
+        self.losses = losses
+        self.draws = draws
+        self.points_for = points_for
+        self.points_against = points_against
+        self.rating = rating
+
+    @property
+    def matches(self):
+        return self.wins + self.losses + self.draws
+
+    @property
+    def point_diff(self):
+        return self.points_for - self.points_against
+
+    def to_list(self):
+        return [getattr(self, field) for field in self.__slots__]
+
+
+def expected_score(rating, opponent_rating):
+    return 1.0 / (1.0 + 10 ** ((opponent_rating - rating) / 400.0))
+
+
+def _score(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RatingEngine:
+    """Incrementally maintained standings over a storage backend's game history."""
+
+    def __init__(self, storage, snapshot_file=RATINGS_FILE):
+        self.storage = storage
+        self.snapshot_file = snapshot_file
+        self.teams = {}
+        self.cursor = 0
+        self.dirty = False
+
+    def load(self):
+        """Read the snapshot and apply the results logged after it; rebuilds if it is unusable."""
+        if not self._read_snapshot() or self.cursor > self.storage.history_cursor():
+            self.teams = {}
+            self.cursor = 0
+        for record in self.storage.history_since(self.cursor):
+            self.apply(record)
+        self.cursor = self.storage.history_cursor()
+        return self
+
+    def _read_snapshot(self):
+        try:
+            with open(self.snapshot_file) as file:
+                snapshot = json.load(file)
+        except (OSError, ValueError):
+            return False
+        if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("backend") != type(self.storage).__name__:
+            return False
+        self.cursor = snapshot["cursor"]
+        self.teams = {name.casefold(): TeamRecord(name, *values) for name, *values in snapshot["teams"]}
+        return True
+
+    def save(self):
+        """Write the aggregates and the history position they cover."""
+        if not self.dirty and os.path.exists(self.snapshot_file):
+            return
+        self.cursor = self.storage.history_cursor()
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "backend": type(self.storage).__name__,
+            "cursor": self.cursor,
+            "teams": [team.to_list() for team in self.teams.values()],
+        }
+        os.makedirs(os.path.dirname(self.snapshot_file) or ".", exist_ok=True)
+        tmp_path = self.snapshot_file + ".tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(snapshot, file, separators=(",", ":"))
+        os.replace(tmp_path, self.snapshot_file)
+        self.dirty = False
+
+    def rebuild(self):
+        """Recompute everything from the full history."""
+        self.teams = {}
+        self.cursor = 0
+        self.dirty = True
+        for record in self.storage.history_since(0):
+            self.apply(record)
+        self.save()
+        return self
+
+    def team(self, name):
+        key = name.casefold()
+        team = self.teams.get(key)
+        if team is None:
+            team = self.teams[key] = TeamRecord(name)
+        return team
+
+    def apply(self, record):
+        """Fold one game history record into the standings; rows without both names are skipped."""
+        ao_name = " ".join(record.get("ao_name", "").split())
+        aka_name = " ".join(record.get("aka_name", "").split())
+        ao_score = _score(record.get("ao_score"))
+        aka_score = _score(record.get("aka_score"))
+        if not ao_name or not aka_name or ao_score is None or aka_score is None:
+            return False
+        if ao_name.casefold() == aka_name.casefold():
+            return False
+
+        ao, aka = self.team(ao_name), self.team(aka_name)
+        ao.points_for += ao_score
+        ao.points_against += aka_score
+        aka.points_for += aka_score
+        aka.points_against += ao_score
+        if ao_score > aka_score:
+            ao.wins += 1
+            aka.losses += 1
+            result = 1.0
+        elif aka_score > ao_score:
+            aka.wins += 1
+            ao.losses += 1
+            result = 0.0
+        else:
+            ao.draws += 1
+            aka.draws += 1
+            result = 0.5
+
+        change = K_FACTOR * (result - expected_score(ao.rating, aka.rating))
+        ao.rating += change
+        aka.rating -= change
+        self.dirty = True
+        return True
+
+    def standings(self, limit=LEADERBOARD_SIZE):
+        """Best-rated teams first."""
+        return heapq.nlargest(limit, self.teams.values(), key=lambda team: (team.rating, team.point_diff))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv != ["rebuild"]:
+        print("usage: python ratings.py rebuild")
+        return 2
+    from backend import open_storage
+
+    storage = open_storage()
+    try:
+        engine = RatingEngine(storage).rebuild()
+    finally:
+        storage.close()
+    print(f"ratings rebuilt for {len(engine.teams)} teams")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
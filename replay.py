@@ -0,0 +1,114 @@
+import tkinter as tk
+from tkinter import ttk
+
+from timeline import format_offset
+
+
+class ReplayPage(ttk.Frame):
+    """Scrub through a match's score timeline for protest review.
+
+    Dragging the slider asks the timeline for the score at that instant,
+    which is a bisect plus a short sum, so long matches scrub as fast as
+    short ones. Repaints are coalesced to one per animator frame.
+    """
+
+    def __init__(self, master, controller):
+        super().__init__(master, style="Panel.TFrame")
+        self.controller = controller
+        self.timeline = None
+        self.return_page = "ScoreboardApp"
+
+        header = ttk.Frame(self, style="Panel.TFrame")
+        header.pack(fill="x", padx=20, pady=(15, 5))
+        ttk.Label(header, text="Replay", style="Heading.Panel.TLabel").pack(side="left")
+        ttk.Button(
+            header, text="Back", style="Panel.TButton", cursor="hand2",
+            command=lambda: controller.show_frame(self.return_page),
+        ).pack(side="right")
+
+        body = ttk.Frame(self, style="Panel.TFrame", padding=(20, 10))
+        body.pack(expand=True, fill="both")
+        self.title_label = ttk.Label(body, style="Detail.Panel.TLabel")
+        self.title_label.grid(row=0, column=0, columnspan=2, pady=(0, 10))
+
+        self.score_labels = {}
+        for column, side in ((0, "ao"), (1, "aka")):
+            panel = ttk.Frame(body, style=side.upper() + ".TFrame", padding=(20, 15), borderwidth=2, relief="ridge")
+            panel.grid(row=1, column=column, padx=10, pady=10, sticky="nsew")
+            self.score_labels[side] = ttk.Label(panel, text="0", style=f"Score.{side.upper()}.TLabel")
+            self.score_labels[side].pack(fill="x")
+            body.grid_columnconfigure(column, weight=1)
+
+        self.time_label = ttk.Label(body, text=format_offset(0), style="Timer.TLabel")
+        self.time_label.grid(row=2, column=0, columnspan=2, pady=10, sticky="ew")
+
+        self.position = tk.DoubleVar(value=0.0)
+        self.scale = ttk.Scale(
+            body, from_=0.0, to=1.0, orient="horizontal", variable=self.position,
+            command=lambda value: self._scrubbed(),
+        )
+        self.scale.grid(row=3, column=0, columnspan=2, pady=10, sticky="ew")
+
+        controls = ttk.Frame(body, style="Panel.TFrame")
+        controls.grid(row=4, column=0, columnspan=2, pady=10)
+        for text, command in (
+            ("|<", lambda: self.seek(0.0)),
+            ("< Event", lambda: self.step(-1)),
+            ("Event >", lambda: self.step(1)),
+            (">|", lambda: self.seek(self.timeline.duration if self.timeline else 0.0)),
+        ):
+            ttk.Button(controls, text=text, style="Panel.TButton", cursor="hand2", command=command).pack(
+                side="left", padx=8
+            )
+
+        self.status_label = ttk.Label(body, style="Status.Panel.TLabel")
+        self.status_label.grid(row=5, column=0, columnspan=2)
+
+    def load(self, timeline, title, return_page):
+        """Show timeline, positioned at its last event."""
+        self.timeline = timeline
+        self.return_page = return_page
+        self.title_label.config(text=title)
+        self.scale.config(to=max(timeline.duration, 1.0))
+        self.seek(timeline.duration)
+
+    def seek(self, seconds):
+        self.position.set(seconds)
+        self._scrubbed()
+
+    def step(self, direction):
+        """Jump to the previous or next scoring event."""
+        if self.timeline is None or not len(self.timeline):
+            return
+        seconds = self.position.get()
+        count = self.timeline.count_at(seconds)
+        if direction > 0:
+            index = count
+        else:
+            index = count - 1
+            # Sitting on an event already: go to the one before it.
+            if index >= 0 and self.timeline.offsets[index] >= round(seconds * 1000):
+                index -= 1
+        if index < 0:
+            self.seek(0.0)
+        elif index < len(self.timeline):
+            self.seek(self.timeline.event(index)[0])
+
+    def _scrubbed(self):
+        self.controller.animator.request_frame(self._render, key=(self, "render"))
+
+    def _render(self):
+        if self.timeline is None:
+            return
+        seconds = self.position.get()
+        ao_score, aka_score, count = self.timeline.score_at(seconds)
+        animator = self.controller.animator
+        animator.set(self.score_labels["ao"], text=str(ao_score))
+        animator.set(self.score_labels["aka"], text=str(aka_score))
+        animator.set(self.time_label, text=format_offset(seconds))
+        if count:
+            offset, side, delta = self.timeline.event(count - 1)
+            last = f"  |  last: {side.upper()} {delta:+d} at {format_offset(offset)}"
+        else:
+            last = ""
+        animator.set(self.status_label, text=f"Event {count} of {len(self.timeline)}{last}")
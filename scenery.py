@@ -0,0 +1,253 @@
+import hashlib
+import json
+import os
+
+from PIL import Image, ImageDraw
+
+CACHE_DIR = os.path.join("data", "cache", "backgrounds")
+
+# Bump when the drawing code below changes in a way SCENE does not capture.
+RENDER_VERSION = 1
+
+SCENE = {
+    "sky_colors": [(10, 25, 70), (25, 76, 146), (82, 137, 217), (176, 214, 235)],
+    "sky_steps": 150,
+    "sun": {
+        "x": 1150,
+        "y": 120,
+        "radius": 70,
+        "ring_step": 12,
+        "rings": ["#FFFACD", "#FFF68F", "#FFEF6E", "#FFD700"],
+        "core": "#FFEA00",
+    },
+    "clouds": {
+        "positions": [(200, 120, 120), (600, 90, 150), (900, 150, 100), (1100, 130, 130)],
+        "fill": "white",
+    },
+    "grass": {
+        "height": 60,
+        "spacing": 15,
+        "blade_width": 14,
+        "blade_height": 30,
+        "fill": "#228B22",
+        "outline": "#176917",
+    },
+    "trees": {
+        "offset_y": 180,
+        "left_x": 80,
+        "right_margin": 200,
+        "trunk": ((10, 0, 30, 100), "#5D3A00", "#3E2700"),
+        "left_crowns": [
+            ((-50, -120, 70, 20), "#065214", "#033d0a"),
+            ((-40, -150, 60, -40), "#0A7B1E", "#05460d"),
+            ((-20, -180, 40, -80), "#0B9D2D", "#057318"),
+        ],
+        "right_crowns": [
+            ((-30, -120, 90, 20), "#065214", "#033d0a"),
+            ((-20, -150, 80, -40), "#0A7B1E", "#05460d"),
+            ((0, -180, 60, -80), "#0B9D2D", "#057318"),
+        ],
+    },
+}
+
+
+def scene_fingerprint(fill):
+    """Hash of every parameter that affects the rendered scene."""
+    payload = json.dumps({"version": RENDER_VERSION, "scene": SCENE, "fill": fill}, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def sky_gradient(width, height):
+    """Return (y1, y2, color) strips of the sky gradient."""
+    colors = SCENE["sky_colors"]
+    steps = SCENE["sky_steps"]
+    section = steps / (len(colors) - 1)
+    strips = []
+    for i in range(steps):
+        section_index = min(int(i / section), len(colors) - 2)
+        color1 = colors[section_index]
+        color2 = colors[section_index + 1]
+        ratio = (i % section) / section
+        r = int(color1[0] + (color2[0] - color1[0]) * ratio)
+        g = int(color1[1] + (color2[1] - color1[1]) * ratio)
+        b = int(color1[2] + (color2[2] - color1[2]) * ratio)
+        y1 = int(i * height / steps)
+        y2 = int((i + 1) * height / steps)
+        strips.append((y1, y2, f"#{r:02x}{g:02x}{b:02x}"))
+    return strips
+
+
+def sun_rings(x, y, radius):
+    """Return (box, color) discs of the sun, outermost first."""
+    sun = SCENE["sun"]
+    discs = []
+    for i, color in enumerate(sun["rings"][::-1]):
+        r = radius + i * sun["ring_step"]
+        discs.append(((x - r, y - r, x + r, y + r), color))
+    discs.append(((x - radius, y - radius, x + radius, y + radius), sun["core"]))
+    return discs
+
+
+def cloud_circles(x, y, size):
+    """Return the bounding boxes of the circles making up one cloud."""
+    radius = size // 4
+    centers = [
+        (x, y),
+        (x + radius * 1.2, y - radius // 2),
+        (x + radius * 2.5, y - radius // 4),
+        (x + radius * 3.7, y),
+        (x + radius * 4.5, y - radius // 3),
+    ]
+    return [(cx - radius, cy - radius, cx + radius, cy + radius) for cx, cy in centers]
+
+
+def grass_blades(x_start, y_start, width_area):
+    """Return the triangle points of every grass blade."""
+    grass = SCENE["grass"]
+    blades = []
+    for i in range(0, width_area, grass["spacing"]):
+        x = x_start + i
+        blades.append([
+            x, y_start,
+            x + grass["blade_width"] // 2, y_start - grass["blade_height"],
+            x + grass["blade_width"], y_start,
+        ])
+    return blades
+
+
+def tree_parts(x, y, crowns):
+    """Return (kind, box, fill, outline) parts of a tree anchored at x, y."""
+    (tx1, ty1, tx2, ty2), trunk_fill, trunk_outline = SCENE["trees"]["trunk"]
+    parts = [("rectangle", (x + tx1, y + ty1, x + tx2, y + ty2), trunk_fill, trunk_outline)]
+    for (cx1, cy1, cx2, cy2), fill, outline in crowns:
+        parts.append(("oval", (x + cx1, y + cy1, x + cx2, y + cy2), fill, outline))
+    return parts
+
+
+def tree_positions(width, height):
+    """Return (x, y, crowns) for the left and right tree."""
+    trees = SCENE["trees"]
+    y = height - trees["offset_y"]
+    return [
+        (trees["left_x"], y, trees["left_crowns"]),
+        (width - trees["right_margin"], y, trees["right_crowns"]),
+    ]
+
+
+def _hex(color):
+    return "#ffffff" if color == "white" else color
+
+
+def scene_palette(theme, width, height, fill):
+    """Return {key: color} for every recolorable group of scene items.
+
+    Each key is also the canvas tag of its group; "<key>_outline" holds the
+    group's outline color. The light theme has no scene, so every group
+    takes the page fill and the scene fades out into the background.
+    """
+    sun = SCENE["sun"]
+    grass = SCENE["grass"]
+    (_, trunk_fill, trunk_outline) = SCENE["trees"]["trunk"]
+    colors = {f"scene_sky_{i}": color for i, (_, _, color) in enumerate(sky_gradient(width, height))}
+    colors.update(
+        (f"scene_sun_{i}", color) for i, (_, color) in enumerate(sun_rings(sun["x"], sun["y"], sun["radius"]))
+    )
+    colors.update({
+        "scene_cloud": _hex(SCENE["clouds"]["fill"]),
+        "scene_grass": grass["fill"],
+        "scene_grass_outline": grass["outline"],
+        "scene_trunk": trunk_fill,
+        "scene_trunk_outline": trunk_outline,
+    })
+    for i, (_, crown_fill, crown_outline) in enumerate(SCENE["trees"]["left_crowns"]):
+        colors[f"scene_crown_{i}"] = crown_fill
+        colors[f"scene_crown_{i}_outline"] = crown_outline
+    if theme == "light":
+        return {key: fill for key in colors}
+    return colors
+
+
+def render_background(theme, width, height, fill):
+    """Draw the complete static scene for a theme into a Pillow image."""
+    image = Image.new("RGB", (width, height), fill)
+    if theme == "light":
+        return image
+
+    draw = ImageDraw.Draw(image)
+    for y1, y2, color in sky_gradient(width, height):
+        if y2 > y1:
+            draw.rectangle((0, y1, width, y2 - 1), fill=color)
+
+    sun = SCENE["sun"]
+    for box, color in sun_rings(sun["x"], sun["y"], sun["radius"]):
+        draw.ellipse(box, fill=color)
+
+    for x, y, size in SCENE["clouds"]["positions"]:
+        for box in cloud_circles(x, y, size):
+            draw.ellipse(box, fill=SCENE["clouds"]["fill"])
+
+    grass = SCENE["grass"]
+    for points in grass_blades(0, height - grass["height"], width):
+        draw.polygon(points, fill=grass["fill"], outline=grass["outline"])
+
+    for x, y, crowns in tree_positions(width, height):
+        for kind, box, part_fill, outline in tree_parts(x, y, crowns):
+            if kind == "rectangle":
+                draw.rectangle(box, fill=part_fill, outline=outline)
+            else:
+                draw.ellipse(box, fill=part_fill, outline=outline)
+    return image
+
+
+class BackgroundCache:
+    """Rendered backgrounds cached in memory and on disk by (theme, width, height)."""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._memory = {}
+
+    def _path(self, theme, width, height, fingerprint):
+        return os.path.join(self.cache_dir, f"{theme}_{width}x{height}_{fingerprint}.png")
+
+    def get(self, theme, width, height, fill):
+        """Return the background image, rendering it only on a cache miss."""
+        fingerprint = scene_fingerprint(fill)
+        key = (theme, width, height, fingerprint)
+        image = self._memory.get(key)
+        if image is not None:
+            return image
+
+        path = self._path(theme, width, height, fingerprint)
+        try:
+            with Image.open(path) as cached:
+                image = cached.convert("RGB")
+        except (OSError, ValueError):
+            image = render_background(theme, width, height, fill)
+            self._store(theme, width, height, fingerprint, image)
+
+        self._memory[key] = image
+        return image
+
+    def _store(self, theme, width, height, fingerprint, image):
+        """Write the image to disk and drop stale renders of the same slot."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(theme, width, height, fingerprint)
+            tmp_path = path + ".tmp"
+            image.save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+
+            prefix = f"{theme}_{width}x{height}_"
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(prefix) and name != os.path.basename(path):
+                    os.remove(os.path.join(self.cache_dir, name))
+        except OSError:
+            # The disk cache is an optimisation only; the in-memory copy is enough.
+            pass
+
+    def clear(self):
+        """Forget every in-memory render."""
+        self._memory.clear()
+
+
+BACKGROUNDS = BackgroundCache()
@@ -0,0 +1,372 @@
+"""Rotation of the append-only CSV logs into gzip segments.
+
+    python segments.py status
+    python segments.py rotate [--force]
+    python segments.py compact [--target-bytes N]
+
+A log keeps a small "hot" CSV file that the app appends to. When the hot
+file passes a size limit, or a new day or month starts, it is moved into
+data/archive/<log>/ as a numbered gzip segment. A manifest.json file in the
+same folder records the row count, time range and team names of every
+segment. Readers stream the segments in order and then the hot file, and
+they skip segments whose time range is outside the query. Compaction merges
+runs of small segments into larger ones.
+"""
+import argparse
+import csv
+import gzip
+import json
+import os
+import shutil
+import sys
+from datetime import datetime
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+COMPACT_TARGET_BYTES = 16 * 1024 * 1024
+MANIFEST_VERSION = 1
+
+PERIOD_FORMATS = {"day": "%Y-%m-%d", "month": "%Y-%m"}
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class SegmentedLog:
+    """One append-only CSV file plus its archived gzip segments.
+
+    Rotation moves the hot file aside with an atomic rename before
+    compressing it. If the app stops halfway, the leftover ``.rotating``
+    file is archived the next time the log is opened.
+    """
+
+    def __init__(self, path, time_field=None, name_fields=(), header=True, max_bytes=DEFAULT_MAX_BYTES,
+                 period=None, archive_dir=None):
+        if period is not None and period not in PERIOD_FORMATS:
+            raise ValueError(f"Unknown rotation period: {period}")
+        self.path = path
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        self.time_field = time_field
+        self.name_fields = tuple(name_fields)
+        self.header = header
+        self.max_bytes = max_bytes
+        self.period = period
+        self.archive_dir = archive_dir or os.path.join(os.path.dirname(path) or ".", "archive", self.name)
+        self.manifest_file = os.path.join(self.archive_dir, "manifest.json")
+        self.rotating_file = path + ".rotating"
+        self.manifest = self._read_manifest()
+        self._recover()
+
+    # Manifest ---------------------------------------------------------------
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_file) as file:
+                manifest = json.load(file)
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"version": MANIFEST_VERSION, "next_seq": 1, "hot_since": None, "segments": []}
+
+    def _write_manifest(self):
+        os.makedirs(self.archive_dir, exist_ok=True)
+        tmp_path = self.manifest_file + ".tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(self.manifest, file, indent=1)
+        os.replace(tmp_path, self.manifest_file)
+
+    @property
+    def segments(self):
+        return self.manifest["segments"]
+
+    @property
+    def archived_rows(self):
+        return sum(segment["rows"] for segment in self.segments)
+
+    def archived_names(self):
+        """Distinct values of the name fields across all segments."""
+        return {name for segment in self.segments for name in segment.get("names", ())}
+
+    def segment_path(self, segment):
+        return os.path.join(self.archive_dir, segment["file"])
+
+    # Rotation ---------------------------------------------------------------
+
+    def _header_line(self, path):
+        if not self.header:
+            return b""
+        with open(path, "rb") as file:
+            return file.readline()
+
+    def should_rotate(self, now=None):
+        """True when the hot file holds rows and is over the size limit or from an earlier period."""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return False
+        if size <= len(self._header_line(self.path)):
+            return False
+        if self.max_bytes is not None and size >= self.max_bytes:
+            return True
+        if self.period is not None:
+            hot_since = self.manifest["hot_since"]
+            if hot_since is None:
+                self.manifest["hot_since"] = (now or datetime.now()).strftime(TIME_FORMAT)
+                self._write_manifest()
+                return False
+            period_format = PERIOD_FORMATS[self.period]
+            started = datetime.strptime(hot_since, TIME_FORMAT)
+            return started.strftime(period_format) != (now or datetime.now()).strftime(period_format)
+        return False
+
+    def rotate(self, force=False):
+        """Archive the hot file if it is due (or force is set); returns True if a segment was written.
+
+        Must not run while other code is appending to or reading the hot file.
+        """
+        if not (self.should_rotate() or force and self._has_rows()):
+            return False
+        header = self._header_line(self.path)
+        os.replace(self.path, self.rotating_file)
+        with open(self.path, "wb") as file:
+            file.write(header)
+        self._archive_rotating()
+        return True
+
+    def _has_rows(self):
+        return os.path.exists(self.path) and os.path.getsize(self.path) > len(self._header_line(self.path))
+
+    def _stats(self, path):
+        rows, first, last, names = 0, None, None, set()
+        with open(path, newline="") as file:
+            if not self.header:
+                return {"rows": sum(1 for _ in csv.reader(file)), "first": None, "last": None, "names": []}
+            for record in csv.DictReader(file):
+                rows += 1
+                if self.time_field:
+                    value = record.get(self.time_field) or ""
+                    if value:
+                        first = value if first is None or value < first else first
+                        last = value if last is None or value > last else last
+                for field in self.name_fields:
+                    if record.get(field):
+                        names.add(record[field])
+        return {"rows": rows, "first": first, "last": last, "names": sorted(names)}
+
+    def _recover(self):
+        """Finish a rotation that was interrupted."""
+        last = self.segments[-1] if self.segments else None
+        pending = last is not None and last.get("pending_cleanup")
+        if os.path.exists(self.rotating_file):
+            if pending and last.get("source_bytes") == os.path.getsize(self.rotating_file):
+                # The segment was written and recorded; only the cleanup was missed.
+                os.remove(self.rotating_file)
+            else:
+                self._archive_rotating()
+                return
+        if pending:
+            del last["pending_cleanup"]
+            self._write_manifest()
+
+    def _archive_rotating(self):
+        source_bytes = os.path.getsize(self.rotating_file)
+        os.makedirs(self.archive_dir, exist_ok=True)
+        seq = self.manifest["next_seq"]
+        segment = {"file": f"{self.name}.{seq:06d}.csv.gz", "source_bytes": source_bytes}
+        segment.update(self._stats(self.rotating_file))
+        path = self.segment_path(segment)
+        with open(self.rotating_file, "rb") as source, gzip.open(path + ".tmp", "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.replace(path + ".tmp", path)
+        segment["bytes"] = os.path.getsize(path)
+        segment["pending_cleanup"] = True
+        self.segments.append(segment)
+        self.manifest["next_seq"] = seq + 1
+        self.manifest["hot_since"] = datetime.now().strftime(TIME_FORMAT)
+        self._write_manifest()
+        os.remove(self.rotating_file)
+        del segment["pending_cleanup"]
+        self._write_manifest()
+
+    # Reading ----------------------------------------------------------------
+
+    def _overlaps(self, segment, start, end):
+        if start is not None and segment.get("last") and segment["last"] < start:
+            return False
+        if end is not None and segment.get("first") and segment["first"] > end:
+            return False
+        return True
+
+    def covers(self, segment, start, end):
+        """True when every record of segment falls between start and end."""
+        if start is not None and not (segment.get("first") and segment["first"] >= start):
+            return False
+        if end is not None and not (segment.get("last") and segment["last"] <= end):
+            return False
+        return True
+
+    def segments_in(self, start=None, end=None, reverse=False):
+        """Segments that may hold records between start and end, oldest first unless reverse is set."""
+        segments = [segment for segment in self.segments if self._overlaps(segment, start, end)]
+        if reverse:
+            segments.reverse()
+        return segments
+
+    def segment_records(self, segment, reverse=False):
+        """Stream the records of one segment; reverse holds that one segment in memory."""
+        with gzip.open(self.segment_path(segment), "rt", newline="") as file:
+            if not reverse:
+                yield from self._records(file, 0)
+                return
+            records = list(self._records(file, 0))
+        yield from reversed(records)
+
+    def iter_files(self, include_hot=True):
+        """Yield an open text file for each segment in order, then the hot file."""
+        for segment in list(self.segments):
+            with gzip.open(self.segment_path(segment), "rt", newline="") as file:
+                yield file
+        if include_hot:
+            with open(self.path, newline="") as file:
+                yield file
+
+    def iter_records(self, start=None, end=None, skip=0, include_hot=True):
+        """Stream records (dicts, or lists for headerless logs) across segments and the hot file.
+
+        start/end are time_field strings; segments entirely outside them are
+        not opened, but records inside opened files are not filtered. skip
+        drops that many records from the beginning, skipping whole segments
+        without reading them.
+        """
+        for segment in list(self.segments):
+            if skip >= segment["rows"]:
+                skip -= segment["rows"]
+                continue
+            if not self._overlaps(segment, start, end):
+                skip = 0
+                continue
+            with gzip.open(self.segment_path(segment), "rt", newline="") as file:
+                yield from self._records(file, skip)
+            skip = 0
+        if include_hot and os.path.exists(self.path):
+            with open(self.path, newline="") as file:
+                yield from self._records(file, skip)
+
+    def _records(self, file, skip):
+        reader = csv.DictReader(file) if self.header else csv.reader(file)
+        for record in reader:
+            if skip:
+                skip -= 1
+                continue
+            yield record
+
+    # Compaction -------------------------------------------------------------
+
+    def compact(self, target_bytes=COMPACT_TARGET_BYTES):
+        """Merge runs of adjacent segments that fit in target_bytes together; returns segments removed."""
+        groups, group = [], []
+        for segment in self.segments:
+            if group and (
+                sum(item["bytes"] for item in group) + segment["bytes"] > target_bytes
+                or self._segment_header(group[0]) != self._segment_header(segment)
+            ):
+                groups.append(group)
+                group = []
+            group.append(segment)
+        if group:
+            groups.append(group)
+
+        removed = []
+        segments = []
+        for group in groups:
+            if len(group) == 1:
+                segments.append(group[0])
+                continue
+            segments.append(self._merge(group))
+            removed.extend(group)
+        if not removed:
+            return 0
+        self.manifest["segments"] = segments
+        self._write_manifest()
+        for segment in removed:
+            os.remove(self.segment_path(segment))
+        self._remove_orphans()
+        return len(removed)
+
+    def _segment_header(self, segment):
+        if not self.header:
+            return b""
+        with gzip.open(self.segment_path(segment), "rb") as file:
+            return file.readline()
+
+    def _merge(self, group):
+        seq = self.manifest["next_seq"]
+        self.manifest["next_seq"] = seq + 1
+        merged = {"file": f"{self.name}.{seq:06d}.csv.gz"}
+        path = self.segment_path(merged)
+        with gzip.open(path + ".tmp", "wb") as target:
+            for position, segment in enumerate(group):
+                with gzip.open(self.segment_path(segment), "rb") as source:
+                    if self.header and position:
+                        source.readline()
+                    shutil.copyfileobj(source, target)
+        os.replace(path + ".tmp", path)
+        firsts = [segment["first"] for segment in group if segment.get("first")]
+        lasts = [segment["last"] for segment in group if segment.get("last")]
+        merged.update({
+            "rows": sum(segment["rows"] for segment in group),
+            "first": min(firsts) if firsts else None,
+            "last": max(lasts) if lasts else None,
+            "names": sorted({name for segment in group for name in segment.get("names", ())}),
+            "bytes": os.path.getsize(path),
+        })
+        return merged
+
+    def _remove_orphans(self):
+        """Delete segment files left behind by an interrupted compaction."""
+        known = {segment["file"] for segment in self.segments}
+        for entry in os.listdir(self.archive_dir):
+            if entry.startswith(self.name + ".") and entry.endswith((".csv.gz", ".csv.gz.tmp")) and entry not in known:
+                os.remove(os.path.join(self.archive_dir, entry))
+
+    def status(self):
+        hot_bytes = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return {
+            "log": self.name,
+            "hot_bytes": hot_bytes,
+            "segments": len(self.segments),
+            "archived_rows": self.archived_rows,
+            "archived_bytes": sum(segment["bytes"] for segment in self.segments),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rotate and compact the CSV logs in data/")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status")
+    rotate = commands.add_parser("rotate")
+    rotate.add_argument("--force", action="store_true", help="archive the hot files even if they are not due")
+    compact = commands.add_parser("compact")
+    compact.add_argument("--target-bytes", type=int, default=COMPACT_TARGET_BYTES)
+    args = parser.parse_args(argv)
+
+    from backend import CSVHandler, configured_rotation
+
+    rotate_bytes, rotate_period = configured_rotation()
+    handler = CSVHandler(rotate=False, rotate_bytes=rotate_bytes, rotate_period=rotate_period)
+    try:
+        if args.command == "rotate":
+            rotated = handler.rotate_logs(force=args.force)
+            print(f"rotated: {', '.join(rotated) or 'nothing due'}")
+        elif args.command == "compact":
+            for log in handler.logs:
+                print(f"{log.name}: merged {log.compact(args.target_bytes)} segments")
+        for log in handler.logs:
+            status = log.status()
+            print(f"{status['log']:<16} hot {status['hot_bytes']:>10} B  {status['segments']:>4} segments  "
+                  f"{status['archived_rows']:>9} rows  {status['archived_bytes']:>10} B archived")
+    finally:
+        handler.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+import atexit
+from datetime import datetime
+import os
+import sqlite3
+import sys
+import threading
+
+from backend import BackgroundWriter, notify_when_written
+from history_index import time_key
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+    "CREATE TABLE IF NOT EXISTS team_members (id INTEGER PRIMARY KEY, name TEXT NOT NULL, nim TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS scoreboard (position INTEGER PRIMARY KEY, team_name TEXT NOT NULL, "
+    "score INTEGER NOT NULL, last_updated TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS settings (setting_name TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS saved_scores (id INTEGER PRIMARY KEY, ao_name TEXT NOT NULL, "
+    "ao_score TEXT NOT NULL, aka_name TEXT NOT NULL, aka_score TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS feedback_log (id INTEGER PRIMARY KEY, timestamp TEXT NOT NULL, "
+    "feedback_message TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS game_history (id INTEGER PRIMARY KEY, start_time TEXT NOT NULL, "
+    "end_time TEXT NOT NULL, winner TEXT NOT NULL, ao_score TEXT NOT NULL, aka_score TEXT NOT NULL, "
+    "ao_name TEXT NOT NULL DEFAULT '', aka_name TEXT NOT NULL DEFAULT '')",
+    "CREATE INDEX IF NOT EXISTS idx_history_start ON game_history (start_time)",
+    "CREATE INDEX IF NOT EXISTS idx_history_winner ON game_history (winner COLLATE NOCASE, start_time)",
+    "CREATE INDEX IF NOT EXISTS idx_history_ao ON game_history (ao_name COLLATE NOCASE, start_time)",
+    "CREATE INDEX IF NOT EXISTS idx_history_aka ON game_history (aka_name COLLATE NOCASE, start_time)",
+]
+
+# Statements are kept as constants so sqlite3's statement cache reuses the
+# compiled form on every call.
+INSERT_MEMBER = "INSERT INTO team_members (name, nim) VALUES (?, ?)"
+SELECT_MEMBERS = "SELECT name, nim FROM team_members ORDER BY id"
+REPLACE_SCORE = "INSERT OR REPLACE INTO scoreboard (position, team_name, score, last_updated) VALUES (?, ?, ?, ?)"
+SELECT_SCORES = "SELECT team_name, score, last_updated FROM scoreboard ORDER BY position"
+REPLACE_SETTING = "INSERT OR REPLACE INTO settings (setting_name, value) VALUES (?, ?)"
+SELECT_SETTINGS = "SELECT setting_name, value FROM settings ORDER BY rowid"
+INSERT_SAVED_SCORE = "INSERT INTO saved_scores (ao_name, ao_score, aka_name, aka_score) VALUES (?, ?, ?, ?)"
+INSERT_FEEDBACK = "INSERT INTO feedback_log (timestamp, feedback_message) VALUES (?, ?)"
+INSERT_HISTORY = ("INSERT INTO game_history (start_time, end_time, winner, ao_score, aka_score, ao_name, aka_name) "
+                  "VALUES (?, ?, ?, ?, ?, ?, ?)")
+HISTORY_FIELDS = "start_time, end_time, winner, ao_score, aka_score, ao_name, aka_name"
+SELECT_MIGRATED = "SELECT value FROM meta WHERE key = 'csv_migrated'"
+SELECT_TEAM_NAMES = ("SELECT ao_name FROM game_history WHERE ao_name != '' "
+                     "UNION SELECT aka_name FROM game_history WHERE aka_name != ''")
+
+
+class SQLiteHandler:
+    """Storage backend with the CSVHandler API, kept in one SQLite database in WAL mode"""
+
+    def __init__(self, db_file=None, buffered=False, batch_size=100, flush_interval=0.5, on_error=None):
+        self.data_dir = "data"
+        os.makedirs(self.data_dir, exist_ok=True)
+        self.db_file = db_file or os.path.join(self.data_dir, "pendekar.db")
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False, cached_statements=64)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            for statement in SCHEMA:
+                self._conn.execute(statement)
+
+        self._initialize_tables()
+        self._result_listeners = []
+
+        # Buffered mode inserts from a worker thread, one transaction per batch.
+        self._writer = None
+        if buffered:
+            self._writer = BackgroundWriter(self._insert_rows, batch_size, flush_interval, on_error)
+            atexit.register(self.close)
+
+    def _initialize_tables(self):
+        """Seed the default rows the CSV backend creates with its files"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock, self._conn:
+            if self._conn.execute("SELECT 1 FROM team_members LIMIT 1").fetchone() is None:
+                self._conn.executemany(INSERT_MEMBER, [
+                    ('Elsy Aliffia Sirony Putri', '2417051025'),
+                    ('Kharisma Jaka Harum', '2417051068'),
+                    ('Rheal Iftiqar Rozak', '2417051029'),
+                    ('Yulia Nuritnasari', '2457051008')
+                ])
+            if self._conn.execute("SELECT 1 FROM scoreboard LIMIT 1").fetchone() is None:
+                self._conn.executemany(REPLACE_SCORE, [(0, 'Naruto', 0, now), (1, 'Sasuke', 0, now)])
+            if self._conn.execute("SELECT 1 FROM settings LIMIT 1").fetchone() is None:
+                self._conn.executemany(REPLACE_SETTING, [('theme', 'dark'), ('data_privacy', 'False')])
+
+    def load_team_members(self):
+        """Load team members from the database"""
+        with self._lock:
+            return [(name, nim) for name, nim in self._conn.execute(SELECT_MEMBERS)]
+
+    def load_scoreboard_data(self):
+        """Load scoreboard data from the database"""
+        with self._lock:
+            return {
+                team_name: {'score': int(score), 'last_updated': last_updated}
+                for team_name, score, last_updated in self._conn.execute(SELECT_SCORES)
+            }
+
+    def save_scoreboard_data(self, ao_name, ao_score, aka_name, aka_score):
+        """Save current scoreboard data to the database"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM scoreboard")
+            self._conn.executemany(REPLACE_SCORE, [(0, ao_name, ao_score, now), (1, aka_name, aka_score, now)])
+
+    def load_settings(self):
+        """Load settings from the database"""
+        settings = {}
+        with self._lock:
+            for name, value in self._conn.execute(SELECT_SETTINGS):
+                if value.lower() in ('true', 'false'):
+                    settings[name] = value.lower() == 'true'
+                else:
+                    settings[name] = value
+        return settings
+
+    def save_settings(self, settings):
+        """Save settings to the database"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM settings")
+            self._conn.executemany(REPLACE_SETTING, [(key, str(value)) for key, value in settings.items()])
+
+    def _insert_rows(self, statement, rows):
+        """Run one INSERT statement for rows in a single transaction"""
+        with self._lock, self._conn:
+            self._conn.executemany(statement, rows)
+
+    def _insert(self, statement, row):
+        """Insert a row now, or queue it when running in buffered mode"""
+        if self._writer is None:
+            self._insert_rows(statement, [row])
+            return None
+        return self._writer.submit(statement, row)
+
+    def save_score(self, ao_name, ao_score, aka_name, aka_score):
+        """Record a saved scoreboard result"""
+        return self._insert(INSERT_SAVED_SCORE, (ao_name, str(ao_score), aka_name, str(aka_score)))
+
+    def log_feedback(self, message):
+        """Log feedback message to the database"""
+        return self._insert(INSERT_FEEDBACK, (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), message))
+
+    def add_result_listener(self, callback):
+        """Call callback(record) with every game result written from now on; see notify_when_written"""
+        self._result_listeners.append(callback)
+
+    def log_game_result(self, start_time, end_time, winner, ao_score, aka_score, ao_name='', aka_name=''):
+        """Log game result to the history table"""
+        row = (
+            start_time.strftime('%Y-%m-%d %H:%M:%S'),
+            end_time.strftime('%Y-%m-%d %H:%M:%S'),
+            winner,
+            str(ao_score),
+            str(aka_score),
+            ao_name,
+            aka_name
+        )
+        future = self._insert(INSERT_HISTORY, row)
+        notify_when_written(self._result_listeners, future, dict(zip(HISTORY_FIELDS.split(", "), row)))
+        return future
+
+    def get_game_history(self):
+        """Get all game history records"""
+        return list(self.query_game_history())
+
+    def _history_filter(self, start, end, winner, team):
+        clauses = []
+        params = []
+        start = time_key(start)
+        end = time_key(end, end=True)
+        if start is not None:
+            clauses.append("start_time >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("start_time <= ?")
+            params.append(end)
+        if winner is not None:
+            clauses.append("winner = ? COLLATE NOCASE")
+            params.append(winner)
+        if team is not None:
+            clauses.append("(ao_name = ? COLLATE NOCASE OR aka_name = ? COLLATE NOCASE)")
+            params.extend([team, team])
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        return where, params
+
+    def query_game_history(self, start=None, end=None, winner=None, team=None, limit=None, offset=0,
+                           newest_first=False):
+        """Stream game history records matching the filters, one page at a time"""
+        self.flush()
+        where, params = self._history_filter(start, end, winner, team)
+        order = "DESC" if newest_first else "ASC"
+        sql = (f"SELECT {HISTORY_FIELDS} FROM game_history{where} "
+               f"ORDER BY start_time {order}, id {order} LIMIT ? OFFSET ?")
+        params.extend([-1 if limit is None else limit, offset])
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        columns = HISTORY_FIELDS.split(", ")
+        return (dict(zip(columns, row)) for row in rows)
+
+    def count_game_history(self, start=None, end=None, winner=None, team=None):
+        """Count game history records matching the filters"""
+        self.flush()
+        where, params = self._history_filter(start, end, winner, team)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM game_history{where}", params).fetchone()[0]
+
+    def team_names(self):
+        """Distinct team names from game history"""
+        self.flush()
+        with self._lock:
+            return [name for name, in self._conn.execute(SELECT_TEAM_NAMES)]
+
+    def history_cursor(self):
+        """Position just past the last game history row, for history_since"""
+        self.flush()
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM game_history").fetchone()[0]
+
+    def history_since(self, cursor):
+        """Yield game history records written after a history_cursor() position"""
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {HISTORY_FIELDS} FROM game_history WHERE id > ? ORDER BY id", (cursor,)
+            ).fetchall()
+        columns = HISTORY_FIELDS.split(", ")
+        return (dict(zip(columns, row)) for row in rows)
+
+    def flush(self):
+        """Wait for queued rows to be committed; raises the first write error"""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        """Commit queued rows, stop the background writer and close the database connection"""
+        try:
+            if self._writer is not None:
+                self._writer.close()
+                self.flush()
+        finally:
+            with self._lock:
+                self._conn.close()
+
+    def csv_migrated(self):
+        """True once migrate_from_csv has imported the CSV files"""
+        with self._lock:
+            return self._conn.execute(SELECT_MIGRATED).fetchone() is not None
+
+    def migrate_from_csv(self, csv_handler, force=False):
+        """Import the data/*.csv files of a CSVHandler once; returns False if already done"""
+        with self._lock:
+            if self.csv_migrated() and not force:
+                return False
+
+            csv_handler.flush()
+            members = csv_handler.load_team_members()
+            scoreboard = csv_handler.load_scoreboard_data()
+            settings = csv_handler.load_settings()
+            feedback = [(row['timestamp'], row['feedback_message']) for row in csv_handler.feedback_log.iter_records()]
+            saved_scores = [row[:4] for row in csv_handler.score_log.iter_records() if len(row) >= 4]
+
+            with self._conn:
+                for table in ("team_members", "scoreboard", "settings", "feedback_log", "saved_scores", "game_history"):
+                    self._conn.execute(f"DELETE FROM {table}")
+                self._conn.executemany(INSERT_MEMBER, members)
+                self._conn.executemany(REPLACE_SCORE, [
+                    (position, name, data['score'], data['last_updated'])
+                    for position, (name, data) in enumerate(scoreboard.items())
+                ])
+                self._conn.executemany(REPLACE_SETTING, [(key, str(value)) for key, value in settings.items()])
+                self._conn.executemany(INSERT_FEEDBACK, feedback)
+                self._conn.executemany(INSERT_SAVED_SCORE, saved_scores)
+                self._conn.executemany(INSERT_HISTORY, (
+                    (row['start_time'], row['end_time'], row['winner'], row['ao_score'], row['aka_score'],
+                     row['ao_name'], row['aka_name'])
+                    for row in csv_handler.query_game_history()
+                ))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('csv_migrated', ?)",
+                    (datetime.now().strftime('%Y-%m-%d %H:%M:%S'),)
+                )
+        return True
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] not in (["migrate"], ["migrate", "--force"]):
+        sys.exit("usage: python sqlite_backend.py migrate [--force]")
+    from backend import CSVHandler
+
+    handler = SQLiteHandler()
+    if handler.migrate_from_csv(CSVHandler(rotate=False), force="--force" in sys.argv):
+        print(f"Imported data/*.csv into {handler.db_file}")
+    else:
+        print(f"{handler.db_file} was already migrated; use --force to import again")
+    handler.close()
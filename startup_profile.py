@@ -0,0 +1,98 @@
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PROFILE_ENV = "PENDEKAR_PROFILE_STARTUP"
+PROFILE_FLAG = "--profile-startup"
+DEFAULT_REPORT = "startup_profile.json"
+
+
+class StartupProfiler:
+    """Collects wall-clock spans and marks during startup and writes them as JSON.
+
+    Every method is a cheap no-op until ``enable`` is called, so the
+    instrumentation can stay in place in normal runs.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.enabled = False
+        self.report_path = DEFAULT_REPORT
+        self.spans = []
+        self.marks = {}
+        self._lock = threading.Lock()
+
+    def configure(self, argv=None, environ=None):
+        """Enable profiling from --profile-startup[=PATH] or $PENDEKAR_PROFILE_STARTUP."""
+        argv = sys.argv[1:] if argv is None else argv
+        environ = os.environ if environ is None else environ
+        for arg in argv:
+            if arg == PROFILE_FLAG:
+                self.enable()
+            elif arg.startswith(PROFILE_FLAG + "="):
+                self.enable(arg.split("=", 1)[1])
+        value = environ.get(PROFILE_ENV)
+        if value and not self.enabled:
+            self.enable(DEFAULT_REPORT if value in ("1", "true", "yes") else value)
+        return self.enabled
+
+    def enable(self, report_path=DEFAULT_REPORT):
+        self.enabled = True
+        self.report_path = report_path
+
+    def elapsed(self):
+        return time.perf_counter() - self.origin
+
+    @contextmanager
+    def span(self, name):
+        """Time the body of a with-block."""
+        if not self.enabled:
+            yield
+            return
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, began, time.perf_counter() - began)
+
+    def record(self, name, began, duration):
+        """Add a span measured elsewhere; safe to call from worker threads."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.spans.append({
+                "name": name,
+                "start_ms": round((began - self.origin) * 1000, 3),
+                "duration_ms": round(duration * 1000, 3),
+                "thread": threading.current_thread().name,
+            })
+
+    def mark(self, name):
+        """Record the time since startup under name (first occurrence wins)."""
+        if self.enabled:
+            with self._lock:
+                self.marks.setdefault(name, round(self.elapsed() * 1000, 3))
+
+    def write_report(self, extra=None):
+        if not self.enabled:
+            return None
+        with self._lock:
+            report = {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "written_at_ms": round(self.elapsed() * 1000, 3),
+                "marks": dict(self.marks),
+                "spans": sorted(self.spans, key=lambda span: span["start_ms"]),
+            }
+        if extra:
+            report.update(extra)
+        with open(self.report_path, "w") as file:
+            json.dump(report, file, indent=2)
+        return self.report_path
+
+
+PROFILER = StartupProfiler()
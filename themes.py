@@ -0,0 +1,253 @@
+"""Shared color themes compiled into ttk styles.
+
+Every page takes its colors from one palette per theme. ThemeRegistry
+turns a palette into a short list of ``style.configure`` calls on a few
+color-bearing styles. Widget styles are named ``<Role>.<Group>.TLabel`` and
+so on, which makes ttk fall back to ``<Group>.TLabel`` for the colors while
+fonts and padding stay on the role style. Switching themes, or drawing
+one frame of a fade, therefore updates about twenty styles however many
+widgets use them. Plain tk widgets created later (Toplevels, Listboxes,
+Canvases) get their colors from option-database entries.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+from animation import ease_in_out, interpolate_color
+
+DEFAULT_THEME = "dark"
+FADE_SECONDS = 0.5
+
+PALETTES = {
+    "dark": {
+        "bg": "#0f1626",
+        "fg": "#00ffcc",
+        "desc_fg": "#00ffcc",
+        "title_outline": "#003333",
+        "btn_bg": "#00ffcc",
+        "btn_fg": "#0f1626",
+        "btn_active_bg": "#00cca3",
+        "member_bg": "#004f4f",
+        "member_fg": "#40e0d0",
+        "member_desc_fg": "#a0f0f0",
+        "panel_bg": "#121212",
+        "panel_btn_fg": "#121212",
+        "ao_bg": "#004080",
+        "aka_bg": "#800000",
+        "timer_bg": "#000000",
+        "timer_fg": "#32cd32",
+        "tile_bg": "#1f2937",
+    },
+    "light": {
+        "bg": "#ffffff",
+        "fg": "#2563eb",
+        "desc_fg": "#6b7280",
+        "title_outline": "#a3bffa",
+        "btn_bg": "#2563eb",
+        "btn_fg": "#ffffff",
+        "btn_active_bg": "#1e40af",
+        "member_bg": "#e0e7ff",
+        "member_fg": "#1e3a8a",
+        "member_desc_fg": "#4b5563",
+        "panel_bg": "#f9f9f9",
+        "panel_btn_fg": "#ffffff",
+        "ao_bg": "#93c5fd",
+        "aka_bg": "#fecaca",
+        "timer_bg": "#ffffff",
+        "timer_fg": "#166534",
+        "tile_bg": "#e0e7ff",
+    },
+}
+
+# Styles that carry colors: option -> palette key. These are the only styles
+# touched when the theme changes.
+COLOR_STYLES = {
+    "TFrame": {"background": "bg"},
+    "TLabel": {"background": "bg", "foreground": "fg"},
+    "Desc.TLabel": {"foreground": "desc_fg"},
+    "TButton": {"background": "btn_bg", "foreground": "btn_fg"},
+    "TCheckbutton": {"background": "bg", "foreground": "fg", "indicatorbackground": "bg"},
+    "Back.TButton": {"background": "member_fg", "foreground": "bg"},
+    "Member.TFrame": {"background": "member_bg"},
+    "Member.TLabel": {"background": "member_bg", "foreground": "member_fg"},
+    "Desc.Member.TLabel": {"foreground": "member_desc_fg"},
+    "Member.TButton": {"background": "member_bg", "foreground": "fg"},
+    "Member.Horizontal.TScrollbar": {"troughcolor": "member_fg", "background": "member_bg"},
+    "Panel.TFrame": {"background": "panel_bg"},
+    "Panel.TLabel": {"background": "panel_bg", "foreground": "fg"},
+    "Panel.TButton": {"background": "btn_bg", "foreground": "panel_btn_fg"},
+    "AO.TFrame": {"background": "ao_bg"},
+    "AO.TLabel": {"background": "ao_bg"},
+    "AKA.TFrame": {"background": "aka_bg"},
+    "AKA.TLabel": {"background": "aka_bg"},
+    "Timer.TLabel": {"background": "timer_bg", "foreground": "timer_fg"},
+    "Tile.TFrame": {"background": "tile_bg"},
+    "Tile.TLabel": {"background": "tile_bg", "foreground": "fg"},
+    "Clock.Tile.TLabel": {"foreground": "timer_fg"},
+    "Treeview": {"background": "panel_bg", "fieldbackground": "panel_bg", "foreground": "fg"},
+    "Treeview.Heading": {"background": "btn_bg", "foreground": "panel_btn_fg"},
+}
+
+# Hover and press colors: option -> [(state, palette key)].
+STATE_COLORS = {
+    "TButton": {"background": [("pressed", "btn_active_bg"), ("active", "btn_active_bg")]},
+    "Back.TButton": {"background": [("active", "member_fg")]},
+    "Member.TButton": {"background": [("pressed", "btn_active_bg"), ("active", "btn_active_bg")]},
+    "Panel.TButton": {"background": [("pressed", "btn_active_bg"), ("active", "btn_active_bg")]},
+}
+
+# Fonts, padding and borders; configured once.
+LAYOUT_STYLES = {
+    "TButton": {"font": ("Poppins", 12, "bold"), "padding": (25, 6), "relief": "ridge", "borderwidth": 1},
+    "Start.TButton": {"font": ("Poppins", 24, "bold"), "padding": (70, 18), "borderwidth": 2},
+    "Bounce.Start.TButton": {"font": ("Poppins", 26, "bold")},
+    "Settings.TButton": {"font": ("Poppins", 14, "bold"), "padding": (30, 10), "borderwidth": 2},
+    "Close.TButton": {"font": ("Poppins", 12), "padding": (20, 6)},
+    "TCheckbutton": {"font": ("Poppins", 12)},
+    "Desc.TLabel": {"font": ("Segoe UI", 24, "bold italic")},
+    "Feedback.TLabel": {"font": ("Poppins", 18, "italic")},
+    "Credit.TLabel": {"font": ("Poppins", 12, "bold")},
+    "Heading.TLabel": {"font": ("Poppins", 24, "bold")},
+    "Image.TLabel": {"borderwidth": 0, "padding": 0},
+    "Title.TLabel": {"font": ("Poppins", 38, "bold underline"), "padding": (0, 20)},
+    "Back.TButton": {"font": ("Poppins", 22, "bold"), "padding": (40, 14), "borderwidth": 3},
+    "Name.Member.TLabel": {"font": ("Poppins", 16, "bold")},
+    "Desc.Member.TLabel": {"font": ("Poppins", 13, "italic")},
+    "Panel.TButton": {"font": ("Poppins", 12, "bold"), "padding": (18, 6), "borderwidth": 2},
+    "Score.Panel.TButton": {"font": ("Poppins", 14, "bold"), "padding": (30, 10), "relief": "raised"},
+    "Action.Panel.TButton": {"font": ("Poppins", 14, "bold"), "padding": (35, 12)},
+    "Title.Panel.TLabel": {"font": ("Poppins", 28, "bold")},
+    "Heading.Panel.TLabel": {"font": ("Poppins", 26, "bold")},
+    "Detail.Panel.TLabel": {"font": ("Poppins", 24, "bold")},
+    "Field.Panel.TLabel": {"font": ("Poppins", 16, "bold")},
+    "Status.Panel.TLabel": {"font": ("Poppins", 11)},
+    "Score.AO.TLabel": {"font": ("Poppins", 48, "bold"), "foreground": "white", "anchor": "center"},
+    "Score.AKA.TLabel": {"font": ("Poppins", 48, "bold"), "foreground": "white", "anchor": "center"},
+    "Timer.TLabel": {
+        "font": ("Poppins", 36, "bold"), "relief": "sunken", "borderwidth": 4, "padding": (20, 10), "anchor": "center",
+    },
+    "Title.Tile.TLabel": {"font": ("Poppins", 12, "bold")},
+    "Names.Tile.TLabel": {"font": ("Poppins", 10)},
+    "Score.Tile.TLabel": {"font": ("Poppins", 24, "bold"), "foreground": "white"},
+    "Clock.Tile.TLabel": {"font": ("Poppins", 14, "bold")},
+    "Treeview.Heading": {"font": ("Poppins", 11, "bold")},
+}
+
+# Option-database patterns for plain tk widgets: pattern -> palette key.
+OPTION_COLORS = {
+    "*Toplevel.background": "bg",
+    "*Canvas.background": "bg",
+    "*Listbox.background": "panel_bg",
+    "*Listbox.foreground": "fg",
+    "*Listbox.selectBackground": "btn_bg",
+    "*Listbox.selectForeground": "panel_btn_fg",
+}
+
+
+def compile_palette(palette):
+    """Turn a palette into (style, colors) pairs ready for style.configure."""
+    return [
+        (style, {option: palette[key] for option, key in options.items()})
+        for style, options in COLOR_STYLES.items()
+    ]
+
+
+def blend_palettes(start, end, t):
+    return {key: interpolate_color(start.get(key, end[key]), end[key], t) for key in end}
+
+
+class ThemeRegistry:
+    """The app's active theme, applied to every page through shared ttk styles.
+
+    Listeners are called as ``listener(palette, final)`` for the canvases and
+    other items ttk styles cannot reach; final is False for fade frames.
+    """
+
+    def __init__(self, root, animator, name=DEFAULT_THEME):
+        self.root = root
+        self.animator = animator
+        self.style = ttk.Style(root)
+        # clam honors background colors on every platform; the native themes do not.
+        self.style.theme_use("clam")
+        for style, options in LAYOUT_STYLES.items():
+            self.style.configure(style, **options)
+        self.palettes = {theme: dict(palette) for theme, palette in PALETTES.items()}
+        self.compiled = {theme: compile_palette(palette) for theme, palette in self.palettes.items()}
+        self.listeners = []
+        self.name = name if name in PALETTES else DEFAULT_THEME
+        self.palette = self.palettes[self.name]
+        self._fade = None
+        self.apply(self.name)
+
+    def __getitem__(self, key):
+        """Current color for a palette key."""
+        return self.palette[key]
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+        listener(self.palette, True)
+
+    def add_colors(self, colors):
+        """Add colors for items outside ttk, as {theme: {key: color}}; they fade with the theme."""
+        for name, extra in colors.items():
+            self.palettes[name].update(extra)
+        self.palette = dict(self.palette)
+        self.palette.update(colors.get(self.name, {}))
+
+    def apply(self, name):
+        """Switch to a theme at once."""
+        self.animator.cancel((self, "fade"))
+        self._fade = None
+        self.name = name
+        self.palette = self.palettes[name]
+        self._configure(self.compiled[name])
+        for style, options in STATE_COLORS.items():
+            self.style.map(style, **{
+                option: [(state, self.palette[key]) for state, key in states]
+                for option, states in options.items()
+            })
+        for pattern, key in OPTION_COLORS.items():
+            self.root.option_add(pattern, self.palette[key])
+        self._notify(True)
+
+    def fade(self, name, duration=FADE_SECONDS, easing=ease_in_out):
+        """Crossfade to a theme, one blended palette per animator frame."""
+        if not self.animator.animations_enabled:
+            self.apply(name)
+            return
+        self.name = name
+        self._fade = (dict(self.palette), self.palettes[name], self.animator.now(), duration, easing)
+        self.animator.request_frame(self._fade_frame, key=(self, "fade"))
+
+    def toggle(self, fade=True):
+        name = "light" if self.name == "dark" else "dark"
+        if fade:
+            self.fade(name)
+        else:
+            self.apply(name)
+        return name
+
+    def _fade_frame(self):
+        if self._fade is None:
+            return
+        start, end, began, duration, easing = self._fade
+        t = 1.0 if duration <= 0 else min(1.0, (self.animator.now() - began) / duration)
+        if t >= 1.0:
+            self.apply(self.name)
+            return
+        self.palette = blend_palettes(start, end, easing(t))
+        self._configure(compile_palette(self.palette))
+        self._notify(False)
+        self.animator.request_frame(self._fade_frame, key=(self, "fade"))
+
+    def _configure(self, compiled):
+        # ttk redraws its widgets once per idle pass, however many styles changed.
+        for style, colors in compiled:
+            self.style.configure(style, **colors)
+
+    def _notify(self, final):
+        for listener in self.listeners:
+            try:
+                listener(self.palette, final)
+            except tk.TclError:
+                # The listener's widget was destroyed.
+                pass
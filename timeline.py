@@ -0,0 +1,132 @@
+"""Score timelines: every scoring event of a match as (offset, side, delta).
+
+    python timeline.py MATCH_ID [SECONDS ...]
+
+Events are kept in three parallel typed arrays (7 bytes per event) instead
+of a list of objects. Every CHECKPOINT_EVENTS events the running totals are
+stored as a checkpoint, so the score at any instant is a binary search for
+the event count plus at most CHECKPOINT_EVENTS additions, however long the
+match ran. Live matches record into a Timeline as they are scored; past
+matches can be rebuilt from the score event log.
+"""
+from array import array
+import bisect
+import sys
+
+from event_log import BEGIN, EVENT_LOG_FILE, SCORE, iter_events
+
+SIDES = ("ao", "aka")
+CHECKPOINT_EVENTS = 32
+
+
+class Timeline:
+    """Append-only score history of one match with cumulative checkpoints."""
+
+    def __init__(self, ao_score=0, aka_score=0):
+        self.base = (ao_score, aka_score)
+        self.offsets = array("I")  # match clock milliseconds, non-decreasing
+        self.sides = array("b")  # index into SIDES
+        self.deltas = array("h")
+        # Scores before event i * CHECKPOINT_EVENTS.
+        self.ao_checkpoints = array("l", [ao_score])
+        self.aka_checkpoints = array("l", [aka_score])
+        self.ao_score = ao_score
+        self.aka_score = aka_score
+
+    def __len__(self):
+        return len(self.offsets)
+
+    @property
+    def nbytes(self):
+        return sum(
+            len(column) * column.itemsize
+            for column in (self.offsets, self.sides, self.deltas, self.ao_checkpoints, self.aka_checkpoints)
+        )
+
+    @property
+    def duration(self):
+        """Seconds from the start to the last event."""
+        return self.offsets[-1] / 1000 if self.offsets else 0.0
+
+    def record(self, side, delta, offset):
+        """Append one score change; offset is the match clock in seconds, as MatchClock.elapsed() shows it."""
+        ms = round(offset * 1000)
+        if self.offsets and ms < self.offsets[-1]:
+            ms = self.offsets[-1]
+        count = len(self.offsets)
+        if count and count % CHECKPOINT_EVENTS == 0:
+            self.ao_checkpoints.append(self.ao_score)
+            self.aka_checkpoints.append(self.aka_score)
+        self.offsets.append(ms)
+        self.sides.append(SIDES.index(side))
+        self.deltas.append(delta)
+        if side == "ao":
+            self.ao_score += delta
+        else:
+            self.aka_score += delta
+
+    def count_at(self, seconds):
+        """Number of events at or before seconds."""
+        # round, not int: event() hands back ms / 1000, which does not always multiply back exactly.
+        return bisect.bisect_right(self.offsets, round(seconds * 1000))
+
+    def score_at(self, seconds):
+        """(ao_score, aka_score, events) as they stood at seconds into the match."""
+        count = self.count_at(seconds)
+        # The checkpoint after the last full block is only written with the next event.
+        checkpoint = min(count // CHECKPOINT_EVENTS, len(self.ao_checkpoints) - 1)
+        scores = [self.ao_checkpoints[checkpoint], self.aka_checkpoints[checkpoint]]
+        sides, deltas = self.sides, self.deltas
+        for i in range(checkpoint * CHECKPOINT_EVENTS, count):
+            scores[sides[i]] += deltas[i]
+        return scores[0], scores[1], count
+
+    def event(self, index):
+        """(offset seconds, side, delta) of one event."""
+        return self.offsets[index] / 1000, SIDES[self.sides[index]], self.deltas[index]
+
+    @classmethod
+    def from_event_log(cls, match_id, path=EVENT_LOG_FILE):
+        """Rebuild a finished match's timeline from the score event log, or None if it is not there.
+
+        Score events carry the match clock. Lines from older versions do
+        not, so their offsets are wall-clock time since the begin event.
+        """
+        timeline = None
+        started = 0
+        for timestamp, event_match, kind, fields in iter_events(path):
+            if event_match != match_id:
+                continue
+            if kind == BEGIN:
+                timeline = cls(int(fields[1]), int(fields[3]))
+                started = timestamp
+            elif kind == SCORE and timeline is not None:
+                elapsed = int(fields[2]) if len(fields) > 2 else timestamp - started
+                timeline.record(fields[0], int(fields[1]), elapsed / 1000)
+        return timeline
+
+
+def format_offset(seconds):
+    """Format seconds as M:SS.t."""
+    tenths = round(seconds * 10)
+    return f"{tenths // 600}:{tenths % 600 / 10:04.1f}"
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("usage: python timeline.py MATCH_ID [SECONDS ...]")
+        return 2
+    timeline = Timeline.from_event_log(argv[0])
+    if timeline is None:
+        print(f"match {argv[0]} is not in {EVENT_LOG_FILE}")
+        return 1
+    print(f"{len(timeline)} events over {format_offset(timeline.duration)}, {timeline.nbytes} bytes")
+    for value in argv[1:] or [timeline.duration]:
+        ao_score, aka_score, count = timeline.score_at(float(value))
+        print(f"{format_offset(float(value))}  AO {ao_score:>3}  AKA {aka_score:>3}  after {count} events")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+import tkinter as tk
+from tkinter import ttk
+
+from autocomplete import SuggestionBox
+from broadcast import match_fields
+from match import Match
+from match_clock import DEFAULT_MATCH_DURATION, MATCH_DURATIONS, format_duration
+
+DEFAULT_MAT_COUNT = 8
+MAX_MAT_COUNT = 16
+GRID_COLUMNS = 4
+
+# One shared tick refreshes every mat's clock; per-mat work is a text compare.
+TICK_SECONDS = 0.1
+
+
+class MatTile(ttk.Frame):
+    """Compact grid cell showing one mat's names, score and clock.
+
+    A mat gets its Match, and with it an event-log entry, only when it is
+    first opened; until then the tile shows an empty match.
+    """
+
+    def __init__(self, master, label, on_select):
+        super().__init__(master, style="Tile.TFrame", borderwidth=2, relief="ridge", padding=(10, 8), cursor="hand2")
+        self.label = label
+        self.match = None
+        self._shown = None
+
+        self.title_label = ttk.Label(self, text=label, style="Title.Tile.TLabel")
+        self.title_label.pack()
+        self.names_label = ttk.Label(self, style="Names.Tile.TLabel")
+        self.names_label.pack()
+        self.score_label = ttk.Label(self, style="Score.Tile.TLabel")
+        self.score_label.pack()
+        self.clock_label = ttk.Label(self, style="Clock.Tile.TLabel")
+        self.clock_label.pack()
+
+        for widget in (self, self.title_label, self.names_label, self.score_label, self.clock_label):
+            widget.bind("<Button-1>", lambda e: on_select(self))
+        self.refresh()
+
+    def refresh(self):
+        """Update the labels only when something visible changed."""
+        match = self.match
+        if match is None:
+            shown = ("AO", "AKA", 0, 0, format_duration(DEFAULT_MATCH_DURATION))
+        else:
+            shown = (match.ao_name, match.aka_name, match.ao_score, match.aka_score, match.clock.display())
+        if shown == self._shown:
+            return
+        self._shown = shown
+        self.names_label.config(text=f"{shown[0]} vs {shown[1]}")
+        self.score_label.config(text=f"{shown[2]} - {shown[3]}")
+        self.clock_label.config(text=shown[4])
+
+
+class TournamentPage(ttk.Frame):
+    """Multi-mat mode: N independent matches driven by one scheduler tick."""
+
+    def __init__(self, master, controller):
+        super().__init__(master, style="Panel.TFrame")
+        self.controller = controller
+
+        mat_count = self._configured_mat_count()
+        self.selected = None
+        self._running = set()  # matches whose clock ran at the last tick
+
+        header = ttk.Frame(self, style="Panel.TFrame")
+        header.pack(fill="x", padx=20, pady=(15, 5))
+        ttk.Label(header, text="Tournament", style="Heading.Panel.TLabel").pack(side="left")
+        self._create_button(header, "Back", lambda: controller.show_frame("ScoreboardApp")).pack(side="right")
+
+        self.grid_frame = ttk.Frame(self, style="Panel.TFrame")
+        self.grid_frame.pack(expand=True, fill="both", padx=20, pady=10)
+        self.tiles = []
+        for i in range(mat_count):
+            tile = MatTile(self.grid_frame, f"Mat {i + 1}", self.open_mat)
+            tile.grid(row=i // GRID_COLUMNS, column=i % GRID_COLUMNS, padx=8, pady=8, sticky="nsew")
+            self.tiles.append(tile)
+        for column in range(GRID_COLUMNS):
+            self.grid_frame.grid_columnconfigure(column, weight=1)
+
+        self._create_detail_view()
+
+    def _configured_mat_count(self):
+        try:
+            value = int(self.controller.storage.load_settings().get("mat_count", DEFAULT_MAT_COUNT))
+        except (OSError, ValueError):
+            value = DEFAULT_MAT_COUNT
+        return max(1, min(MAX_MAT_COUNT, value))
+
+    def _create_button(self, parent, text, command):
+        # No focus: Space is the clock hotkey and would also invoke a focused button.
+        return ttk.Button(parent, text=text, style="Panel.TButton", cursor="hand2", command=command, takefocus=False)
+
+    def _create_detail_view(self):
+        """One set of detail widgets, rebound to whichever mat is selected."""
+        self.detail_frame = ttk.Frame(self, style="Panel.TFrame", padding=(20, 10))
+
+        self.detail_title = ttk.Label(self.detail_frame, style="Detail.Panel.TLabel")
+        self.detail_title.grid(row=0, column=0, columnspan=4, pady=(0, 10))
+
+        self.name_vars = {}
+        self.score_labels = {}
+        self.suggestions = []
+        for column, side in ((0, "ao"), (2, "aka")):
+            self.name_vars[side] = tk.StringVar()
+            entry = ttk.Entry(self.detail_frame, textvariable=self.name_vars[side], font=("Poppins", 14))
+            entry.grid(row=1, column=column, columnspan=2, padx=10, sticky="ew")
+            entry.bind("<FocusOut>", lambda e: self._store_names())
+            entry.bind("<Return>", lambda e: self._store_names())
+            self.suggestions.append(
+                SuggestionBox(entry, self.controller.get_name_index(), self.controller.animator, on_pick=self._store_names)
+            )
+
+            side_style = side.upper() + ".TFrame"
+            panel = ttk.Frame(self.detail_frame, style=side_style, padding=(20, 15), borderwidth=2, relief="ridge")
+            panel.grid(row=2, column=column, columnspan=2, padx=10, pady=10, sticky="nsew")
+            self.score_labels[side] = ttk.Label(panel, text="0", style=f"Score.{side.upper()}.TLabel")
+            self.score_labels[side].pack(pady=(0, 10))
+            buttons = ttk.Frame(panel, style=side_style)
+            buttons.pack()
+            self._create_button(buttons, "+1", lambda s=side: self.score(s, 1)).pack(side="left", padx=6)
+            self._create_button(buttons, "-1", lambda s=side: self.score(s, -1)).pack(side="left", padx=6)
+
+        for column in range(4):
+            self.detail_frame.grid_columnconfigure(column, weight=1)
+
+        self.detail_clock = ttk.Label(self.detail_frame, style="Timer.TLabel")
+        self.detail_clock.grid(row=3, column=0, columnspan=4, pady=10, sticky="ew")
+
+        controls = ttk.Frame(self.detail_frame, style="Panel.TFrame")
+        controls.grid(row=4, column=0, columnspan=4, pady=10)
+        self.duration_var = tk.StringVar(value=format_duration(DEFAULT_MATCH_DURATION))
+        duration_box = ttk.Combobox(
+            controls, textvariable=self.duration_var, state="readonly", width=6, font=("Poppins", 12, "bold"),
+            values=[format_duration(seconds) for seconds in MATCH_DURATIONS],
+        )
+        duration_box.pack(side="left", padx=8)
+        duration_box.bind("<<ComboboxSelected>>", lambda e: self.reset_clock())
+        for text, command in (
+            ("Start", self.start_clock),
+            ("Stop", self.stop_clock),
+            ("Reset", self.reset_clock),
+            ("Finish", self.finish_match),
+            ("Replay", self.show_replay),
+            ("All Mats", self.show_grid),
+        ):
+            self._create_button(controls, text, command).pack(side="left", padx=8)
+
+    def open_mat(self, tile):
+        """Show a mat in the detail view, starting its match on first use."""
+        if tile.match is None:
+            tile.match = Match(self.controller.event_log, "AO", "AKA", DEFAULT_MATCH_DURATION, label=tile.label)
+        self.show_detail(tile.match)
+
+    def show_detail(self, match):
+        self.selected = match
+        self.name_vars["ao"].set(match.ao_name)
+        self.name_vars["aka"].set(match.aka_name)
+        self.duration_var.set(format_duration(match.clock.duration))
+        self.grid_frame.pack_forget()
+        self.detail_frame.pack(expand=True, fill="both")
+        self.refresh_detail()
+
+    def show_grid(self):
+        self._store_names()
+        self.selected = None
+        self.detail_frame.pack_forget()
+        self.grid_frame.pack(expand=True, fill="both", padx=20, pady=10)
+        for tile in self.tiles:
+            tile.refresh()
+
+    def _store_names(self):
+        if self.selected is not None:
+            self.selected.ao_name = self.name_vars["ao"].get()
+            self.selected.aka_name = self.name_vars["aka"].get()
+
+    def publish(self, match):
+        """Push one mat's state to live display clients under a matN_ prefix."""
+        prefix = match.label.lower().replace(" ", "") + "_"
+        self.controller.publish(**match_fields(match, prefix))
+
+    def refresh_detail(self):
+        match = self.selected
+        if match is None:
+            return
+        animator = self.controller.animator
+        animator.set(self.detail_title, text=match.label)
+        animator.set(self.score_labels["ao"], text=str(match.ao_score))
+        animator.set(self.score_labels["aka"], text=str(match.aka_score))
+        animator.set(self.detail_clock, text=match.clock.display())
+        self.publish(match)
+
+    def score(self, side, delta):
+        if self.selected is not None and self.selected.score(side, delta):
+            self.controller.animator.request_frame(self.refresh_detail, key=(self, "detail"))
+
+    def handle_hotkey(self, action):
+        """Scoreboard hotkeys act on the mat open in the detail view."""
+        if action in ("add_ao", "sub_ao", "add_aka", "sub_aka"):
+            side = action.split("_")[1]
+            self.score(side, 1 if action.startswith("add") else -1)
+        elif action == "toggle_timer" and self.selected is not None:
+            if self.selected.clock.running:
+                self.stop_clock()
+            else:
+                self.start_clock()
+        elif action == "reset_timer":
+            self.reset_clock()
+
+    def start_clock(self):
+        if self.selected is not None and self.selected.clock.start():
+            self._schedule_tick()
+
+    def stop_clock(self):
+        if self.selected is not None:
+            self.selected.clock.pause()
+            self.refresh_detail()
+
+    def reset_clock(self):
+        if self.selected is not None:
+            self._store_names()
+            minutes, seconds = self.duration_var.get().split(":")
+            self.selected.reset(int(minutes) * 60 + int(seconds))
+            self.refresh_detail()
+
+    def finish_match(self):
+        """Log the selected mat's result to the game history, once per match; Reset starts the next one."""
+        if self.selected is None:
+            return
+        self._store_names()
+        match = self.selected
+        match.clock.pause()
+        self.refresh_detail()
+        if not match.finish():
+            self.controller.toast(f"{match.label}: match ini sudah selesai")
+            return
+        self._log_result(match)
+
+    def _log_result(self, match):
+        future = self.controller.storage.log_game_result(
+            *match.times(), match.winner, match.ao_score, match.aka_score, match.ao_name, match.aka_name,
+        )
+        self.controller.watch_writes(
+            [future], f"{match.label}: hasil match disimpan", f"{match.label}: gagal menyimpan hasil match",
+            on_error=lambda error: setattr(match, "finished", False),
+        )
+
+    def show_replay(self):
+        if self.selected is not None:
+            self._store_names()
+            match = self.selected
+            self.controller.show_replay(match.timeline, f"{match.label}: {match.ao_name} vs {match.aka_name}")
+
+    def _schedule_tick(self):
+        animator = self.controller.animator
+        if not animator.is_active((self, "tick")):
+            animator.call_later(TICK_SECONDS, self._tick, key=(self, "tick"))
+
+    def _tick(self):
+        """Shared tick for every mat clock; reschedules itself while any clock runs."""
+        running = set()
+        for tile in self.tiles:
+            match = tile.match
+            if match is None:
+                continue
+            if match.clock.running:
+                running.add(match)
+            elif match in self._running and match.clock.expired():
+                self.time_up(tile)
+            if self.selected is None:
+                tile.refresh()
+            self.publish(match)
+        self._running = running
+        if self.selected is not None:
+            self.refresh_detail()
+        if running:
+            self._schedule_tick()
+
+    def _flash(self, label, color_key):
+        animator = self.controller.animator
+        animator.tween(
+            label, "background", self.controller.theme[color_key], 1.5, start="#b91c1c",
+            on_done=lambda: animator.set(label, background=""),
+        )
+
+    def time_up(self, tile):
+        """A mat's clock ran out: flash its clock and log the result like Finish does."""
+        match = tile.match
+        self._flash(tile.clock_label, "tile_bg")
+        if match is self.selected:
+            self._flash(self.detail_clock, "timer_bg")
+        self.controller.toast(f"{match.label}: waktu habis")
+        if match is self.selected:
+            self._store_names()
+        if match.finish():
+            self._log_result(match)